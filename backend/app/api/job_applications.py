@@ -1,14 +1,19 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # File: backend/app/api/job_applications.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import date
 
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.domain.errors import InvalidCursor
+from app.models.job_application import JobApplicationStatus
 from app.schemas.job_application import (
     JobApplicationCreate,
     JobApplicationRead,
     JobApplicationReadWithOffer,
     JobApplicationUpdate,
 )
+from app.schemas.pagination import MAX_PAGE_LIMIT, CursorPage
 from app.services.job_application import (
     JobApplicationService,
     get_job_application_service,
@@ -25,11 +30,53 @@ async def create_job_application(
     return await service.create_application(data)
 
 
-@router.get("", response_model=list[JobApplicationReadWithOffer])
+@router.get(
+    "",
+    response_model=list[JobApplicationReadWithOffer]
+    | CursorPage[JobApplicationReadWithOffer],
+)
 async def list_job_applications(
+    application_status: JobApplicationStatus | None = Query(None, alias="status"),
+    applied_from: date | None = None,
+    applied_to: date | None = None,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_LIMIT),
+    offset: int = Query(0, ge=0),
+    cursor: str | None = None,
     service: JobApplicationService = Depends(get_job_application_service),
 ):
-    return await service.list_applications()
+    """
+    List Job Applications with their Job Posting, most recent first.
+
+    `applied_from` and `applied_to` bound `job_application_date` (inclusive).
+    At most `limit` (default 50) applications are returned: this endpoint
+    used to return every application, page through them to get them all.
+
+    Without `cursor`, pages by offset and returns a plain list. With
+    `cursor` (empty for the first page), pages by keyset and returns
+    `{items, next_cursor}`.
+    """
+    if cursor is None:
+        return await service.list_applications(
+            status=application_status,
+            applied_from=applied_from,
+            applied_to=applied_to,
+            limit=limit,
+            offset=offset,
+        )
+
+    try:
+        return await service.list_applications_page(
+            status=application_status,
+            applied_from=applied_from,
+            applied_to=applied_to,
+            limit=limit,
+            cursor=cursor or None,
+        )
+    except InvalidCursor:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from None
 
 
 @router.patch(
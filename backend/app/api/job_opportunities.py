@@ -4,14 +4,16 @@
 from collections.abc import Sequence
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
-from app.domain.errors import JobOpportunityNotFound
+from app.domain.errors import InvalidCursor, JobOpportunityNotFound
+from app.models.job_opportunity import JobOpportunityPriority
 from app.schemas.job_opportunity import (
     JobOpportunityCreate,
     JobOpportunityRead,
     JobOpportunityUpdate,
 )
+from app.schemas.pagination import MAX_PAGE_LIMIT, CursorPage
 from app.services.job_opportunity import (
     JobOpportunityService,
     get_job_opportunity_service,
@@ -91,15 +93,40 @@ async def get_job_opportunity(
 
 @router.get(
     "",
-    response_model=Sequence[JobOpportunityRead],
+    response_model=Sequence[JobOpportunityRead] | CursorPage[JobOpportunityRead],
     status_code=status.HTTP_200_OK,
 )
 async def list_job_opportunities(
-    offset: int = 0,
-    limit: int = 50,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=MAX_PAGE_LIMIT),
+    cursor: str | None = None,
+    is_active: bool | None = None,
+    priority: JobOpportunityPriority | None = None,
     service: JobOpportunityService = Depends(get_job_opportunity_service),
 ):
-    return await service.list_page(
-        limit=limit,
-        offset=offset,
-    )
+    """
+    List Job Opportunities, newest first.
+
+    Without `cursor`, pages by offset and returns a plain list. With
+    `cursor` (empty for the first page), returns `{items, next_cursor}`.
+    """
+    if cursor is None:
+        return await service.list_page(
+            limit=limit,
+            offset=offset,
+            is_active=is_active,
+            priority=priority,
+        )
+
+    try:
+        return await service.list_keyset(
+            limit=limit,
+            cursor=cursor or None,
+            is_active=is_active,
+            priority=priority,
+        )
+    except InvalidCursor:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from None
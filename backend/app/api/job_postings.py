@@ -1,9 +1,19 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # File: backend/app/api/job_postings.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from decimal import Decimal
+from typing import Literal
 
-from app.schemas.job_posting import JobPostingCreate, JobPostingRead, JobPostingUpdate
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.domain.errors import InvalidCursor
+from app.schemas.job_posting import (
+    JobPostingCreate,
+    JobPostingRead,
+    JobPostingSearchHit,
+    JobPostingUpdate,
+)
+from app.schemas.pagination import MAX_PAGE_LIMIT, CursorPage
 from app.services.job_posting import JobPostingService, get_job_posting_service
 
 router = APIRouter(prefix="/job-postings", tags=["Job Postings"])
@@ -26,27 +36,120 @@ async def create_job_posting(
 
 
 # 🔵 READ ALL
-@router.get("", response_model=list[JobPostingRead], status_code=status.HTTP_200_OK)
+@router.get(
+    "",
+    response_model=list[JobPostingRead] | CursorPage[JobPostingRead],
+    status_code=status.HTTP_200_OK,
+)
 async def list_job_postings(
     platform: str | None = None,
     company: str | None = None,
+    company_search: str | None = None,
+    location_search: str | None = None,
     has_application: bool | None = None,
-    limit: int = 50,
-    offset: int = 0,
+    min_salary: Decimal | None = Query(None, ge=0),
+    max_salary: Decimal | None = Query(None, ge=0),
+    salary_currency: str | None = Query(None, min_length=3, max_length=3),
+    limit: int = Query(50, ge=1, le=MAX_PAGE_LIMIT),
+    offset: int = Query(0, ge=0),
+    cursor: str | None = None,
     service: JobPostingService = Depends(get_job_posting_service),
 ):
     """
     List Job Postings for dashboard and browsing.
+
+    `company` matches exactly, `company_search` and `location_search` are
+    fuzzy (typos, case, extra words like "SAS").
+
+    `min_salary` and `max_salary` are yearly amounts: postings whose pay
+    range, brought to a year, overlaps them are returned. Postings without
+    a parsed salary, or with a small amount and no period ("2 500 €"), are
+    left out. Combine with `salary_currency` (e.g.
+    `EUR`) to compare amounts of one currency.
+
+    Without `cursor`, pages by offset and returns a plain list. With
+    `cursor` (empty for the first page), pages by keyset and returns
+    `{items, next_cursor}`; pass `next_cursor` back to get the next page.
     """
-    return await service.list_job_postings(
+    if cursor is None:
+        return await service.list_job_postings(
+            platform=platform,
+            company=company,
+            company_search=company_search,
+            location_search=location_search,
+            has_application=has_application,
+            min_salary=min_salary,
+            max_salary=max_salary,
+            salary_currency=salary_currency.upper() if salary_currency else None,
+            limit=limit,
+            offset=offset,
+        )
+
+    try:
+        return await service.list_job_postings_page(
+            platform=platform,
+            company=company,
+            company_search=company_search,
+            location_search=location_search,
+            has_application=has_application,
+            min_salary=min_salary,
+            max_salary=max_salary,
+            salary_currency=salary_currency.upper() if salary_currency else None,
+            limit=limit,
+            cursor=cursor or None,
+        )
+    except InvalidCursor:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from None
+
+
+# 🔎 SEARCH (declared before /{job_posting_id})
+@router.get(
+    "/search",
+    response_model=list[JobPostingSearchHit],
+    status_code=status.HTTP_200_OK,
+)
+async def search_job_postings(
+    q: str = Query(min_length=1),
+    platform: str | None = None,
+    limit: int = Query(20, ge=1, le=MAX_PAGE_LIMIT),
+    offset: int = Query(0, ge=0),
+    service: JobPostingService = Depends(get_job_posting_service),
+):
+    """
+    Full-text search over title, company, location, summary and description,
+    in English and French, best matches first.
+
+    `q` accepts web search syntax: `"exact phrase"`, `or`, `-excluded`.
+    """
+    return await service.search_job_postings(
+        q,
         platform=platform,
-        company=company,
-        has_application=has_application,
         limit=limit,
         offset=offset,
     )
 
 
+# 💡 AUTOCOMPLETE (declared before /{job_posting_id})
+@router.get(
+    "/suggest",
+    response_model=list[str],
+    status_code=status.HTTP_200_OK,
+)
+async def suggest_job_posting_values(
+    field: Literal["company", "location"],
+    prefix: str = Query(min_length=1),
+    limit: int = Query(10, ge=1, le=50),
+    service: JobPostingService = Depends(get_job_posting_service),
+):
+    """
+    Companies or locations starting with `prefix`, most frequent first.
+    """
+    return await service.suggest(field, prefix, limit=limit)
+
+
 # 🟣 READ ONE
 @router.get(
     "/{job_posting_id}",
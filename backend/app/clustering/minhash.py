@@ -0,0 +1,69 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/app/clustering/minhash.py
+
+import hashlib
+import random
+import struct
+from collections.abc import Iterable, Sequence
+
+MERSENNE_PRIME = (1 << 61) - 1
+
+Signature = tuple[int, ...]
+
+
+def _hash64(value: str) -> int:
+    digest = hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class MinHasher:
+    """
+    MinHash signatures and LSH band buckets of feature sets.
+
+    Two sets share a bucket with a probability rising steeply around a
+    Jaccard similarity of (1 / bands) ** (1 / rows): only those are compared.
+    Buckets are stored in the database: the parameters and the seed must
+    not change without recomputing them for every posting.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, seed: int = 1) -> None:
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randrange(1, MERSENNE_PRIME), rng.randrange(0, MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, features: Iterable[str]) -> Signature:
+        """MinHash signature of a set, empty for an empty set."""
+        hashes = [_hash64(feature) for feature in set(features)]
+        if not hashes:
+            return ()
+        return tuple(
+            min((a * h + b) % MERSENNE_PRIME for h in hashes) for a, b in self._perms
+        )
+
+    def buckets(self, signature: Signature) -> list[int]:
+        """One bucket per band, as signed 64-bit ints (Postgres BIGINT)."""
+        if not signature:
+            return []
+        buckets = []
+        for band in range(self.bands):
+            chunk = signature[band * self.rows : (band + 1) * self.rows]
+            digest = hashlib.blake2b(
+                struct.pack(f"<I{self.rows}Q", band, *chunk), digest_size=8
+            ).digest()
+            buckets.append(int.from_bytes(digest, "little", signed=True))
+        return buckets
+
+    @staticmethod
+    def similarity(a: Sequence[int], b: Sequence[int]) -> float:
+        """Estimated Jaccard similarity of the sets behind two signatures."""
+        if not a or len(a) != len(b):
+            return 0.0
+        return sum(x == y for x, y in zip(a, b, strict=True)) / len(a)
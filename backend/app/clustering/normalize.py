@@ -0,0 +1,88 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/app/clustering/normalize.py
+
+import re
+import unicodedata
+
+# "(H/F)", "F/H", "M/W/D", "(h/f/x)"... added by job boards to titles
+GENDER_MARKER_RE = re.compile(r"\(?\b[hfmwdx](?:\s*/\s*[hfmwdx])+\b\)?")
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+COMPANY_SUFFIXES = frozenset(
+    {
+        "co",
+        "corp",
+        "eurl",
+        "gmbh",
+        "inc",
+        "limited",
+        "llc",
+        "ltd",
+        "plc",
+        "sa",
+        "sarl",
+        "sas",
+        "sasu",
+    }
+)
+
+SHINGLE_SIZE = 3
+
+
+def strip_accents(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def _tokens(text: str | None) -> list[str]:
+    return TOKEN_RE.findall(strip_accents(text or "").lower())
+
+
+def normalize_title(title: str | None) -> str:
+    title = GENDER_MARKER_RE.sub(" ", strip_accents(title or "").lower())
+    return " ".join(_tokens(title))
+
+
+def normalize_company(company: str | None) -> str:
+    return " ".join(t for t in _tokens(company) if t not in COMPANY_SUFFIXES)
+
+
+def normalize_location(location: str | None) -> str:
+    """City part only: "Paris (75)", "Paris, Île-de-France" -> "paris"."""
+    city = re.split(r"[,(]| - ", location or "", maxsplit=1)[0]
+    return " ".join(t for t in _tokens(city) if not t.isdigit())
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set[str]:
+    """Character n-grams, robust to small spelling and word order changes."""
+    if not text:
+        return set()
+    padded = f" {text} "
+    if len(padded) <= size:
+        return {padded}
+    return {padded[i : i + size] for i in range(len(padded) - size + 1)}
+
+
+def company_shingles(company: str | None) -> set[str]:
+    return shingles(normalize_company(company))
+
+
+def overlap(a: set[str], b: set[str]) -> float:
+    """Overlap coefficient: 1.0 when one set contains the other."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / min(len(a), len(b))
+
+
+def posting_features(
+    title: str | None, company: str | None, location: str | None
+) -> set[str]:
+    """
+    Shingles of the normalized (title, company, location) of a posting,
+    prefixed by field so that e.g. a city never matches a company.
+    """
+    return (
+        {f"t:{s}" for s in shingles(normalize_title(title))}
+        | {f"c:{s}" for s in company_shingles(company)}
+        | {f"l:{s}" for s in shingles(normalize_location(location))}
+    )
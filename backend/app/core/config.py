@@ -1,11 +1,24 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # File: backend/app/core/config.py
 
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
     database_url: str
+    # Connection pool, per process (see app.core.database)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    # asyncpg prepared statements cached per connection (0 behind PgBouncer
+    # in transaction mode)
+    db_statement_cache_size: int = 100
+    # Server-side limit of a single statement, 0 disables it
+    db_statement_timeout_ms: int = 30_000
     debug: bool = False
     fixture_dir: str
     sample_dir: str
@@ -13,6 +26,14 @@ class Settings(BaseSettings):
     user_last_name: str
     email_address: str
     email_password: str
+    email_archive_folder: str | None = None
+    # Additional identities to redact (JSON lists, e.g. '["Jean Dupont"]')
+    pii_extra_names: list[str] = []
+    pii_extra_emails: list[str] = []
+    # Follow redirects of tracked job links to find their job key
+    url_resolver_enabled: bool = False
+    url_resolver_cache_path: str = ".cache/url_redirects.sqlite"
+    url_resolver_ttl_days: int = 30
     CORS_ORIGINS: list[str] = ["http://localhost:5173"]
 
     model_config = {
@@ -21,7 +42,9 @@ class Settings(BaseSettings):
     }
 
 
+@lru_cache
 def get_settings() -> Settings:
+    """Load settings once; call `get_settings.cache_clear()` to reload."""
     return Settings()  # type: ignore[call-arg]
 
 
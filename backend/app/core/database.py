@@ -1,16 +1,49 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # File: backend/app/core/database.py
 
-from sqlalchemy import text
+from typing import Any
+
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from app.db.base import Base
+from app.db.migrations import check_schema_revision
 
-from .config import get_settings
+from .config import Settings, get_settings
 
 settings = get_settings()
 
-engine = create_async_engine(settings.database_url, echo=True)
+
+def build_engine_kwargs(settings: Settings) -> dict[str, Any]:
+    """
+    Engine options from the settings: pool sizing, liveness checks and,
+    for asyncpg, statement cache and timeout.
+
+    SQL is only echoed in debug, logging every statement caps throughput.
+    """
+    kwargs: dict[str, Any] = {
+        "echo": settings.debug,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+    if make_url(settings.database_url).get_driver_name() == "asyncpg":
+        server_settings = {"application_name": "jobai-agent"}
+        if settings.db_statement_timeout_ms:
+            server_settings["statement_timeout"] = str(settings.db_statement_timeout_ms)
+        kwargs["connect_args"] = {
+            # asyncpg's own cache, and SQLAlchemy's cache on top of it
+            "statement_cache_size": settings.db_statement_cache_size,
+            "prepared_statement_cache_size": settings.db_statement_cache_size,
+            "server_settings": server_settings,
+        }
+
+    return kwargs
+
+
+engine = create_async_engine(settings.database_url, **build_engine_kwargs(settings))
 
 async_session_local = async_sessionmaker(
     engine,
@@ -20,10 +53,13 @@ async_session_local = async_sessionmaker(
 
 
 async def init_db():
-    """Check that the database connection is alive."""
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-        await conn.execute(text("SELECT 1"))
+    """
+    Check that the database is reachable and migrated to the latest revision.
+
+    The schema itself is managed by `scripts/python/migrate.py`.
+    """
+    async with engine.connect() as conn:
+        await check_schema_revision(conn)
 
 
 async def close_db():
@@ -0,0 +1,96 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/app/db/migrations.py
+
+from functools import lru_cache
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import Connection, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+# Key of the Postgres advisory lock serializing concurrent migrations
+MIGRATION_LOCK_ID = 0x4A4F4241  # "JOBA"
+
+
+class SchemaRevisionMismatch(RuntimeError):
+    def __init__(self, current: str | None, expected: str) -> None:
+        self.current = current
+        self.expected = expected
+        super().__init__(
+            f"Database schema is at revision {current or '<none>'}, "
+            f"expected {expected}: run `make migrate`"
+        )
+
+
+def alembic_config(connection: Connection | None = None) -> Config:
+    config = Config(str(ALEMBIC_INI))
+    config.attributes["configure_logger"] = False
+    if connection is not None:
+        config.attributes["connection"] = connection
+    return config
+
+
+@lru_cache
+def head_revision() -> str:
+    """Latest revision of the migration scripts (read from disk once)."""
+    head = ScriptDirectory.from_config(alembic_config()).get_current_head()
+    if head is None:
+        raise RuntimeError(f"No migration found for {ALEMBIC_INI}")
+    return head
+
+
+async def current_revision(conn: AsyncConnection) -> str | None:
+    """Revision stamped in the database, None if it was never migrated."""
+    try:
+        result = await conn.execute(text("SELECT version_num FROM alembic_version"))
+    except DBAPIError:
+        # alembic_version does not exist yet
+        await conn.rollback()
+        return None
+    return result.scalar_one_or_none()
+
+
+async def check_schema_revision(conn: AsyncConnection) -> None:
+    """
+    Verify that the database is migrated to the head revision.
+
+    A single query, meant for application startup: schema changes are
+    applied by `migrate`, never by the API workers.
+
+    Raises:
+        SchemaRevisionMismatch: If the database is behind, ahead of or
+            unknown to the migration scripts.
+    """
+    current = await current_revision(conn)
+    if current != head_revision():
+        raise SchemaRevisionMismatch(current, head_revision())
+
+
+def _upgrade(connection: Connection, revision: str) -> None:
+    # Transaction-level lock: concurrent runs wait here, then find the
+    # schema already upgraded. It is released with the commit.
+    connection.execute(
+        text("SELECT pg_advisory_xact_lock(:lock_id)"),
+        {"lock_id": MIGRATION_LOCK_ID},
+    )
+    # Index builds may outlast the statement timeout of the API engine
+    connection.execute(text("SET LOCAL statement_timeout = 0"))
+    command.upgrade(alembic_config(connection), revision)
+
+
+async def migrate(engine: AsyncEngine, revision: str = "head") -> str | None:
+    """
+    Upgrade the database to `revision` in one transaction.
+
+    Returns the revision the database is at afterwards.
+    """
+    async with engine.begin() as conn:
+        await conn.run_sync(_upgrade, revision)
+
+    async with engine.connect() as conn:
+        return await current_revision(conn)
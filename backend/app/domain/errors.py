@@ -12,3 +12,9 @@ class JobOpportunityNotFound(DomainError):
     def __init__(self, job_opportunity_id: UUID) -> None:
         self.job_opportunity_id = job_opportunity_id
         super().__init__(f"JobOpportunity {job_opportunity_id} not found")
+
+
+class InvalidCursor(DomainError):
+    def __init__(self, cursor: str) -> None:
+        self.cursor = cursor
+        super().__init__(f"Invalid pagination cursor: {cursor!r}")
@@ -7,7 +7,12 @@ from sqlalchemy.ext.asyncio.session import AsyncSession
 
 from app.ingestion.extraction.email.email_alert_fetcher import EmailAlertFetcher
 from app.ingestion.extraction.email.job_extraction_service import JobExtractionService
+from app.ingestion.normalization.url.resolver import (
+    UrlResolver,
+    resolve_missing_job_keys,
+)
 from app.models.job_posting import JobPosting
+from app.services.job_clustering import JobClusteringService
 from app.services.job_posting import JobPostingService
 
 logger = logging.getLogger(__name__)
@@ -19,6 +24,7 @@ class JobIngestionService:
     def __init__(self, session: AsyncSession):
         self.session = session
         self.job_posting_service = JobPostingService(session=session)
+        self.clustering_service = JobClusteringService(session=session)
 
     async def ingest_from_email(
         self,
@@ -26,14 +32,29 @@ class JobIngestionService:
         password: str,
         folder: str = "INBOX",
         days_back: int = 1,
+        archive_folder: str | None = None,
+        resolver: UrlResolver | None = None,
     ) -> list[JobPosting]:
-        """Fetch job alerts from email and save them to database."""
-        email_fetcher = EmailAlertFetcher(email_address, password, folder)
-        emails = email_fetcher.fetch_recent(days_back)
+        """
+        Fetch job alerts from email and save them to database.
 
+        When `archive_folder` is set, processed alerts are moved there once
+        the postings are committed. When a `resolver` is given, tracked links
+        without a job key are resolved first, so de-duplication can rely on
+        the job key instead of the raw URL. New postings are grouped with
+        their cross-platform duplicates into job opportunities.
+        """
         extractor = JobExtractionService()
+
+        email_fetcher = EmailAlertFetcher(email_address, password, folder)
+        emails = email_fetcher.fetch_recent(days_back, senders=extractor.senders)
+
         extracted_jobs = extractor.extract_jobs(emails)
 
+        if resolver is not None:
+            resolved = await resolve_missing_job_keys(extracted_jobs, resolver)
+            logger.info("Resolved job keys of %d tracked links", resolved)
+
         created_jobs: list[JobPosting] = []
 
         for raw_job in extracted_jobs:
@@ -43,5 +64,18 @@ class JobIngestionService:
             if job_posting:
                 created_jobs.append(job_posting)
 
+        opportunities = await self.clustering_service.cluster(created_jobs)
+        logger.info(
+            "Clustered %d new postings, %d new opportunities",
+            len(created_jobs),
+            opportunities,
+        )
+
         await self.session.commit()
+
+        if archive_folder:
+            processed_uids = [job["source"]["uid"] for job in extracted_jobs]
+            moved = email_fetcher.archive(processed_uids, archive_folder)
+            logger.info("Archived %d processed alerts to %s", moved, archive_folder)
+
         return created_jobs
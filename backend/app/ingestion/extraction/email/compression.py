@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/app/ingestion/extraction/email/compression.py
+
+import imaplib
+import zlib
+from dataclasses import dataclass
+
+COMPRESS_DEFLATE = "COMPRESS=DEFLATE"
+
+# imaplib only sends registered commands (name -> allowed states)
+imaplib.Commands.setdefault("COMPRESS", ("AUTH", "SELECTED"))
+
+# Same limit imaplib enforces on a single response line
+_MAXLINE = imaplib._MAXLINE
+_READ_CHUNK = 64 * 1024
+
+
+@dataclass
+class TransferStats:
+    """
+    Byte counters for an IMAP connection.
+
+    Attributes:
+        wire_received: Bytes read from the socket (compressed when enabled)
+        wire_sent: Bytes written to the socket (compressed when enabled)
+        data_received: Protocol bytes after decompression
+        data_sent: Protocol bytes before compression
+    """
+
+    wire_received: int = 0
+    wire_sent: int = 0
+    data_received: int = 0
+    data_sent: int = 0
+
+    @property
+    def compression_ratio(self) -> float:
+        """Ratio of uncompressed to on-the-wire received bytes."""
+        if not self.wire_received:
+            return 1.0
+        return self.data_received / self.wire_received
+
+
+class DeflateIMAP4_SSL(imaplib.IMAP4_SSL):
+    """
+    IMAP4_SSL connection with RFC 4978 COMPRESS=DEFLATE support.
+
+    Until `enable_compression()` succeeds the connection behaves exactly
+    like imaplib.IMAP4_SSL, only counting bytes. Afterwards every read and
+    write goes through a raw deflate stream.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.stats = TransferStats()
+        self._compressor = None
+        self._decompressor = None
+        self._inbuf = bytearray()
+        super().__init__(*args, **kwargs)
+
+    @property
+    def compressed(self) -> bool:
+        return self._decompressor is not None
+
+    def enable_compression(self) -> bool:
+        """
+        Negotiate COMPRESS DEFLATE. Returns False if the server refuses.
+        """
+        if self.compressed:
+            return True
+
+        status, _ = self._simple_command("COMPRESS", "DEFLATE")
+        if status != "OK":
+            return False
+
+        # RFC 4978 mandates raw deflate (no zlib header), hence wbits=-15
+        self._compressor = zlib.compressobj(
+            zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15
+        )
+        self._decompressor = zlib.decompressobj(-15)
+        return True
+
+    # --- imaplib I/O hooks ---
+    def read(self, size: int) -> bytes:
+        if not self.compressed:
+            data = super().read(size)
+            self.stats.wire_received += len(data)
+            self.stats.data_received += len(data)
+            return data
+
+        while len(self._inbuf) < size:
+            if not self._fill():
+                break
+        data = bytes(self._inbuf[:size])
+        del self._inbuf[:size]
+        return data
+
+    def readline(self) -> bytes:
+        if not self.compressed:
+            line = super().readline()
+            self.stats.wire_received += len(line)
+            self.stats.data_received += len(line)
+            return line
+
+        while (end := self._inbuf.find(b"\n")) < 0:
+            if len(self._inbuf) > _MAXLINE:
+                raise self.error(f"got more than {_MAXLINE} bytes")
+            if not self._fill():
+                end = len(self._inbuf) - 1
+                break
+        line = bytes(self._inbuf[: end + 1])
+        del self._inbuf[: end + 1]
+        return line
+
+    def send(self, data: bytes) -> None:
+        self.stats.data_sent += len(data)
+        if self._compressor is not None:
+            data = self._compressor.compress(data) + self._compressor.flush(
+                zlib.Z_SYNC_FLUSH
+            )
+        self.stats.wire_sent += len(data)
+        self.sock.sendall(data)
+
+    def _fill(self) -> bool:
+        """Read one chunk from the socket and inflate it. False on EOF."""
+        chunk = self.file.read1(_READ_CHUNK)
+        if not chunk:
+            return False
+        self.stats.wire_received += len(chunk)
+        inflated = self._decompressor.decompress(chunk)
+        self.stats.data_received += len(inflated)
+        self._inbuf += inflated
+        return True
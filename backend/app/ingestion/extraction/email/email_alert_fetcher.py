@@ -1,12 +1,17 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # File: backend/app/ingestion/extraction/email/email_alert_fetcher.py
 
+import logging
+from collections.abc import Collection, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from email.utils import parsedate_to_datetime
 
 from .imap_client import IMAPClient
 from .provider import detect_provider
+from .search import GMAIL_EXTENSION, build_search_criteria
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -20,7 +25,7 @@ class FetchedEmail:
         subject: Email subject line
         msg_dt: Email datetime
         html: HTML content of the email body
-        headers: Dictionary of email headers
+        headers: Mapping of email headers, decoded lazily
     """
 
     uid: int
@@ -28,7 +33,7 @@ class FetchedEmail:
     subject: str
     msg_dt: datetime
     html: str
-    headers: dict[str, str]
+    headers: Mapping[str, str]
 
 
 class EmailAlertFetcher:
@@ -58,13 +63,25 @@ class EmailAlertFetcher:
         self.folder = folder
 
     def fetch_recent(
-        self, days_back: int = 1, sender_filter: str | None = None
+        self,
+        days_back: int = 1,
+        sender_filter: str | None = None,
+        senders: Sequence[str] = (),
+        limit: int | None = None,
+        skip_uids: Collection[int] = (),
     ) -> list[FetchedEmail]:
         """
         Fetch emails from the last N days.
 
         Args:
             days_back: Number of days to look back for emails
+            sender_filter: Sender (address or domain) every email must match,
+                narrowing the `senders` selection
+            senders: Senders (addresses or domains) to keep, OR-ed together
+                server-side
+            limit: Only return the `limit` most recent emails passing the
+                filters (recency, HTML body, headers), skipped UIDs included
+            skip_uids: UIDs already processed, not downloaded again
 
         Returns:
             List of FetchedEmail objects containing parsed email data
@@ -72,23 +89,38 @@ class EmailAlertFetcher:
         self.client.connect()
         self.client.select_folder(self.folder)
 
-        # Build IMAP search criteria (filter emails)
-        since_str = self._since_query(days_back)
-        criteria = ["SINCE", since_str]
-        if sender_filter:
-            criteria += ["FROM", sender_filter]
+        # Build IMAP search criteria (filter emails server-side)
+        criteria = build_search_criteria(
+            days_back,
+            senders,
+            gmail=self.client.has_capability(GMAIL_EXTENSION),
+            sender_filter=sender_filter,
+        )
         uids = self.client.search(*criteria)
 
+        # UIDs are ascending: walk from the newest message, so that `limit`
+        # counts emails passing the filters below. Skipped UIDs count too,
+        # they were kept by a previous run.
         emails: list[FetchedEmail] = []
-        for uid_str in uids:
-            msg = self.client.fetch_email(uid_str)
-            if not msg:
+        taken = 0
+        for uid_str in reversed(uids):
+            if limit is not None and taken >= limit:
+                break
+
+            if int(uid_str) in skip_uids:
+                taken += 1
                 continue
 
+            raw = self.client.fetch_raw(uid_str)
+            if not raw:
+                continue
+
+            # Headers only: the body is handled by the byte-level fast path
+            msg = IMAPClient.parse_headers(raw)
             if not self._is_recent_enough(msg, days_back):
                 continue
 
-            html = IMAPClient.extract_html(msg)
+            html = IMAPClient.extract_html_raw(raw)
             if not html:
                 continue
 
@@ -111,25 +143,55 @@ class EmailAlertFetcher:
             )
 
             emails.append(email)
+            taken += 1
 
+        emails.reverse()
         if self.client.conn is not None:
+            stats = self.client.stats
+            logger.info(
+                "IMAP transfer: %d bytes on the wire, %d bytes of data (x%.1f)",
+                stats.wire_received,
+                stats.data_received,
+                stats.compression_ratio,
+            )
             self.client.conn.logout()
 
         return emails
 
-    @staticmethod
-    def _since_query(days_back: int) -> str:
+    def archive(
+        self,
+        uids: list[int],
+        destination: str,
+        batch_size: int = 500,
+    ) -> int:
         """
-        Generate IMAP SINCE query date string.
+        Move processed emails out of the fetched folder.
+
+        Meant to run once per ingestion run: keeping the inbox small keeps
+        later SEARCH/FETCH calls fast.
 
         Args:
-            days_back: Number of days to subtract from current date
+            uids: UIDs of the processed emails
+            destination: Archive folder name
+            batch_size: Maximum number of UIDs per IMAP command
 
         Returns:
-            Date string in IMAP format (DD-Mon-YYYY)
+            Number of emails moved
         """
-        ref_date = datetime.now() - timedelta(days=days_back)
-        return ref_date.strftime("%d-%b-%Y")
+        if not uids:
+            return 0
+
+        self.client.connect()
+        self.client.select_folder(self.folder)
+        try:
+            return self.client.move_emails(
+                [str(uid) for uid in sorted(set(uids))],
+                destination,
+                batch_size=batch_size,
+            )
+        finally:
+            if self.client.conn is not None:
+                self.client.conn.logout()
 
     @staticmethod
     def _is_recent_enough(message, days_back: int) -> bool:
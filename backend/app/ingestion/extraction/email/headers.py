@@ -0,0 +1,81 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/app/ingestion/extraction/email/headers.py
+
+import codecs
+from collections.abc import Iterator, Mapping
+from email.header import decode_header
+from email.message import Message
+from functools import lru_cache
+
+# Charsets some mailers declare without a real codec behind them
+UNKNOWN_CHARSETS = frozenset({"unknown-8bit", "x-unknown", "unknown"})
+
+
+@lru_cache(maxsize=128)
+def codec_for(charset: str | None) -> str:
+    """Resolve a declared charset to a Python codec name, utf-8 as fallback."""
+    if not charset or charset.lower() in UNKNOWN_CHARSETS:
+        return "utf-8"
+    try:
+        return codecs.lookup(charset).name
+    except LookupError:
+        return "utf-8"
+
+
+def decode_header_value(value: object) -> str:
+    """
+    Decode a raw header value, joining every RFC 2047 encoded word.
+
+    Values without encoded words are returned untouched, which is the case
+    for most headers.
+    """
+    if not value:
+        return ""
+
+    value = str(value)
+    if "=?" not in value:
+        return value
+
+    chunks: list[str] = []
+    for decoded, charset in decode_header(value):
+        if isinstance(decoded, bytes):
+            chunks.append(decoded.decode(codec_for(charset), errors="ignore"))
+        else:
+            chunks.append(decoded)
+    return "".join(chunks)
+
+
+class LazyHeaders(Mapping[str, str]):
+    """
+    Read-only header mapping that decodes values on first access.
+
+    Keys are lower-cased. When a header appears several times, the last
+    occurrence wins.
+    """
+
+    __slots__ = ("_raw", "_decoded")
+
+    def __init__(self, items: Message | Mapping[str, str]):
+        self._raw: dict[str, str] = {k.lower(): v for k, v in items.items()}
+        self._decoded: dict[str, str] = {}
+
+    def __getitem__(self, key: str) -> str:
+        key = key.lower()
+        try:
+            return self._decoded[key]
+        except KeyError:
+            value = decode_header_value(self._raw[key])
+            self._decoded[key] = value
+            return value
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and key.lower() in self._raw
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __repr__(self) -> str:
+        return f"LazyHeaders({list(self._raw)!r})"
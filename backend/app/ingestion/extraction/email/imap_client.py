@@ -5,27 +5,74 @@ import email
 import imaplib
 import logging
 import ssl
-from email.header import decode_header
 from email.message import Message
+from email.parser import BytesHeaderParser
+
+from .compression import COMPRESS_DEFLATE, DeflateIMAP4_SSL, TransferStats
+from .headers import LazyHeaders, codec_for, decode_header_value
+from .mime import extract_html_bytes, header_block_end
 
 logger = logging.getLogger(__name__)
 
 
 class IMAPClient:
-    def __init__(self, host: str, username: str, password: str, port: int = 993):
+    def __init__(
+        self,
+        host: str,
+        username: str,
+        password: str,
+        port: int = 993,
+        compress: bool = True,
+    ):
         self.host = host
         self.username = username
         self.password = password
         self.port = port
-        self.conn = None
+        self.compress = compress
+        self.conn: DeflateIMAP4_SSL | None = None
+        self.capabilities: frozenset[str] = frozenset()
 
     def connect(self):
         context = ssl.create_default_context()
-        self.conn = imaplib.IMAP4_SSL(self.host, self.port, ssl_context=context)
+        self.conn = DeflateIMAP4_SSL(self.host, self.port, ssl_context=context)
         try:
             self.conn.login(self.username, self.password)
         except imaplib.IMAP4.error as e:
             raise RuntimeError("IMAP login failed") from e
+        self.refresh_capabilities()
+
+        # HTML digests compress very well, negotiate deflate when offered
+        if self.compress and self.has_capability(COMPRESS_DEFLATE):
+            if self.conn.enable_compression():
+                logger.info("IMAP COMPRESS=DEFLATE enabled")
+            else:
+                logger.warning("Server refused COMPRESS=DEFLATE")
+
+    @property
+    def stats(self) -> TransferStats:
+        """Byte counters of the current connection."""
+        if self.conn is None:
+            return TransferStats()
+        return self.conn.stats
+
+    def refresh_capabilities(self) -> frozenset[str]:
+        """
+        Query the server capabilities.
+
+        Servers often advertise extensions (X-GM-EXT-1, MOVE, ...) only once
+        authenticated, so this is called again right after login.
+        """
+        if self.conn is None:
+            raise RuntimeError("Not connected. Call connect() first.")
+        status, data = self.conn.capability()
+        if status == "OK" and data and data[-1]:
+            self.capabilities = frozenset(data[-1].decode().upper().split())
+        else:
+            self.capabilities = frozenset(c.upper() for c in self.conn.capabilities)
+        return self.capabilities
+
+    def has_capability(self, name: str) -> bool:
+        return name.upper() in self.capabilities
 
     def select_folder(self, folder="INBOX"):
         if self.conn is None:
@@ -35,16 +82,18 @@ class IMAPClient:
     def search(self, *criteria: str) -> list[str]:
         if self.conn is None:
             raise RuntimeError("Not connected. Call connect() first.")
-        status, data = self.conn.search(None, *criteria)
+        # UID SEARCH: UIDs stay valid across sessions and expunges,
+        # unlike sequence numbers
+        status, data = self.conn.uid("SEARCH", *criteria)
         if status != "OK" or not data or not data[0]:
             return []
         return data[0].decode().split()
 
-    def fetch_email(self, uid: str) -> Message | None:
+    def fetch_raw(self, uid: str) -> bytes | None:
         if self.conn is None:
             raise RuntimeError("IMAP connection not established")
 
-        status, data = self.conn.fetch(uid, "(RFC822)")
+        status, data = self.conn.uid("FETCH", uid, "(RFC822)")
 
         if status != "OK" or not data or data[0] is None:
             return None
@@ -52,6 +101,12 @@ class IMAPClient:
         raw = data[0][1]
         if not isinstance(raw, bytes):
             return None
+        return raw
+
+    def fetch_email(self, uid: str) -> Message | None:
+        raw = self.fetch_raw(uid)
+        if raw is None:
+            return None
         return email.message_from_bytes(raw)
 
     def fetch_headers_bulk(self, uid_set: str) -> list[tuple[str, Message]]:
@@ -64,8 +119,8 @@ class IMAPClient:
             raise RuntimeError("IMAP connection not established")
 
         # Fetch only From, Subject and Date (much faster)
-        status, data = self.conn.fetch(
-            uid_set, "(UID BODY.PEEK[HEADER.FIELDS (FROM SUBJECT DATE)])"
+        status, data = self.conn.uid(
+            "FETCH", uid_set, "(UID BODY.PEEK[HEADER.FIELDS (FROM SUBJECT DATE)])"
         )
 
         if status != "OK" or not data:
@@ -97,42 +152,82 @@ class IMAPClient:
         return results
 
     def delete_email(self, uid: str):
+        self.delete_emails_batch([uid])
+
+    def delete_emails_batch(self, uids: list[str], batch_size: int = 500):
         if self.conn is None:
             raise RuntimeError("IMAP connection not established")
-        # Mark email as deleted
-        self.conn.store(uid, "+FLAGS", r"(\Deleted)")
-        # Permanently remove emails marked as deleted
-        self.conn.expunge()
 
-    def delete_emails_batch(self, uids: list[str]):
+        for uid_set in self._uid_sets(uids, batch_size):
+            # Mark emails as deleted, then remove only this set
+            self.conn.uid("STORE", uid_set, "+FLAGS.SILENT", r"(\Deleted)")
+            self._expunge(uid_set)
+
+    def move_emails(
+        self,
+        uids: list[str],
+        destination: str,
+        batch_size: int = 500,
+    ) -> int:
+        """
+        Move messages to another folder in chunked UID sets.
+
+        Uses UID MOVE (RFC 6851) when available, otherwise falls back to
+        UID COPY + UID STORE (deleted flag) + UID EXPUNGE scoped to the set.
+
+        Returns:
+            Number of messages moved
+        """
         if self.conn is None:
             raise RuntimeError("IMAP connection not established")
 
         if not uids:
-            return
+            return 0
+
+        # Fails harmlessly when the folder already exists
+        self.conn.create(destination)
+
+        moved = 0
+        for uid_set in self._uid_sets(uids, batch_size):
+            if self.has_capability("MOVE"):
+                status, _ = self.conn.uid("MOVE", uid_set, destination)
+            else:
+                status, _ = self.conn.uid("COPY", uid_set, destination)
+                if status == "OK":
+                    self.conn.uid("STORE", uid_set, "+FLAGS.SILENT", r"(\Deleted)")
+                    self._expunge(uid_set)
+
+            if status != "OK":
+                logger.warning("Could not move UIDs %s to %s", uid_set, destination)
+                continue
+            moved += uid_set.count(",") + 1
 
-        uid_set = ",".join(uids)
-        self.conn.store(uid_set, "+FLAGS", r"(\Deleted)")
-        self.conn.expunge()
+        return moved
+
+    def _expunge(self, uid_set: str):
+        if self.conn is None:
+            raise RuntimeError("IMAP connection not established")
+
+        if self.has_capability("UIDPLUS"):
+            self.conn.uid("EXPUNGE", uid_set)
+        else:
+            # Without UIDPLUS the only option is a mailbox-wide expunge
+            self.conn.expunge()
+
+    @staticmethod
+    def _uid_sets(uids: list[str], batch_size: int) -> list[str]:
+        return [
+            ",".join(uids[i : i + batch_size]) for i in range(0, len(uids), batch_size)
+        ]
 
     @staticmethod
     def decode(value: str | None) -> str:
-        if not value:
-            return ""
-        decoded, charset = decode_header(value)[0]
-        if isinstance(decoded, bytes):
-            # Fallback for problematic charsets
-            try:
-                if not charset or charset.lower() in [
-                    "unknown-8bit",
-                    "x-unknown",
-                    "unknown",
-                ]:
-                    charset = "utf-8"
-                return decoded.decode(charset, errors="ignore")
-            except LookupError:
-                return decoded.decode("utf-8", errors="ignore")
-        return decoded
+        return decode_header_value(value)
+
+    @staticmethod
+    def parse_headers(raw: bytes) -> Message:
+        """Parse only the header block of a raw message."""
+        return BytesHeaderParser().parsebytes(raw[: header_block_end(raw)])
 
     @staticmethod
     def extract_html(msg: Message) -> str:
@@ -141,25 +236,29 @@ class IMAPClient:
                 if part.get_content_type() == "text/html":
                     payload = part.get_payload(decode=True)
                     if isinstance(payload, bytes):
-                        return payload.decode("utf-8", errors="ignore")
+                        charset = codec_for(part.get_content_charset())
+                        return payload.decode(charset, errors="ignore")
         else:
             if msg.get_content_type() == "text/html":
                 payload = msg.get_payload(decode=True)
                 if isinstance(payload, bytes):
-                    return payload.decode("utf-8", errors="ignore")
+                    charset = codec_for(msg.get_content_charset())
+                    return payload.decode(charset, errors="ignore")
 
         return ""
 
     @staticmethod
-    def extract_headers(msg: Message) -> dict:
+    def extract_html_raw(raw: bytes) -> str:
+        """Extract the HTML body, using the byte-level fast path if possible."""
+        html = extract_html_bytes(raw)
+        if html is None:
+            html = IMAPClient.extract_html(email.message_from_bytes(raw))
+        return html
+
+    @staticmethod
+    def extract_headers(msg: Message) -> LazyHeaders:
         """
-        Extract ALL email metadata (all headers), fully decoded.
-        Returns a dictionary mapping header name → decoded value.
+        Expose ALL email metadata (all headers), decoded on access.
+        Returns a mapping of lower-cased header name → decoded value.
         """
-        metadata = {}
-
-        for header, value in msg.items():
-            decoded = IMAPClient.decode(value)
-            metadata[header.lower()] = decoded
-
-        return metadata
+        return LazyHeaders(msg)
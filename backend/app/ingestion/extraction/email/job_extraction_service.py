@@ -27,6 +27,21 @@ class JobExtractionService:
             # WWTTJParser(),
         ]
 
+    @property
+    def senders(self) -> list[str]:
+        """
+        Sender domains of all registered parsers, for server-side search.
+
+        Empty (no filtering) when a parser declares no senders, so that its
+        emails are still fetched.
+        """
+        senders: list[str] = []
+        for parser in self.parsers:
+            if not parser.senders:
+                return []
+            senders += [s for s in parser.senders if s not in senders]
+        return senders
+
     def extract_jobs(self, emails: list[FetchedEmail]) -> list[dict]:
         """
         Parse job postings from a list of fetched emails.
@@ -0,0 +1,150 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/app/ingestion/extraction/email/mime.py
+
+import binascii
+import re
+
+from .headers import codec_for
+
+_HEADER_END = re.compile(rb"\r?\n\r?\n")
+_CONTENT_TYPE = re.compile(
+    rb"^content-type:[ \t]*([^;\s]+)((?:[^\r\n]|\r?\n[ \t])*)",
+    re.IGNORECASE | re.MULTILINE,
+)
+_TRANSFER_ENCODING = re.compile(
+    rb"^content-transfer-encoding:[ \t]*([\w-]+)",
+    re.IGNORECASE | re.MULTILINE,
+)
+_PARAM = re.compile(
+    rb"""(boundary|charset)\s*=\s*(?:"([^"]*)"|([^\s;"]+))""",
+    re.IGNORECASE,
+)
+
+# Guard against pathological nesting
+_MAX_DEPTH = 8
+
+
+def header_block_end(raw: bytes, start: int = 0, end: int | None = None) -> int:
+    """
+    Return the offset of the blank line ending the header block
+    (i.e. where the body separator starts), or `end` if there is none.
+    """
+    end = len(raw) if end is None else end
+    if raw.startswith(b"\r\n", start) or raw.startswith(b"\n", start):
+        # Part without headers
+        return start
+    match = _HEADER_END.search(raw, start, end)
+    return match.start() if match else end
+
+
+def _body_start(raw: bytes, header_end: int, end: int) -> int:
+    match = _HEADER_END.match(raw, header_end, end)
+    if match:
+        return match.end()
+    # Header-less part: skip the single line break
+    if raw.startswith(b"\r\n", header_end):
+        return header_end + 2
+    if raw.startswith(b"\n", header_end):
+        return header_end + 1
+    return end
+
+
+def _params(raw: bytes, start: int, end: int) -> dict[bytes, bytes]:
+    return {
+        m.group(1).lower(): m.group(2) if m.group(2) is not None else m.group(3)
+        for m in _PARAM.finditer(raw, start, end)
+    }
+
+
+def _iter_parts(raw: bytes, boundary: bytes, start: int, end: int):
+    """Yield (start, end) offsets of each part of a multipart body."""
+    delimiter = b"--" + boundary
+    pos = raw.find(delimiter, start, end)
+
+    while pos != -1:
+        if raw.startswith(delimiter + b"--", pos):
+            return  # close delimiter
+
+        line_end = raw.find(b"\n", pos, end)
+        if line_end == -1:
+            return
+        part_start = line_end + 1
+
+        next_pos = raw.find(b"\n" + delimiter, part_start, end)
+        if next_pos == -1:
+            # Truncated message: the last part runs to the end
+            yield part_start, end
+            return
+
+        # The line break before the delimiter belongs to the delimiter
+        part_end = next_pos - 1 if raw[next_pos - 1 : next_pos] == b"\r" else next_pos
+        yield part_start, part_end
+        pos = next_pos + 1
+
+
+def _find_html(
+    raw: bytes, start: int, end: int, depth: int = 0
+) -> tuple[int, int, bytes, str] | None:
+    """
+    Locate the first text/html entity between `start` and `end`.
+
+    Returns (body_start, body_end, transfer_encoding, charset) or None.
+    """
+    if depth > _MAX_DEPTH:
+        return None
+
+    header_end = header_block_end(raw, start, end)
+    body_start = _body_start(raw, header_end, end)
+
+    content_type = _CONTENT_TYPE.search(raw, start, header_end)
+    if content_type is None:
+        return None  # implicit text/plain
+
+    mime_type = content_type.group(1).lower()
+    params = _params(raw, content_type.start(2), content_type.end(2))
+
+    if mime_type.startswith(b"multipart/"):
+        boundary = params.get(b"boundary")
+        if not boundary:
+            return None
+        for part_start, part_end in _iter_parts(raw, boundary, body_start, end):
+            found = _find_html(raw, part_start, part_end, depth + 1)
+            if found is not None:
+                return found
+        return None
+
+    if mime_type != b"text/html":
+        return None
+
+    encoding = _TRANSFER_ENCODING.search(raw, start, header_end)
+    transfer_encoding = encoding.group(1).lower() if encoding else b"7bit"
+    charset = params.get(b"charset", b"utf-8").decode("ascii", errors="ignore")
+
+    return body_start, end, transfer_encoding, charset
+
+
+def extract_html_bytes(raw: bytes) -> str | None:
+    """
+    Extract and decode the HTML body of a raw message without building a
+    Message tree.
+
+    The raw bytes are scanned with offsets, so the HTML body is copied only
+    once, while being transfer-decoded, and decoded with its declared
+    charset. Returns None when no HTML part was found or the structure is
+    not handled, in which case the caller should use the full parser.
+    """
+    found = _find_html(raw, 0, len(raw))
+    if found is None:
+        return None
+
+    body_start, body_end, transfer_encoding, charset = found
+    body = memoryview(raw)[body_start:body_end]
+    codec = codec_for(charset)
+
+    if transfer_encoding == b"base64":
+        return binascii.a2b_base64(body).decode(codec, errors="ignore")
+    if transfer_encoding == b"quoted-printable":
+        return binascii.a2b_qp(body).decode(codec, errors="ignore")
+    if transfer_encoding in (b"7bit", b"8bit", b"binary"):
+        return str(body, codec, errors="ignore")
+    return None
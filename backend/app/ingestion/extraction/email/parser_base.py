@@ -4,14 +4,26 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
 
+from bs4 import BeautifulSoup
+
 
 class EmailParser(ABC):
+    # Sender domains used to pre-filter the mailbox server-side (IMAP FROM
+    # is a substring match). Empty means the parser may match any sender.
+    senders: tuple[str, ...] = ()
+
     @abstractmethod
     def matches(self, sender: str, subject: str) -> bool:
         """Return True if this parser can handle the email."""
         pass
 
-    @abstractmethod
     def parse(self, html: str, msg_dt: datetime | None = None) -> list[dict]:
         """Return a list of job dicts with title, company, url, location, platform."""
+        return self.parse_soup(BeautifulSoup(html, "html.parser"), msg_dt)
+
+    @abstractmethod
+    def parse_soup(
+        self, soup: BeautifulSoup, msg_dt: datetime | None = None
+    ) -> list[dict]:
+        """Same as `parse`, on an already parsed document (left unmodified)."""
         pass
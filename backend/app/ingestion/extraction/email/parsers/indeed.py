@@ -19,6 +19,8 @@ class IndeedParser(EmailParser):
     Parser for Indeed "Job Alerts" emails
     """
 
+    senders = ("indeed.com",)
+
     # subject is in lower case
     keywords = ["python", "backend", "data", "engineer", "developer", "ai"]
 
@@ -37,9 +39,7 @@ class IndeedParser(EmailParser):
             kw in s_subject for kw in self.keywords
         )
 
-    def parse(self, html: str, msg_dt: datetime) -> list[dict]:
-        soup = BeautifulSoup(html, "html.parser")
-
+    def parse_soup(self, soup: BeautifulSoup, msg_dt: datetime) -> list[dict]:
         job_links = soup.select("td.pb-24 > a")
         jobs: list[dict] = []
 
@@ -61,12 +61,11 @@ class IndeedParser(EmailParser):
                     raw_url = title_tag.get("href")
 
             # --- Job Key and Canonical Url ---
+            job_key, canonical_url = None, None
             if raw_url:
                 result = normalize_job_url(str(raw_url))
                 if result is not None:
                     job_key, canonical_url = result
-                else:
-                    job_key, canonical_url = None, None
 
             # --- Company & Rating ---
             company = None
@@ -15,6 +15,8 @@ class LinkedInParser(EmailParser):
     Parser for LinkedIn "Job Alert" digest emails
     """
 
+    senders = ("linkedin.com",)
+
     # subject is in lower case
     keywords = ["python", "backend", "data", "engineer", "developer", "ai"]
 
@@ -31,8 +33,9 @@ class LinkedInParser(EmailParser):
             "linkedin" in s_sender or "jobalerts-noreply@linkedin.com" in s_sender
         ) and any(kw in s_subject for kw in self.keywords)
 
-    def parse(self, html: str, msg_dt: datetime | None = None) -> list[dict]:
-        soup = BeautifulSoup(html, "html.parser")
+    def parse_soup(
+        self, soup: BeautifulSoup, msg_dt: datetime | None = None
+    ) -> list[dict]:
         jobs: list[dict] = []
 
         job_cards = soup.find_all(
@@ -56,6 +59,7 @@ class LinkedInParser(EmailParser):
                 continue
 
             # --- Job Key and Canonical Url
+            job_key, canonical_url = None, None
             if raw_url:
                 result = normalize_job_url(str(raw_url))
                 if result:
@@ -0,0 +1,94 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/app/ingestion/extraction/email/search.py
+
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+
+GMAIL_EXTENSION = "X-GM-EXT-1"
+
+
+def since_date(days_back: int, now: datetime | None = None) -> str:
+    """
+    Generate IMAP SINCE query date string.
+
+    Args:
+        days_back: Number of days to subtract from current date
+        now: Reference date (default: current local time)
+
+    Returns:
+        Date string in IMAP format (DD-Mon-YYYY)
+    """
+    ref_date = (now or datetime.now()) - timedelta(days=days_back)
+    return ref_date.strftime("%d-%b-%Y")
+
+
+def quote(value: str) -> str:
+    """Quote a string argument for an IMAP command."""
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def build_from_criteria(senders: Sequence[str]) -> list[str]:
+    """
+    Compose OR-ed FROM criteria for several senders.
+
+    IMAP OR is a binary prefix operator, so N senders need N-1 leading ORs:
+    ``OR OR FROM a FROM b FROM c``.
+    """
+    if not senders:
+        return []
+
+    criteria = ["OR"] * (len(senders) - 1)
+    for sender in senders:
+        criteria += ["FROM", quote(sender)]
+    return criteria
+
+
+def build_gmail_raw_query(
+    days_back: int,
+    senders: Sequence[str],
+    sender_filter: str | None = None,
+) -> str:
+    """
+    Build a Gmail search query, e.g. ``from:(a OR b) newer_than:2d``.
+    """
+    parts: list[str] = []
+    if senders:
+        parts.append(f"from:({' OR '.join(senders)})")
+    if sender_filter:
+        parts.append(f"from:({sender_filter})")
+    parts.append(f"newer_than:{max(days_back, 1)}d")
+    return " ".join(parts)
+
+
+def build_search_criteria(
+    days_back: int,
+    senders: Sequence[str] = (),
+    gmail: bool = False,
+    sender_filter: str | None = None,
+) -> list[str]:
+    """
+    Build the SEARCH criteria used to select job alert emails.
+
+    When the server advertises the Gmail extension, the whole filter is
+    pushed into a single X-GM-RAW query. Otherwise standard SINCE/FROM
+    criteria are used.
+
+    Args:
+        days_back: Number of days to look back for emails
+        senders: Sender addresses to keep (empty means any sender)
+        gmail: Whether the server supports X-GM-RAW
+        sender_filter: Sender that must also match, AND-ed with `senders`
+
+    Returns:
+        List of criteria tokens to pass to IMAP SEARCH
+    """
+    if gmail:
+        query = build_gmail_raw_query(days_back, senders, sender_filter)
+        return ["X-GM-RAW", quote(query)]
+
+    # Search keys side by side are AND-ed
+    criteria = ["SINCE", since_date(days_back), *build_from_criteria(senders)]
+    if sender_filter:
+        criteria += ["FROM", quote(sender_filter)]
+    return criteria
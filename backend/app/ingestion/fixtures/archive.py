@@ -0,0 +1,188 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/app/ingestion/fixtures/archive.py
+
+import mmap
+import struct
+import zlib
+from pathlib import Path
+from typing import Protocol
+
+import orjson
+
+from app.utils.files import write_atomic
+
+try:
+    import zstandard
+except ImportError:  # optional, zlib is always available
+    zstandard = None
+
+ARCHIVE_SUFFIX = ".fxpack"
+MAGIC = b"JAFX1"
+FOOTER = struct.Struct("<QQ")
+
+CODECS = {"zlib": 0, "zstd": 1}
+
+
+def _compressor(codec: str):
+    if codec == "zlib":
+        return lambda data: zlib.compress(data, 6)
+    if codec == "zstd":
+        if zstandard is None:
+            raise ValueError("zstd codec requires the 'zstandard' package")
+        return zstandard.ZstdCompressor(level=10).compress
+    raise ValueError(f"Unknown codec: {codec}")
+
+
+def _decompressor(codec_id: int):
+    if codec_id == CODECS["zlib"]:
+        return zlib.decompress
+    if codec_id == CODECS["zstd"]:
+        if zstandard is None:
+            raise ValueError("Archive uses zstd, install the 'zstandard' package")
+        return zstandard.ZstdDecompressor().decompress
+    raise ValueError(f"Unknown codec id: {codec_id}")
+
+
+class FixtureStore(Protocol):
+    def ids(self) -> list[str]: ...
+
+    def names(self, fixture_id: str) -> list[str]: ...
+
+    def read(self, fixture_id: str, name: str) -> bytes: ...
+
+    def close(self) -> None: ...
+
+
+class FixtureDirectory:
+    """Fixtures of one platform stored as `<fixture_id>/<file>` directories."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def close(self) -> None:
+        pass
+
+    def ids(self) -> list[str]:
+        # Hidden `.<id>.tmp` directories are writes in progress (or aborted)
+        return sorted(
+            p.name
+            for p in self.path.iterdir()
+            if p.is_dir() and not p.name.startswith(".")
+        )
+
+    def names(self, fixture_id: str) -> list[str]:
+        return sorted(p.name for p in (self.path / fixture_id).iterdir())
+
+    def read(self, fixture_id: str, name: str) -> bytes:
+        return (self.path / fixture_id / name).read_bytes()
+
+
+class FixtureArchive:
+    """
+    Memory-mapped reader of a packed fixture archive.
+
+    An archive holds the fixtures of one platform in a single file:
+        MAGIC | codec (1 byte) | compressed files... | index (JSON) | footer
+
+    The footer holds the index offset and length followed by MAGIC, and the
+    index maps `fixture_id -> file name -> [offset, length]`. Each file is
+    compressed on its own, so only the requested files are decompressed.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with path.open("rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        size = len(self._map)
+        footer_start = size - FOOTER.size - len(MAGIC)
+        if (
+            footer_start < len(MAGIC) + 1
+            or self._map[: len(MAGIC)] != MAGIC
+            or self._map[footer_start + FOOTER.size :] != MAGIC
+        ):
+            self._map.close()
+            raise ValueError(f"Not a fixture archive: {path}")
+
+        index_offset, index_length = FOOTER.unpack_from(self._map, footer_start)
+        self._decompress = _decompressor(self._map[len(MAGIC)])
+        self._index: dict[str, dict[str, list[int]]] = orjson.loads(
+            self._map[index_offset : index_offset + index_length]
+        )
+
+    def __enter__(self) -> "FixtureArchive":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._map.close()
+
+    def ids(self) -> list[str]:
+        return sorted(self._index)
+
+    def names(self, fixture_id: str) -> list[str]:
+        return sorted(self._index[fixture_id])
+
+    def read(self, fixture_id: str, name: str) -> bytes:
+        try:
+            offset, length = self._index[fixture_id][name]
+        except KeyError:
+            raise FileNotFoundError(f"{fixture_id}/{name} not in {self.path}") from None
+        return self._decompress(self._map[offset : offset + length])
+
+
+def pack_directory(source: Path, archive: Path, codec: str = "zlib") -> int:
+    """
+    Pack the fixtures of one platform directory into `archive`.
+
+    Returns the number of packed fixtures.
+    """
+    compress = _compressor(codec)
+    store = FixtureDirectory(source)
+
+    chunks: list[bytes] = [MAGIC, bytes([CODECS[codec]])]
+    offset = len(MAGIC) + 1
+    index: dict[str, dict[str, list[int]]] = {}
+
+    for fixture_id in store.ids():
+        entries = index[fixture_id] = {}
+        for name in store.names(fixture_id):
+            blob = compress(store.read(fixture_id, name))
+            entries[name] = [offset, len(blob)]
+            chunks.append(blob)
+            offset += len(blob)
+
+    index_blob = orjson.dumps(index)
+    chunks += [index_blob, FOOTER.pack(offset, len(index_blob)), MAGIC]
+
+    write_atomic(archive, b"".join(chunks))
+    return len(index)
+
+
+def unpack_archive(archive: Path, destination: Path) -> int:
+    """
+    Restore the `<fixture_id>/<file>` layout of an archive.
+
+    Returns the number of unpacked fixtures.
+    """
+    with FixtureArchive(archive) as packed:
+        for fixture_id in packed.ids():
+            fixture_dir = destination / fixture_id
+            fixture_dir.mkdir(parents=True, exist_ok=True)
+            for name in packed.names(fixture_id):
+                write_atomic(fixture_dir / name, packed.read(fixture_id, name))
+        return len(packed.ids())
+
+
+def open_fixtures(root: Path, platform: str) -> FixtureStore:
+    """
+    Open the fixtures of a platform, preferring the packed archive.
+
+    The store must be closed once done with (an archive holds a mapping).
+    """
+    archive = root / f"{platform}{ARCHIVE_SUFFIX}"
+    if archive.exists():
+        return FixtureArchive(archive)
+    return FixtureDirectory(root / platform)
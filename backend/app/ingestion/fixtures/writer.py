@@ -1,33 +1,80 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # File: backend/app/ingestion/fixtures/writer.py
 
-import json
+import asyncio
 import shutil
-from datetime import UTC, date, datetime
+from collections.abc import Mapping
+from datetime import UTC, datetime
 from pathlib import Path
 
+from bs4 import BeautifulSoup
+
 from app.core.config import get_settings
 from app.ingestion.normalization.headers.pii import redact_headers
 from app.ingestion.normalization.headers.whitelist import whitelist_headers
 from app.ingestion.normalization.html.pii import redact_pii
 from app.ingestion.normalization.html.structural import strip_structure
-from app.ingestion.normalization.pii.patterns import (
-    build_email_pattern,
-    build_name_pattern,
-)
+from app.ingestion.normalization.pii.patterns import get_redaction_engine
+from app.utils.files import FileContent, dump_json, write_atomic, write_directory
 
 from .naming import format_fixture_date
 
 settings = get_settings()
 
 
+def fixture_dir_for(platform: str, uid: int, msg_date: datetime | None) -> Path:
+    date_str = format_fixture_date(msg_date or datetime.now(UTC))
+    return Path(settings.fixture_dir) / platform / f"{date_str}_{uid}"
+
+
+def build_fixture(
+    platform: str,
+    html: str,
+    headers: Mapping[str, str],
+    jobs: list[dict],
+    uid: int,
+    document: BeautifulSoup | None = None,
+) -> dict[str, FileContent]:
+    """
+    Render every fixture artifact, keyed by file name.
+
+    `document` is the tree already parsed from `html`, cleaned in place
+    with the structural rules of `platform`.
+    """
+    engine = get_redaction_engine()
+
+    sanitized_html_soup = strip_structure(
+        document if document is not None else html, platform
+    )
+    redact_pii(sanitized_html_soup, engine)
+
+    artifacts: dict[str, FileContent] = {
+        f"clean_{uid}.html": sanitized_html_soup.prettify(),
+        f"net_headers_{uid}.json": dump_json(
+            redact_headers(whitelist_headers(headers), engine)
+        ),
+    }
+
+    if jobs is not None:
+        artifacts[f"response_{uid}.json"] = dump_json(
+            {
+                "platform": platform,
+                "count": len(jobs),
+                "jobs": jobs,
+            }
+        )
+
+    return artifacts
+
+
 def create_fixture(
     platform: str,
     html: str,
-    headers: dict,
+    headers: Mapping[str, str],
     jobs: list[dict],
     uid: int,
     msg_date: datetime | None = None,
+    document: BeautifulSoup | None = None,
 ):
     """
     Generate fixture with extracted email:
@@ -37,47 +84,38 @@ def create_fixture(
     if not settings.debug:
         return  # no fixture generation in production
 
-    name_re = build_name_pattern()
-    email_re = build_email_pattern()
-
-    msg_date = msg_date or datetime.now(UTC)
-    date_str = format_fixture_date(msg_date)
-
-    # Raw email fixture
-    fixt_dir = Path(settings.fixture_dir) / platform / f"{date_str}_{uid}"
+    fixt_dir = fixture_dir_for(platform, uid, msg_date)
     fixt_dir.mkdir(parents=True, exist_ok=True)
 
-    sanitized_html_soup = strip_structure(html)
-    redact_pii(sanitized_html_soup, name_re, email_re)
-    clean_body_path = fixt_dir / f"clean_{uid}.html"
-    clean_body_path.write_text(sanitized_html_soup.prettify(), encoding="utf-8")
+    for name, content in build_fixture(
+        platform, html, headers, jobs, uid, document
+    ).items():
+        write_atomic(fixt_dir / name, content)
+
 
-    sanitized_headers = redact_headers(whitelist_headers(headers), name_re, email_re)
-    net_headers_path = fixt_dir / f"net_headers_{uid}.json"
-    net_headers_path.write_text(json.dumps(sanitized_headers, indent=2))
+async def acreate_fixture(
+    platform: str,
+    html: str,
+    headers: Mapping[str, str],
+    jobs: list[dict],
+    uid: int,
+    msg_date: datetime | None = None,
+    document: BeautifulSoup | None = None,
+):
+    """
+    Async `create_fixture`: artifacts are rendered in a worker thread, then
+    all files of the message are written concurrently, and the fixture
+    directory appears once complete.
+    """
+    if not settings.debug:
+        return  # no fixture generation in production
 
-    def _json_safe(obj):
-        if isinstance(obj, (datetime, date)):
-            return obj.isoformat()
-        if isinstance(obj, Path):
-            return str(obj)
-        return obj
+    fixt_dir = fixture_dir_for(platform, uid, msg_date)
+    artifacts = await asyncio.to_thread(
+        build_fixture, platform, html, headers, jobs, uid, document
+    )
 
-    if jobs is not None:
-        response_path = fixt_dir / f"response_{uid}.json"
-        response_path.write_text(
-            json.dumps(
-                {
-                    "platform": platform,
-                    "count": len(jobs),
-                    "jobs": jobs,
-                },
-                indent=2,
-                ensure_ascii=False,
-                default=_json_safe,
-            ),
-            encoding="utf-8",
-        )
+    await write_directory(fixt_dir, artifacts)
 
 
 def remove_all_fixtures():
@@ -0,0 +1,42 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/app/ingestion/generators/incremental.py
+
+import re
+import shutil
+from pathlib import Path
+
+# Generated entries are named `<YYYY-MM-DD>_<uid>` (see fixtures.naming)
+ENTRY_NAME = re.compile(r"^(\d{4}-\d{2}-\d{2})_(\d+)$")
+
+
+def existing_entries(platform_dir: Path) -> dict[int, Path]:
+    """Return uid -> directory of the entries already generated for a platform."""
+    if not platform_dir.is_dir():
+        return {}
+
+    entries: dict[int, Path] = {}
+    for path in platform_dir.iterdir():
+        match = ENTRY_NAME.match(path.name)
+        if match and path.is_dir():
+            entries[int(match.group(2))] = path
+    return entries
+
+
+def prune_entries(platform_dir: Path, keep: int) -> list[Path]:
+    """
+    Remove the oldest entries of a platform, keeping the `keep` newest
+    (by message date, then uid). Unknown files and directories are left
+    untouched.
+
+    Returns the removed directories.
+    """
+
+    def age(path: Path) -> tuple[str, int]:
+        date_str, uid = ENTRY_NAME.match(path.name).groups()
+        return date_str, int(uid)
+
+    entries = sorted(existing_entries(platform_dir).values(), key=age, reverse=True)
+    removed = entries[max(keep, 0) :]
+    for path in removed:
+        shutil.rmtree(path)
+    return removed
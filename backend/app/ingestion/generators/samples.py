@@ -1,16 +1,28 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # File: backend/app/ingestion/generators/samples.py
 
+import asyncio
+import logging
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from app.core.config import get_settings
 from app.ingestion.extraction.email.email_alert_fetcher import (
     EmailAlertFetcher,
     FetchedEmail,
 )
 from app.ingestion.extraction.email.parser_base import EmailParser
-from app.ingestion.samples.writer import create_sample, remove_all_samples
+from app.ingestion.generators.incremental import existing_entries, prune_entries
+from app.ingestion.samples.writer import acreate_sample, remove_all_samples
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
 
+# Sender domains, matched like the parsers' senders in the live fetch
 PLATFORMS: dict[str, str] = {
-    "indeed": "alert@indeed.com",
-    "linkedin": "jobalerts-noreply@linkedin.com",
+    "indeed": "indeed.com",
+    "linkedin": "linkedin.com",
 }
 
 
@@ -25,23 +37,57 @@ class SampleGenerator:
         self.parsers = parsers
         self.max_per_platform = max_per_platform
 
-    def generate(self, days_back: int = 7):
-        remove_all_samples()
+    def generate(self, days_back: int = 7, incremental: bool = False):
+        asyncio.run(self.agenerate(days_back, incremental))
+
+    async def agenerate(self, days_back: int = 7, incremental: bool = False):
+        """
+        Fetch the most recent alerts and write their samples.
+
+        Parsing and writing run in worker threads, so the samples of the
+        fetched emails are written while the next platform is fetched.
 
+        In incremental mode existing samples are kept: only messages without
+        a `<date>_<uid>` directory are downloaded and written, then each
+        platform is pruned to its `max_per_platform` newest samples.
+        """
+        if not incremental:
+            remove_all_samples()
+
+        root = Path(settings.sample_dir)
+        tasks: list[asyncio.Task] = []
         for platform, sender in PLATFORMS.items():
-            emails: list[FetchedEmail] = self.fetcher.fetch_recent(
-                days_back=days_back, sender_filter=sender
+            known = existing_entries(root / platform) if incremental else {}
+            emails: list[FetchedEmail] = await asyncio.to_thread(
+                self.fetcher.fetch_recent,
+                days_back=days_back,
+                sender_filter=sender,
+                limit=self.max_per_platform,
+                skip_uids=known.keys(),
             )
 
-            for email in emails[: self.max_per_platform]:
-                parser = self.parsers[platform]
-                jobs = parser.parse(email.html, email.msg_dt)
-
-                create_sample(
-                    platform=platform,
-                    html=email.html,
-                    headers=email.headers,
-                    jobs=jobs,
-                    uid=email.uid,
-                    msg_date=email.msg_dt,
-                )
+            for email in emails:
+                tasks.append(asyncio.create_task(self._write(platform, email)))
+
+        await asyncio.gather(*tasks)
+
+        if incremental:
+            for platform in PLATFORMS:
+                removed = prune_entries(root / platform, self.max_per_platform)
+                logger.info("Pruned %d old samples of %s", len(removed), platform)
+
+    async def _write(self, platform: str, email: FetchedEmail):
+        parser = self.parsers[platform]
+        # Parsed once: the writer cleans this tree after extraction
+        document = await asyncio.to_thread(BeautifulSoup, email.html, "html.parser")
+        jobs = await asyncio.to_thread(parser.parse_soup, document, email.msg_dt)
+
+        await acreate_sample(
+            platform=platform,
+            html=email.html,
+            headers=email.headers,
+            jobs=jobs,
+            uid=email.uid,
+            msg_date=email.msg_dt,
+            document=document,
+        )
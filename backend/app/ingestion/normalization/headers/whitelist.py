@@ -1,10 +1,11 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # File: backend/app/ingestion/normalization/headers/whitelist.py
 
+from collections.abc import Mapping
 
-def whitelist_headers(raw: dict[str, str]) -> dict[str, str]:
-    # 1. Whitelist of useful & safe headers
-    ALLOWED_KEYS = {
+# Whitelist of useful & safe headers
+ALLOWED_KEYS = frozenset(
+    {
         "from",
         "subject",
         "date",
@@ -20,5 +21,9 @@ def whitelist_headers(raw: dict[str, str]) -> dict[str, str]:
         "x-linkedin-class",
         "x-linkedin-template",
     }
+)
 
-    return {k.lower(): v for k, v in raw.items() if k.lower() in ALLOWED_KEYS}
+
+def whitelist_headers(raw: Mapping[str, str]) -> dict[str, str]:
+    # Only values of kept keys are read, so lazy mappings decode just those
+    return {k.lower(): raw[k] for k in raw if k.lower() in ALLOWED_KEYS}
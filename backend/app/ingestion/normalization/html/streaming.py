@@ -0,0 +1,203 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/app/ingestion/normalization/html/streaming.py
+
+from collections.abc import Iterable
+from html import escape
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any, TextIO
+
+from bs4.builder import HTMLTreeBuilder
+
+from app.ingestion.normalization.html.structural import get_rules, should_remove
+from app.ingestion.normalization.pii.engine import RedactionEngine
+
+CHUNK_SIZE = 64 * 1024
+
+# Elements without end tag: never enter skip mode for them
+VOID_ELEMENTS = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+
+
+# Space-separated attributes (class, rel...), lists for BeautifulSoup too
+LIST_ATTRIBUTES = HTMLTreeBuilder.DEFAULT_CDATA_LIST_ATTRIBUTES
+
+
+def _attributes(tag: str, attrs: list[tuple[str, str | None]]) -> dict[str, Any]:
+    """Attributes as BeautifulSoup gives them to rules: lists where multi-valued."""
+    list_names = LIST_ATTRIBUTES["*"] | LIST_ATTRIBUTES.get(tag, set())
+    return {
+        key: value.split() if key in list_names and value is not None else value
+        for key, value in attrs
+    }
+
+
+def _start_tag(name: str, attrs: dict[str, Any], closed: bool = False) -> str:
+    parts = [name]
+    for key, value in attrs.items():
+        if isinstance(value, list):
+            value = " ".join(value)
+        parts.append(key if value is None else f'{key}="{escape(str(value))}"')
+    return f"<{' '.join(parts)}{' /' if closed else ''}>"
+
+
+class StreamingSanitizer(HTMLParser):
+    """
+    Tokenizer-based equivalent of `strip_structure` followed by `redact_pii`.
+
+    Tokens are rewritten as they are parsed and written straight to `out`,
+    so no tree is built: memory stays proportional to the fed chunk (plus
+    the longest text node, which is buffered to be redacted as a whole,
+    since the tokenizer may split it across chunks).
+    The output is not prettified.
+
+    Open elements are tracked like BeautifulSoup does: an end tag closes
+    every element opened since its start tag, and stray end tags are
+    dropped. An unclosed removed element thus ends with its parent.
+    """
+
+    def __init__(
+        self,
+        out: TextIO,
+        engine: RedactionEngine,
+        platform: str | None = None,
+    ) -> None:
+        super().__init__(convert_charrefs=True)
+        self.out = out
+        self.engine = engine
+        self.rules = get_rules(platform)
+        # Names of the open elements, and position of the removed one
+        self._open: list[str] = []
+        self._skip_at: int | None = None
+        # Pieces of the current text node
+        self._text: list[str] = []
+
+    def _flush_text(self) -> None:
+        if not self._text:
+            return
+        data = "".join(self._text)
+        self._text.clear()
+        if self.cdata_elem is not None:
+            # Raw text of a kept <script>/<style>, must not be escaped
+            self.out.write(data)
+        else:
+            self.out.write(escape(self.engine.redact_text(data), quote=False))
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]):
+        if tag in VOID_ELEMENTS:
+            self.handle_startendtag(tag, attrs)
+            return
+
+        self._flush_text()
+        self._open.append(tag)
+        if self._skip_at is not None:
+            return
+
+        attributes = _attributes(tag, attrs)
+        if should_remove(tag, attributes, self.rules):
+            self._skip_at = len(self._open) - 1
+            return
+
+        self.engine.redact_attrs(tag, attributes)
+        self.out.write(_start_tag(tag, attributes))
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]):
+        self._flush_text()
+        if self._skip_at is not None:
+            return
+
+        attributes = _attributes(tag, attrs)
+        if should_remove(tag, attributes, self.rules):
+            return
+
+        self.engine.redact_attrs(tag, attributes)
+        self.out.write(_start_tag(tag, attributes, closed=True))
+
+    def handle_endtag(self, tag: str):
+        self._flush_text()
+        if tag not in self._open:
+            return
+
+        index = len(self._open) - 1 - self._open[::-1].index(tag)
+        self._close_from(index)
+
+    def _close_from(self, index: int) -> None:
+        """Close the open elements from `index` up, innermost first."""
+        kept = len(self._open) if self._skip_at is None else self._skip_at
+        for name in reversed(self._open[index:kept]):
+            self.out.write(f"</{name}>")
+        del self._open[index:]
+        if self._skip_at is not None and self._skip_at >= index:
+            self._skip_at = None
+
+    def handle_data(self, data: str):
+        if self._skip_at is None:
+            self._text.append(data)
+
+    def handle_comment(self, data: str):
+        # Outlook conditional comments (<!--[if mso]>) and all comments
+        self._flush_text()
+
+    def close(self) -> None:
+        super().close()
+        self._flush_text()
+        self._close_from(0)
+
+    def handle_decl(self, decl: str):
+        self._flush_text()
+        if self._skip_at is None:
+            self.out.write(f"<!{decl}>")
+
+    def handle_pi(self, data: str):
+        self._flush_text()
+        if self._skip_at is None:
+            self.out.write(f"<?{data}>")
+
+    def unknown_decl(self, data: str):
+        self._flush_text()
+        if self._skip_at is None:
+            self.out.write(f"<![{data}]>")
+
+
+def sanitize_stream(
+    chunks: Iterable[str],
+    out: TextIO,
+    engine: RedactionEngine,
+    platform: str | None = None,
+) -> None:
+    """Sanitize HTML fed chunk by chunk, writing the result to `out`."""
+    sanitizer = StreamingSanitizer(out, engine, platform)
+    for chunk in chunks:
+        sanitizer.feed(chunk)
+    sanitizer.close()
+
+
+def sanitize_file(
+    src: Path,
+    dst: Path,
+    engine: RedactionEngine,
+    platform: str | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> None:
+    """Write a sanitized copy of the HTML file `src` to `dst`."""
+    with (
+        src.open(encoding="utf-8", errors="replace") as reader,
+        dst.open("w", encoding="utf-8") as writer,
+    ):
+        chunks = iter(lambda: reader.read(chunk_size), "")
+        sanitize_stream(chunks, writer, engine, platform)
@@ -1,48 +1,113 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # File: backend/app/ingestion/normalization/html/structural.py
 
-from bs4 import BeautifulSoup, Comment
+from collections.abc import Callable, Mapping
+from typing import Any
 
-from app.core.config import get_settings
+from bs4 import BeautifulSoup, Comment, Tag
 
-settings = get_settings()
+# A rule receives the attributes of a tag and returns True to drop the tag
+TagRule = Callable[[Mapping[str, Any]], bool]
 
 
-def strip_structure(html: str) -> BeautifulSoup:
-    """"""
-    soup = BeautifulSoup(html, "html.parser")
+def _always(attrs: Mapping[str, Any]) -> bool:
+    return True
 
-    # # --- 1. Remove all <style> blocks (media queries + hacks)
-    for style in soup.find_all("style"):
-        style.decompose()
 
-    # --- 2. Remove Outlook conditionnal comments and all comments
-    for element in soup(text=lambda t: isinstance(t, Comment)):
-        # Remove comments like <!--[if mso]> ... <![endif]-->
-        if "if" in element or "mso" in element or "endif" in element:
-            element.extract()
+def _is_hidden(attrs: Mapping[str, Any]) -> bool:
+    # Preview text is hidden with inline styles
+    style = str(attrs.get("style", "")) or ""
+    return "display:none" in style or "max-height:0" in style
+
+
+def _is_tracking_pixel(attrs: Mapping[str, Any]) -> bool:
+    w = attrs.get("width", "")
+    h = attrs.get("height", "")
+    return w in ("1", "0", "1px") or h in ("1", "0", "1px")
+
+
+# tag name -> removal rules, shared by every platform
+STRUCTURAL_RULES: dict[str, list[TagRule]] = {
+    # --- 1. <style> blocks (media queries + hacks)
+    "style": [_always],
+    # --- 2. Preview text (hidden divs)
+    "div": [_is_hidden],
+    # --- 3. Tracking pixels
+    "img": [_is_tracking_pixel],
+    # --- 4. Meta tags (useless for readability)
+    "meta": [_always],
+    # --- 5. <script> tags (rare in emails)
+    "script": [_always],
+}
+
+# platform -> tag name -> additional removal rules
+PLATFORM_RULES: dict[str, dict[str, list[TagRule]]] = {}
+
+
+def register_rule(tag: str, rule: TagRule, platform: str | None = None) -> None:
+    """Register a removal rule, globally or for a single platform."""
+    table = (
+        STRUCTURAL_RULES
+        if platform is None
+        else PLATFORM_RULES.setdefault(platform, {})
+    )
+    table.setdefault(tag, []).append(rule)
+
+
+def get_rules(platform: str | None = None) -> dict[str, list[TagRule]]:
+    """Return the merged rule table for a platform."""
+    if platform is None or platform not in PLATFORM_RULES:
+        return STRUCTURAL_RULES
+
+    merged = {tag: list(rules) for tag, rules in STRUCTURAL_RULES.items()}
+    for tag, rules in PLATFORM_RULES[platform].items():
+        merged.setdefault(tag, []).extend(rules)
+    return merged
+
+
+def should_remove(
+    name: str,
+    attrs: Mapping[str, Any],
+    rules: Mapping[str, list[TagRule]],
+) -> bool:
+    tag_rules = rules.get(name)
+    return bool(tag_rules) and any(rule(attrs) for rule in tag_rules)
+
+
+def strip_structure(
+    html: str | BeautifulSoup, platform: str | None = None
+) -> BeautifulSoup:
+    """
+    Remove noise (styles, comments, hidden preview text, tracking pixels,
+    meta and script tags) in a single traversal of the tree.
+
+    An already parsed document is cleaned in place and returned, which
+    lets callers reuse the tree they parsed for job extraction.
+    """
+    soup = (
+        html if isinstance(html, BeautifulSoup) else BeautifulSoup(html, "html.parser")
+    )
+    rules = get_rules(platform)
+
+    removals = []
+    stack: list[Tag] = [soup]
+    while stack:
+        node = stack.pop()
+        for child in node.contents:
+            if isinstance(child, Tag):
+                if should_remove(child.name, child.attrs, rules):
+                    # Whole subtree goes away, no need to visit it
+                    removals.append(child)
+                else:
+                    stack.append(child)
+            # Outlook conditional comments (<!--[if mso]>) and all comments
+            elif isinstance(child, Comment):
+                removals.append(child)
+
+    for element in removals:
+        if isinstance(element, Tag):
+            element.decompose()
         else:
             element.extract()
 
-    # --- 3. Remove preview text (hidden divs)
-    for div in soup.find_all("div"):
-        style = str(div.get("style", "")) or ""
-        if "display:none" in style or "max-height:0" in style:
-            div.decompose()
-
-    # --- 4. Remove tracking pixels
-    for img in soup.find_all("img"):
-        w = img.get("width", "")
-        h = img.get("height", "")
-        if w in ("1", "0", "1px") or h in ("1", "0", "1px"):
-            img.decompose()
-
-    # --- 5. Remove meta tags (useless for readability)
-    for meta in soup.find_all("meta"):
-        meta.decompose()
-
-    # --- 6. Remove <script> tags (rare in emails)
-    for script in soup.find_all("script"):
-        script.decompose()
-
     return soup
@@ -0,0 +1,106 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/app/ingestion/normalization/pii/engine.py
+
+import re
+from collections.abc import Mapping, MutableMapping
+from typing import Any
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+from app.ingestion.normalization.url.sanitize import sanitize_job_url
+
+REDACTED = "[REDACTED]"
+
+# Links kept (with tracking params redacted) because parsers need them
+JOB_URL_MARKERS = (
+    "/rc/clk/",
+    "/pagead/clk/",
+    "/jobs/view/",
+)
+
+# Headers whose whole value is an identifier
+REDACTED_HEADERS = frozenset({"message-id", "message_id"})
+
+
+def _scoped(pattern: re.Pattern[str]) -> str:
+    # Keep verbose mode local to the pattern that was written for it
+    if pattern.flags & re.VERBOSE:
+        return f"(?x:{pattern.pattern})"
+    return f"(?:{pattern.pattern})"
+
+
+class RedactionEngine:
+    """
+    Single compiled matcher for every piece of PII (names and emails).
+
+    All patterns are merged into one case-insensitive alternation, so each
+    text node, attribute or header value is scanned exactly once. Email
+    patterns come first: a full address wins over a name found inside it.
+    """
+
+    def __init__(
+        self,
+        name_re: re.Pattern[str] | None,
+        email_re: re.Pattern[str] | None,
+    ) -> None:
+        parts = [_scoped(p) for p in (email_re, name_re) if p is not None]
+        self.pattern: re.Pattern[str] | None = (
+            re.compile("|".join(parts), flags=re.IGNORECASE) if parts else None
+        )
+
+    def search(self, text: str) -> bool:
+        return self.pattern is not None and self.pattern.search(text) is not None
+
+    def redact_text(self, text: str) -> str:
+        if self.pattern is None:
+            return text
+        return self.pattern.sub(REDACTED, text)
+
+    def redact_href(self, href: str) -> str:
+        """Keep job links with tracking params redacted, drop all others."""
+        href = self.redact_text(href)
+        if any(marker in href for marker in JOB_URL_MARKERS):
+            return sanitize_job_url(href)
+        return REDACTED
+
+    def redact_alt(self, alt: str) -> str | None:
+        """Return the redacted alt text, or None if it holds no PII."""
+        if not self.search(alt):
+            return None
+        return self.redact_text(alt)
+
+    def redact_soup(self, soup: BeautifulSoup) -> None:
+        """Redact text nodes, img alt/src and link hrefs in one traversal."""
+        stack: list[Tag] = [soup]
+        while stack:
+            node = stack.pop()
+            for child in list(node.contents):
+                if isinstance(child, Tag):
+                    self._redact_tag(child)
+                    stack.append(child)
+                elif isinstance(child, NavigableString) and self.search(child):
+                    child.replace_with(self.redact_text(child))
+
+    def redact_headers(self, headers: Mapping[str, str]) -> dict[str, str]:
+        cleaned = {}
+        for k, v in headers.items():
+            cleaned[k] = REDACTED if k in REDACTED_HEADERS else self.redact_text(v)
+        return cleaned
+
+    def redact_attrs(self, name: str, attrs: MutableMapping[str, Any]) -> None:
+        """Redact img alt/src and link hrefs of a tag, given its attributes."""
+        if name == "img":
+            alt = attrs.get("alt")
+            if alt:
+                redacted = self.redact_alt(str(alt))
+                if redacted is not None:
+                    attrs["alt"] = redacted
+                    # Redact src if alt contained personal info
+                    if attrs.get("src"):
+                        attrs["src"] = REDACTED
+
+        elif name == "a" and attrs.get("href") is not None:
+            attrs["href"] = self.redact_href(str(attrs["href"]))
+
+    def _redact_tag(self, tag: Tag) -> None:
+        self.redact_attrs(tag.name, tag.attrs)
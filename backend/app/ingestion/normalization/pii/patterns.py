@@ -2,47 +2,89 @@
 # File: backend/app/ingestion/normalization/pii/patterns.py
 
 import re
+from functools import lru_cache
 
-from app.core.config import get_settings
+from app.core.config import Settings, get_settings
+from app.ingestion.normalization.pii.engine import RedactionEngine
 
-settings = get_settings()
 
+def _unique(values: list[str]) -> tuple[str, ...]:
+    cleaned = (v.strip() for v in values if v and v.strip())
+    return tuple(dict.fromkeys(cleaned))
 
-def build_name_pattern() -> re.Pattern[str] | None:
-    parts: list[str] = []
 
-    if settings.user_first_name:
-        parts.append(re.escape(settings.user_first_name.strip()))
+def redaction_names(settings: Settings) -> tuple[str, ...]:
+    """Names to redact: the user's first/last name plus extra identities."""
+    return _unique(
+        [settings.user_first_name, settings.user_last_name, *settings.pii_extra_names]
+    )
 
-    if settings.user_last_name:
-        parts.append(re.escape(settings.user_last_name.strip()))
 
-    if not parts:
+def redaction_emails(settings: Settings) -> tuple[str, ...]:
+    """Addresses to redact: the user's address plus extra identities."""
+    return _unique([settings.email_address, *settings.pii_extra_emails])
+
+
+@lru_cache(maxsize=32)
+def compile_name_pattern(names: tuple[str, ...]) -> re.Pattern[str] | None:
+    if not names:
         return None
 
-    # Matches first and/or last name, case insentitive
+    # Longest first, so "Jean-Pierre" wins over "Jean"
+    parts = [re.escape(name) for name in sorted(names, key=len, reverse=True)]
+
+    # Matches any of the names, case insentitive
     pattern = rf"\b({'|'.join(parts)})\b"
     return re.compile(pattern, flags=re.IGNORECASE)
 
 
-def build_email_pattern() -> re.Pattern[str] | None:
-    if not settings.email_address:
+@lru_cache(maxsize=32)
+def compile_email_pattern(emails: tuple[str, ...]) -> re.Pattern[str] | None:
+    if not emails:
         return None
 
-    raw_email = settings.email_address.strip()
-    escaped_email = re.escape(raw_email)
-    encoded_email = re.escape(raw_email.replace("@", "%40"))
+    alternatives: list[str] = []
+    for raw_email in emails:
+        escaped_email = re.escape(raw_email)
+        encoded_email = re.escape(raw_email.replace("@", "%40"))
+
+        # Matches:
+        # - youremail@example.com
+        # - <youremail@example.com>
+        # - youremail%40example.com
+        alternatives += [f"<{escaped_email}>", escaped_email, encoded_email]
 
-    # Matches:
-    # - youremail@example.com
-    # - <youremail@example.com>
-    # - youremail%40example.com
     pattern = rf"""
         (?:
-            <{escaped_email}> |
-            {escaped_email} |
-            {encoded_email}
+            {" | ".join(alternatives)}
         )
     """
 
     return re.compile(pattern, flags=re.IGNORECASE | re.VERBOSE)
+
+
+def build_name_pattern(settings: Settings | None = None) -> re.Pattern[str] | None:
+    return compile_name_pattern(redaction_names(settings or get_settings()))
+
+
+def build_email_pattern(settings: Settings | None = None) -> re.Pattern[str] | None:
+    return compile_email_pattern(redaction_emails(settings or get_settings()))
+
+
+@lru_cache(maxsize=32)
+def _redaction_engine(
+    names: tuple[str, ...],
+    emails: tuple[str, ...],
+) -> RedactionEngine:
+    return RedactionEngine(compile_name_pattern(names), compile_email_pattern(emails))
+
+
+def get_redaction_engine(settings: Settings | None = None) -> RedactionEngine:
+    """
+    Return the compiled matcher for the configured identities.
+
+    Memoized on the settings values, so a change in settings yields a new
+    engine while repeated calls reuse the same compiled patterns.
+    """
+    settings = settings or get_settings()
+    return _redaction_engine(redaction_names(settings), redaction_emails(settings))
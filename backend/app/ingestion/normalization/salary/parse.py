@@ -0,0 +1,202 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/app/ingestion/normalization/salary/parse.py
+
+import re
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy.dialects.postgresql import Range
+
+from app.models.job_posting import SalaryPeriod
+
+# Paid periods in a year (35 h weeks, 230 worked days)
+PERIODS_PER_YEAR = {
+    SalaryPeriod.HOUR: Decimal(1820),
+    SalaryPeriod.DAY: Decimal(230),
+    SalaryPeriod.WEEK: Decimal(52),
+    SalaryPeriod.MONTH: Decimal(12),
+    SalaryPeriod.YEAR: Decimal(1),
+}
+
+PERIOD_PATTERNS = (
+    (
+        SalaryPeriod.HOUR,
+        re.compile(
+            r"par heure|de l['’]heure|an hour|per hour|hourly|/\s*h(?:eure|our|r)?\b"
+        ),
+    ),
+    (SalaryPeriod.DAY, re.compile(r"par jour|a day|per day|daily|/\s*(?:jour|day)\b")),
+    (
+        SalaryPeriod.WEEK,
+        re.compile(r"par semaine|a week|per week|weekly|/\s*(?:semaine|week)\b"),
+    ),
+    (
+        SalaryPeriod.MONTH,
+        re.compile(r"par mois|mensuel|a month|per month|monthly|/\s*(?:mois|month)\b"),
+    ),
+    (
+        SalaryPeriod.YEAR,
+        re.compile(
+            r"par an\b|annuel|a year|per year|per annum|annual|yearly|/\s*(?:an|year)\b"
+        ),
+    ),
+)
+
+CURRENCY_PATTERNS = (
+    ("EUR", re.compile(r"€|\beur(?:os?)?\b")),
+    ("GBP", re.compile(r"£|\bgbp\b")),
+    ("CHF", re.compile(r"\bchf\b")),
+    ("CAD", re.compile(r"\bcad\b|c\$")),
+    ("USD", re.compile(r"\$|\busd\b")),
+)
+
+SALARY_COLUMNS = (
+    "salary_min",
+    "salary_max",
+    "salary_currency",
+    "salary_period",
+    "salary_yearly",
+)
+
+# Without a stated period, amounts in thousands ("60k", "45 000") are yearly
+YEARLY_THRESHOLD = Decimal(10_000)
+
+CURRENCY_SYMBOL = r"(?:€|c\$|\$|£|eur(?:os?)?\b|usd\b|gbp\b|chf\b|cad\b)"
+
+# "45 000", "45,000", "45.000", "12,50", "50k", with an attached currency
+AMOUNT_RE = re.compile(
+    rf"(?P<before>{CURRENCY_SYMBOL}\s?)?"
+    r"(?P<int>\d{1,3}(?:[ .,]\d{3})+|\d+)(?:[.,](?P<dec>\d{1,2})(?!\d))?"
+    r"(?:\s?(?P<k>k\b))?"
+    rf"(?P<after>\s?{CURRENCY_SYMBOL})?"
+)
+# Text between the two bounds of a range: "40 - 45k", "de 40 à 45 k€"
+RANGE_SEPARATOR_RE = re.compile(r"\s*(?:-|–|—|à|a|to|et|and)\s*")
+FROM_RE = re.compile(r"\b(?:à partir de|a partir de|from|starting at|min(?:imum)?)\b")
+# Typographic apostrophes (’) are common in emails
+UP_TO_RE = re.compile(r"\b(?:jusqu['’][àa]|up to|max(?:imum)?)\b")
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedSalary:
+    """
+    Structured salary of a job posting.
+
+    Attributes:
+        min_amount: Lower bound, None for "up to" salaries.
+        max_amount: Upper bound, None for "from" salaries.
+        currency: ISO 4217 code, None when not stated.
+        period: What the amounts are paid for, None when not stated.
+    """
+
+    min_amount: Decimal | None
+    max_amount: Decimal | None
+    currency: str | None
+    period: SalaryPeriod | None
+
+    def yearly_bounds(self) -> tuple[Decimal | None, Decimal | None] | None:
+        """Bounds brought to a yearly amount, None without a period."""
+        if self.period is None:
+            return None
+        factor = PERIODS_PER_YEAR[self.period]
+        return (
+            None if self.min_amount is None else self.min_amount * factor,
+            None if self.max_amount is None else self.max_amount * factor,
+        )
+
+
+def _amount(match: re.Match[str]) -> Decimal:
+    value = Decimal(re.sub(r"\D", "", match["int"]))
+    if match["dec"]:
+        value += Decimal(match["dec"]) / 10 ** len(match["dec"])
+    if match["k"]:
+        value *= 1000
+    return value
+
+
+def _has_unit(match: re.Match[str]) -> bool:
+    return bool(match["before"] or match["k"] or match["after"])
+
+
+def _bounds(text: str) -> list[re.Match[str]]:
+    """
+    The amounts of `text` that are salary bounds: a range pair, or one amount.
+
+    A number is a bound when a currency or `k` is attached to it, or when
+    it is joined to such an amount by a range separator: "35h" or "Bac+5"
+    are left out.
+    """
+    matches = list(AMOUNT_RE.finditer(text))
+    for low, high in zip(matches, matches[1:], strict=False):
+        between = text[low.end() : high.start()]
+        if RANGE_SEPARATOR_RE.fullmatch(between) and (
+            _has_unit(low) or _has_unit(high)
+        ):
+            return [low, high]
+    return [m for m in matches if _has_unit(m)][:1]
+
+
+def parse_salary(text: str | None) -> ParsedSalary | None:
+    """
+    Parse a salary as written by job boards, in French or English.
+
+    e.g. "45 000 € - 55 000 € par an", "De 12,50 € à 14 € de l'heure",
+    "Up to $90K a year". Returns None when no salary amount is found.
+
+    Without a stated period, amounts written in thousands ("60k-70k") or
+    above YEARLY_THRESHOLD are taken as yearly; smaller ones keep no
+    period, and thus no yearly range.
+    """
+    if not text:
+        return None
+
+    # Non-breaking spaces are common thousand separators
+    text = re.sub(r"[  ]", " ", text).lower()
+
+    bounds = _bounds(text)
+    if not bounds:
+        return None
+    amounts = [_amount(m) for m in bounds]
+
+    if len(bounds) == 2:
+        # "40-45k": the low bound shares the thousands of the high one
+        if bounds[1]["k"] and not bounds[0]["k"] and amounts[0] < 1000:
+            amounts[0] *= 1000
+        low, high = min(amounts), max(amounts)
+    elif UP_TO_RE.search(text):
+        low, high = None, amounts[0]
+    elif FROM_RE.search(text):
+        low, high = amounts[0], None
+    else:
+        low = high = amounts[0]
+
+    currency = next((code for code, p in CURRENCY_PATTERNS if p.search(text)), None)
+    period = next((period for period, p in PERIOD_PATTERNS if p.search(text)), None)
+    if period is None and (
+        any(m["k"] for m in bounds) or max(amounts) >= YEARLY_THRESHOLD
+    ):
+        period = SalaryPeriod.YEAR
+
+    return ParsedSalary(low, high, currency, period)
+
+
+def salary_columns(text: str | None) -> dict[str, Any]:
+    """
+    Values of the parsed salary columns of JobPosting for `text`.
+
+    Every column is set (None when unparsed), so that a changed salary
+    overwrites the previous parse.
+    """
+    parsed = parse_salary(text)
+    if parsed is None:
+        return dict.fromkeys(SALARY_COLUMNS)
+
+    yearly = parsed.yearly_bounds()
+    return {
+        "salary_min": parsed.min_amount,
+        "salary_max": parsed.max_amount,
+        "salary_currency": parsed.currency,
+        "salary_period": parsed.period,
+        "salary_yearly": None if yearly is None else Range(*yearly, bounds="[]"),
+    }
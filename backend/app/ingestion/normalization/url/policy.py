@@ -3,7 +3,10 @@
 
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # File: backend/app/normalization/url/policy.py
-from urllib.parse import urlparse
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from urllib.parse import SplitResult, urlsplit
 
 LINKEDIN_JOBSVIEW_REDACT_KEYS = frozenset(
     {
@@ -40,21 +43,81 @@ INDEED_RK_REDACT_KEYS = frozenset(
 )
 
 
-def get_job_url_policy(url: str) -> frozenset[str] | None:
-    parsed = urlparse(url)
-    path = parsed.path
-
-    # --- Indeed ---
-    if "indeed.com" in parsed.netloc:
-        if "/rc/clk/" in path:
-            return INDEED_RK_REDACT_KEYS
-        if "/pagead/clk/" in path:
-            return INDEED_PAGEAD_REDACT_KEYS
-        return None
+@dataclass(frozen=True, slots=True)
+class UrlHandler:
+    """
+    How to handle job links of one platform.
+
+    Attributes:
+        key_pattern: Compiled regex whose first group is the job key.
+        canonical_template: Canonical URL, formatted with `job_key`.
+        policies: (path marker, query keys to redact) pairs, first match wins.
+    """
+
+    key_pattern: re.Pattern[str] | None = None
+    canonical_template: str = ""
+    policies: tuple[tuple[str, frozenset[str]], ...] = ()
 
-    if "linkedin.com" in parsed.netloc:
-        if "/jobs/view/" in path:
-            return LINKEDIN_JOBSVIEW_REDACT_KEYS
+    def normalize(self, url: str) -> tuple[str, str] | None:
+        if self.key_pattern is None:
+            return None
+        match = self.key_pattern.search(url)
+        if match is None:
+            return None
+        job_key = match.group(1)
+        return job_key, self.canonical_template.format(job_key=job_key)
+
+    def redact_keys(self, path: str) -> frozenset[str] | None:
+        for marker, keys in self.policies:
+            if marker in path:
+                return keys
         return None
 
+
+# registrable domain -> handler, subdomains (fr.indeed.com) included
+URL_HANDLERS: dict[str, UrlHandler] = {
+    "indeed.com": UrlHandler(
+        key_pattern=re.compile(r"jk=(\w+)"),
+        canonical_template="https://indeed.com/viewjob?jk={job_key}",
+        policies=(
+            ("/rc/clk/", INDEED_RK_REDACT_KEYS),
+            ("/pagead/clk/", INDEED_PAGEAD_REDACT_KEYS),
+        ),
+    ),
+    "linkedin.com": UrlHandler(
+        key_pattern=re.compile(r"/jobs/view/(\d+)"),
+        canonical_template="https://www.linkedin.com/jobs/view/{job_key}",
+        policies=(("/jobs/view/", LINKEDIN_JOBSVIEW_REDACT_KEYS),),
+    ),
+}
+
+
+@lru_cache(maxsize=1024)
+def handler_for_host(host: str | None) -> UrlHandler | None:
+    """Return the handler of a host or of its closest registered parent."""
+    if not host:
+        return None
+    labels = host.lower().split(".")
+    for i in range(len(labels) - 1):
+        handler = URL_HANDLERS.get(".".join(labels[i:]))
+        if handler is not None:
+            return handler
     return None
+
+
+def split_url(url: str) -> SplitResult | None:
+    """Split a URL, None when malformed (e.g. `http://[`)."""
+    try:
+        parts = urlsplit(url)
+        parts.hostname  # noqa: B018 - validates the netloc
+    except ValueError:
+        return None
+    return parts
+
+
+def get_job_url_policy(url: str) -> frozenset[str] | None:
+    parts = split_url(url)
+    if parts is None:
+        return None
+    handler = handler_for_host(parts.hostname)
+    return handler.redact_keys(parts.path) if handler else None
@@ -0,0 +1,177 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/app/ingestion/normalization/url/resolver.py
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+import httpx
+
+from app.ingestion.normalization.url.sanitize import normalize_job_url
+
+logger = logging.getLogger(__name__)
+
+# (job_key, canonical_url), or None when the link leads to no job
+Resolution = tuple[str, str] | None
+
+
+class RedirectCache:
+    """
+    Persistent raw URL -> canonical job mapping, backed by SQLite.
+
+    Negative results are cached too, so footer and tracking links that
+    never lead to a job are not requested again before the TTL expires.
+
+    The connection is shared by the worker threads of `UrlResolver`,
+    behind a lock.
+    """
+
+    def __init__(self, path: str | Path, ttl: float = 30 * 24 * 3600) -> None:
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS url_redirects (
+                raw_url TEXT PRIMARY KEY,
+                job_key TEXT,
+                canonical_url TEXT,
+                resolved_at REAL NOT NULL
+            )
+            """
+        )
+
+    def get(self, raw_url: str) -> tuple[bool, Resolution]:
+        """Return (hit, resolution), expired entries are misses."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT job_key, canonical_url, resolved_at FROM url_redirects "
+                "WHERE raw_url = ?",
+                (raw_url,),
+            ).fetchone()
+        if row is None or time.time() - row[2] > self.ttl:
+            return False, None
+        job_key, canonical_url, _ = row
+        return True, (job_key, canonical_url) if job_key else None
+
+    def set(self, raw_url: str, resolution: Resolution) -> None:
+        job_key, canonical_url = resolution or (None, None)
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO url_redirects VALUES (?, ?, ?, ?)",
+                (raw_url, job_key, canonical_url, time.time()),
+            )
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+class UrlResolver:
+    """
+    Follow the redirects of tracked job links to find their job key.
+
+    Links like Indeed `/pagead/clk/` carry no `jk=`: they are requested
+    hop by hop (without downloading bodies) until a URL known to
+    `normalize_job_url` shows up. Requests share one pooled client and are
+    bounded by a semaphore; cache lookups run in worker threads.
+    """
+
+    def __init__(
+        self,
+        cache: RedirectCache | None = None,
+        client: httpx.AsyncClient | None = None,
+        max_concurrency: int = 8,
+        max_redirects: int = 10,
+        timeout: float = 10.0,
+    ) -> None:
+        self.cache = cache
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_concurrency),
+            headers={"User-Agent": "Mozilla/5.0 (compatible; jobai-agent)"},
+        )
+        self.max_redirects = max_redirects
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def __aenter__(self) -> "UrlResolver":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def resolve(self, raw_url: str) -> Resolution:
+        """Return (job_key, canonical_url) for a link, or None."""
+        direct = normalize_job_url(raw_url)
+        if direct is not None:
+            return direct
+
+        if self.cache is not None:
+            hit, resolution = await asyncio.to_thread(self.cache.get, raw_url)
+            if hit:
+                return resolution
+
+        try:
+            async with self._semaphore:
+                resolution = await self._follow(raw_url)
+        except (httpx.HTTPError, httpx.InvalidURL, ValueError) as exc:
+            # Transient failure or malformed link/Location: do not cache,
+            # the job keeps its unresolved URL
+            logger.warning("Could not resolve %s: %s", raw_url, exc)
+            return None
+
+        if self.cache is not None:
+            await asyncio.to_thread(self.cache.set, raw_url, resolution)
+        return resolution
+
+    async def resolve_many(self, raw_urls: Iterable[str]) -> dict[str, Resolution]:
+        """Resolve distinct URLs concurrently."""
+        urls = list(dict.fromkeys(raw_urls))
+        results = await asyncio.gather(*(self.resolve(url) for url in urls))
+        return dict(zip(urls, results, strict=True))
+
+    async def _follow(self, url: str) -> Resolution:
+        for _ in range(self.max_redirects):
+            request = self.client.build_request("GET", url)
+            response = await self.client.send(request, stream=True)
+            await response.aclose()
+
+            if not response.has_redirect_location:
+                return None
+
+            url = str(response.url.join(response.headers["location"]))
+            resolution = normalize_job_url(url)
+            if resolution is not None:
+                return resolution
+        return None
+
+
+async def resolve_missing_job_keys(jobs: list[dict], resolver: UrlResolver) -> int:
+    """
+    Fill `job_key` and `canonical_url` of jobs whose raw URL had none.
+
+    Returns the number of jobs that gained a job key.
+    """
+    pending = [job for job in jobs if not job.get("job_key") and job.get("raw_url")]
+    if not pending:
+        return 0
+
+    resolutions = await resolver.resolve_many(job["raw_url"] for job in pending)
+
+    resolved = 0
+    for job in pending:
+        resolution = resolutions[job["raw_url"]]
+        if resolution is not None:
+            job["job_key"], job["canonical_url"] = resolution
+            resolved += 1
+    return resolved
@@ -4,19 +4,29 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # File: backend/app/normalization/url/sanitize.py
 
-import re
-from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+from functools import lru_cache
+from urllib.parse import parse_qsl, urlencode, urlunsplit
 
-from app.ingestion.normalization.url.policy import get_job_url_policy
+from app.ingestion.normalization.url import policy
+from app.ingestion.normalization.url.policy import (
+    UrlHandler,
+    handler_for_host,
+    split_url,
+)
 
+# Tracking and footer links repeat across every email of a platform
+URL_CACHE_SIZE = 8192
 
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
 def normalize_job_url(raw_url: str) -> tuple[str, str] | None:
     """
     Normalize a raw job posting URL from supported platforms.
 
     This function extracts a unique job identifier and constructs a canonical URL
-    for job postings from Indeed and LinkedIn. If the URL does not match a supported
-    pattern, None is returned.
+    for job postings of the platforms registered in the URL handler table
+    (Indeed and LinkedIn). If the URL does not match a supported pattern,
+    None is returned.
 
     Args:
         raw_url: The raw URL string to normalize.
@@ -26,34 +36,25 @@ def normalize_job_url(raw_url: str) -> tuple[str, str] | None:
         where:
             - job_key: The unique job identifier extracted from the URL.
             - canonical_url: The normalized, canonical URL for the job posting.
-        Returns None if the URL does not match a supported pattern.
+        Returns None if the URL does not match a supported pattern or is
+        malformed.
     """
-    # --- Indeed ---
-    if "indeed.com" in raw_url:
-        match = re.search(r"jk=([\w]+)", raw_url)
-        if match:
-            job_key = match.group(1)
-            canonical_url = f"https://indeed.com/viewjob?jk={match.group(1)}"
-            return job_key, canonical_url
-
-    # --- LinkedIn ---
-    if "linkedin.com" in raw_url:
-        match = re.search(r"/jobs/view/(\d+)", raw_url)
-        if match:
-            job_key = match.group(1)
-            canonical_url = f"https://www.linkedin.com/jobs/view/{match.group(1)}"
-            return job_key, canonical_url
-
-    return None
+    parts = split_url(raw_url)
+    handler = handler_for_host(parts.hostname) if parts else None
+    return handler.normalize(raw_url) if handler else None
 
 
+@lru_cache(maxsize=URL_CACHE_SIZE)
 def sanitize_job_url(raw_url: str) -> str:
-    redact_keys = get_job_url_policy(raw_url)
+    parts = split_url(raw_url)
+    if parts is None:
+        return raw_url
+    handler = handler_for_host(parts.hostname)
+    redact_keys = handler.redact_keys(parts.path) if handler else None
     if not redact_keys:
         return raw_url
 
-    parsed = urlparse(raw_url)
-    query_params = parse_qsl(parsed.query, keep_blank_values=True)
+    query_params = parse_qsl(parts.query, keep_blank_values=True)
 
     redacted_params = [
         (key, "REDACTED") if key in redact_keys else (key, value)
@@ -62,4 +63,12 @@ def sanitize_job_url(raw_url: str) -> str:
 
     redacted_query = urlencode(redacted_params, doseq=True)
 
-    return urlunparse(parsed._replace(query=redacted_query))
+    return urlunsplit(parts._replace(query=redacted_query))
+
+
+def register_url_handler(domain: str, handler: UrlHandler) -> None:
+    """Register (or replace) the handler of a platform domain."""
+    policy.URL_HANDLERS[domain.lower()] = handler
+    handler_for_host.cache_clear()
+    normalize_job_url.cache_clear()
+    sanitize_job_url.cache_clear()
@@ -1,54 +1,91 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # File: backend/app/ingestion/samples/writer.py
 
-import json
+import asyncio
 import shutil
-from datetime import UTC, date, datetime
+from collections.abc import Mapping
+from datetime import UTC, datetime
 from pathlib import Path
 
+from bs4 import BeautifulSoup
+
 from app.core.config import get_settings
 from app.ingestion.fixtures.naming import format_fixture_date
 from app.ingestion.normalization.headers.pii import redact_headers
 from app.ingestion.normalization.headers.whitelist import whitelist_headers
 from app.ingestion.normalization.html.pii import redact_pii
 from app.ingestion.normalization.html.structural import strip_structure
-from app.ingestion.normalization.pii.patterns import (
-    build_email_pattern,
-    build_name_pattern,
-)
+from app.ingestion.normalization.pii.patterns import get_redaction_engine
 from app.ingestion.normalization.url.sanitize import sanitize_job_url
+from app.utils.files import FileContent, dump_json, write_atomic, write_directory
 
 settings = get_settings()
 
 
-def _json_safe(obj):
-    if isinstance(obj, (datetime, date)):
-        return obj.isoformat()
-    if isinstance(obj, Path):
-        return str(obj)
-    return obj
-
-
-def serialize_jobs(jobs: list[dict], platform: str) -> str:
-    return json.dumps(
+def serialize_jobs(jobs: list[dict], platform: str) -> bytes:
+    return dump_json(
         {
             "platform": platform,
             "count": len(jobs),
             "jobs": jobs,
-        },
-        indent=2,
-        ensure_ascii=False,
-        default=_json_safe,
+        }
+    )
+
+
+def sample_dir_for(platform: str, uid: int, msg_date: datetime | None) -> Path:
+    date_str = format_fixture_date(msg_date or datetime.now(UTC))
+    return Path(settings.sample_dir) / platform / f"{date_str}_{uid}"
+
+
+def build_sample(
+    platform: str,
+    html: str,
+    headers: Mapping[str, str],
+    jobs: list[dict],
+    document: BeautifulSoup | None = None,
+) -> dict[str, FileContent]:
+    """
+    Render every sample artifact, keyed by file name.
+
+    `document` is the tree already parsed from `html` (e.g. by the job
+    parser). It is cleaned and then redacted in place, so the HTML is
+    parsed once for all outputs. Structural rules of `platform` apply.
+    """
+    engine = get_redaction_engine()
+    artifacts: dict[str, FileContent] = {"body_raw.html": html}
+
+    # --- Body struct ---
+    soup = strip_structure(document if document is not None else html, platform)
+    artifacts["body_struct_.html"] = soup.prettify()
+
+    # --- Body sanitized (same tree, struct output is already rendered) ---
+    redact_pii(soup, engine)
+    artifacts["body_sanitized_.html"] = soup.prettify()
+
+    # --- Headers ---
+    artifacts["headers_raw.json"] = dump_json(dict(headers))
+    artifacts["headers_sanitized.json"] = dump_json(
+        redact_headers(whitelist_headers(headers), engine)
     )
 
+    # --- Jobs ---
+    artifacts["jobs_raw.json"] = serialize_jobs(jobs, platform)
+    jobs_sanitized = [
+        {**job, "raw_url": sanitize_job_url(job["raw_url"])} for job in jobs
+    ]
+    artifacts["jobs_sanitized.json"] = serialize_jobs(jobs_sanitized, platform)
+
+    return artifacts
+
 
 def create_sample(
     platform: str,
     html: str,
-    headers: dict,
+    headers: Mapping[str, str],
     jobs: list[dict],
     uid: int,
     msg_date: datetime | None = None,
+    document: BeautifulSoup | None = None,
 ):
     """
     Generate samples with extracted email:
@@ -59,56 +96,37 @@ def create_sample(
     if not settings.debug:
         return  # no fixture generation in production
 
-    name_re = build_name_pattern()
-    email_re = build_email_pattern()
+    sample_dir = sample_dir_for(platform, uid, msg_date)
+    sample_dir.mkdir(parents=True, exist_ok=True)
 
-    msg_date = msg_date or datetime.now(UTC)
-    date_str = format_fixture_date(msg_date)
+    for name, content in build_sample(platform, html, headers, jobs, document).items():
+        write_atomic(sample_dir / name, content)
 
-    sample_dir = Path(settings.sample_dir) / platform / f"{date_str}_{uid}"
-    sample_dir.mkdir(parents=True, exist_ok=True)
 
-    # --- Body raw ---
-    body_raw_path = sample_dir / "body_raw.html"
-    body_raw_path.write_text(html, encoding="utf-8")
+async def acreate_sample(
+    platform: str,
+    html: str,
+    headers: Mapping[str, str],
+    jobs: list[dict],
+    uid: int,
+    msg_date: datetime | None = None,
+    document: BeautifulSoup | None = None,
+):
+    """
+    Async `create_sample`: artifacts are rendered in a worker thread, then
+    all files of the message are written concurrently, and the sample
+    directory appears once complete.
+    """
+    if not settings.debug:
+        return  # no fixture generation in production
 
-    # --- Body struct ---
-    body_structured_soup = strip_structure(html)
-    body_struct_path = sample_dir / "body_struct_.html"
-    body_struct_path.write_text(body_structured_soup.prettify(), encoding="utf-8")
-
-    # --- Body sanitized ---
-    body_sanitized_soup = strip_structure(html)
-    redact_pii(body_sanitized_soup, name_re, email_re)
-    body_sanitized_path = sample_dir / "body_sanitized_.html"
-    body_sanitized_path.write_text(body_sanitized_soup.prettify(), encoding="utf-8")
-
-    # --- Headers raw ---
-    headers_raw_path = sample_dir / "headers_raw.json"
-    headers_raw_path.write_text(json.dumps(headers, indent=2))
-
-    # --- Headers sanitized ---
-    headers_sanitized = redact_headers(whitelist_headers(headers), name_re, email_re)
-    headers_sanitized_path = sample_dir / "headers_sanitized.json"
-    headers_sanitized_path.write_text(json.dumps(headers_sanitized, indent=2))
-
-    # --- Jobs raw ---
-    if jobs is not None:
-        jobs_raw_path = sample_dir / "jobs_raw.json"
-        jobs_raw_path.write_text(
-            serialize_jobs(jobs, platform),
-            encoding="utf-8",
-        )
-
-    # --- Jobs sanitized ---
-    for job in jobs:
-        job["raw_url"] = sanitize_job_url(job["raw_url"])
-    jobs_sanitized_path = sample_dir / "jobs_sanitized.json"
-    jobs_sanitized_path.write_text(
-        serialize_jobs(jobs, platform),
-        encoding="utf-8",
+    sample_dir = sample_dir_for(platform, uid, msg_date)
+    artifacts = await asyncio.to_thread(
+        build_sample, platform, html, headers, jobs, document
     )
 
+    await write_directory(sample_dir, artifacts)
+
 
 def remove_all_samples():
     """Remove all sample files from sample directory."""
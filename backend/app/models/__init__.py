@@ -2,4 +2,5 @@
 # File: backend/app/models/__init__.py
 
 from .job_application import JobApplication  # noqa
+from .job_opportunity import JobOpportunity  # noqa
 from .job_posting import JobPosting  # noqa
@@ -4,7 +4,7 @@
 from datetime import UTC, date, datetime
 from enum import Enum
 
-from sqlalchemy import Date, DateTime, Enum as SAEnum, ForeignKey
+from sqlalchemy import Date, DateTime, Enum as SAEnum, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -22,11 +22,25 @@ class JobApplicationStatus(str, Enum):
 class JobApplication(Base):
     __tablename__ = "job_application"
 
+    __table_args__ = (
+        # Back the keyset pagination of listings (scanned backwards for
+        # the most recent first), with or without a status filter
+        Index("ix_job_application_date_id", "job_application_date", "id"),
+        Index(
+            "ix_job_application_status_date_id",
+            "status",
+            "job_application_date",
+            "id",
+        ),
+    )
+
     id: Mapped[int] = mapped_column(primary_key=True)
 
     job_posting_id: Mapped[int] = mapped_column(
         ForeignKey("jobposting.id"),
         nullable=False,
+        # Used by JobPosting.job_applications.any() and its loaders
+        index=True,
     )
 
     status: Mapped[JobApplicationStatus] = mapped_column(
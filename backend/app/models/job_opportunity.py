@@ -6,15 +6,15 @@ from enum import Enum
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import Boolean, DateTime, Enum as SAEnum, String
+from sqlalchemy import Boolean, DateTime, Enum as SAEnum, Index, String, text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from uuid6 import uuid7
 
 from app.db.base import Base
 
 if TYPE_CHECKING:
-    pass
+    from app.models.job_posting import JobPosting
 
 
 class JobOpportunityPriority(str, Enum):
@@ -26,18 +26,35 @@ class JobOpportunityPriority(str, Enum):
 class JobOpportunity(Base):
     __tablename__ = "job_opportunity"
 
+    # The board lists active opportunities newest first (UUIDv7 ids are
+    # time-ordered), optionally for one priority
+    __table_args__ = (
+        Index(
+            "ix_job_opportunity_active_id",
+            "id",
+            postgresql_where=text("is_active"),
+        ),
+        Index(
+            "ix_job_opportunity_active_priority_id",
+            "priority",
+            "id",
+            postgresql_where=text("is_active"),
+        ),
+    )
+
     id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
         primary_key=True,
         default=uuid7,
     )
 
-    # job_postings: Mapped[list["JobPosting"]] = relationship(
-    #     "JobPosting",
-    #     back_populates="job_opportunity",
-    #     cascade="all, delete orphans",
-    #     lazy="raise",
-    # )
+    # Postings are kept when their opportunity is deleted (SET NULL)
+    job_postings: Mapped[list["JobPosting"]] = relationship(
+        "JobPosting",
+        back_populates="job_opportunity",
+        passive_deletes=True,
+        lazy="raise",
+    )
 
     title: Mapped[str] = mapped_column(String, nullable=False)
     company: Mapped[str] = mapped_column(String, nullable=False)
@@ -2,13 +2,57 @@
 # File: backend/app/models/job_posting.py
 
 from datetime import UTC, datetime
-
-from sqlalchemy import Boolean, DateTime, Float, String, UniqueConstraint
+from decimal import Decimal
+from enum import Enum
+from uuid import UUID
+
+from sqlalchemy import (
+    DDL,
+    BigInteger,
+    Boolean,
+    Computed,
+    DateTime,
+    Enum as SAEnum,
+    Float,
+    ForeignKey,
+    Index,
+    Numeric,
+    String,
+    UniqueConstraint,
+    event,
+)
+from sqlalchemy.dialects.postgresql import (
+    ARRAY,
+    NUMRANGE,
+    TSVECTOR,
+    UUID as PG_UUID,
+    Range,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
 
 
+class SalaryPeriod(str, Enum):
+    HOUR = "hour"
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+    YEAR = "year"
+
+
+# Alerts come in English and French: text fields are indexed with both
+# configurations, names (company, location) without stemming.
+SEARCH_VECTOR_EXPRESSION = """
+setweight(to_tsvector('english', coalesce(title, '')), 'A')
+|| setweight(to_tsvector('french', coalesce(title, '')), 'A')
+|| setweight(to_tsvector('simple', coalesce(company, '')), 'B')
+|| setweight(to_tsvector('simple', coalesce(location, '')), 'C')
+|| setweight(to_tsvector('english', coalesce(summary, '') || ' ' || coalesce(description, '')), 'D')
+|| setweight(to_tsvector('french', coalesce(summary, '') || ' ' || coalesce(description, '')), 'D')
+"""
+
+
 class JobPosting(Base):
     __tablename__ = "jobposting"
 
@@ -22,6 +66,52 @@ class JobPosting(Base):
             "raw_url",
             name="uq_job_posting_raw_url",
         ),
+        # Back the listings, newest first (scanned backwards), with and
+        # without their equality filters
+        Index("ix_jobposting_date_scraped_id", "date_scraped", "id"),
+        Index(
+            "ix_jobposting_platform_date_scraped_id",
+            "platform",
+            "date_scraped",
+            "id",
+        ),
+        Index(
+            "ix_jobposting_company_date_scraped_id",
+            "company",
+            "date_scraped",
+            "id",
+        ),
+        # Full-text search
+        Index(
+            "ix_jobposting_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+        # Fuzzy filters and autocomplete (pg_trgm)
+        Index(
+            "ix_jobposting_company_trgm",
+            "company",
+            postgresql_using="gin",
+            postgresql_ops={"company": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_jobposting_location_trgm",
+            "location",
+            postgresql_using="gin",
+            postgresql_ops={"location": "gin_trgm_ops"},
+        ),
+        # Pay filters: overlap (&&) of the yearly salary range
+        Index(
+            "ix_jobposting_salary_yearly",
+            "salary_yearly",
+            postgresql_using="gist",
+        ),
+        # Candidate duplicates: postings sharing an LSH bucket (&&)
+        Index(
+            "ix_jobposting_lsh_buckets",
+            "lsh_buckets",
+            postgresql_using="gin",
+        ),
     )
 
     id: Mapped[int | None] = mapped_column(primary_key=True, autoincrement=True)
@@ -39,6 +129,19 @@ class JobPosting(Base):
     rating: Mapped[float | None] = mapped_column(Float, nullable=True)
     summary: Mapped[str | None] = mapped_column(String, nullable=True)
     salary: Mapped[str | None] = mapped_column(String, nullable=True)
+    # Parsed from `salary` (app.ingestion.normalization.salary)
+    salary_min: Mapped[Decimal | None] = mapped_column(Numeric(12, 2), nullable=True)
+    salary_max: Mapped[Decimal | None] = mapped_column(Numeric(12, 2), nullable=True)
+    salary_currency: Mapped[str | None] = mapped_column(String(3), nullable=True)
+    salary_period: Mapped[SalaryPeriod | None] = mapped_column(
+        SAEnum(SalaryPeriod, name="salary_period"),
+        nullable=True,
+    )
+    # Pay brought to a yearly basis, so that periods compare
+    salary_yearly: Mapped[Range[Decimal] | None] = mapped_column(
+        NUMRANGE,
+        nullable=True,
+    )
     description: Mapped[str | None] = mapped_column(String, nullable=True)
 
     raw_url: Mapped[str] = mapped_column(String, nullable=False, index=False)
@@ -65,3 +168,37 @@ class JobPosting(Base):
     )
 
     source_email_id: Mapped[str | None] = mapped_column(String, nullable=True)
+
+    # Cross-platform duplicates of a posting share one opportunity
+    job_opportunity_id: Mapped[UUID | None] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("job_opportunity.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
+    job_opportunity = relationship(
+        "JobOpportunity",
+        back_populates="job_postings",
+        lazy="raise",
+    )
+    # MinHash LSH buckets of (title, company, location), see app.clustering
+    lsh_buckets: Mapped[list[int] | None] = mapped_column(
+        ARRAY(BigInteger),
+        nullable=True,
+        deferred=True,
+    )
+
+    # Maintained by Postgres, only read by searches
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+        deferred=True,
+    )
+
+
+# The trigram indexes need the extension (created by migrations in production)
+event.listen(
+    JobPosting.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
@@ -1,11 +1,14 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # File: backend/app/repositories/job_application.py
 
-from sqlalchemy import select
+from datetime import date
+
+from sqlalchemy import Select, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.models.job_application import JobApplication
+from app.models.job_application import JobApplication, JobApplicationStatus
+from app.repositories.pagination import Page, decode_cursor, split_page
 
 
 class JobApplicationRepository:
@@ -35,7 +38,99 @@ class JobApplicationRepository:
 
     async def list_with_job_posting(
         self,
+        *,
+        status: JobApplicationStatus | None = None,
+        applied_from: date | None = None,
+        applied_to: date | None = None,
+        limit: int = 50,
+        offset: int = 0,
     ) -> list[JobApplication]:
-        stmt = select(JobApplication).options(selectinload(JobApplication.job_posting))
+        """
+        List applications with their posting, most recent first.
+        """
+        stmt = (
+            self._filtered(
+                select(JobApplication),
+                status=status,
+                applied_from=applied_from,
+                applied_to=applied_to,
+            )
+            .options(selectinload(JobApplication.job_posting))
+            .order_by(
+                JobApplication.job_application_date.desc(), JobApplication.id.desc()
+            )
+            .limit(limit)
+            .offset(offset)
+        )
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
+
+    async def list_keyset_with_job_posting(
+        self,
+        *,
+        status: JobApplicationStatus | None = None,
+        applied_from: date | None = None,
+        applied_to: date | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> Page[JobApplication]:
+        """
+        Same listing as `list_with_job_posting`, paginated by keyset on
+        (job_application_date, id).
+
+        Each page is a range scan on `ix_job_application_date_id` (or
+        `ix_job_application_status_date_id` when filtering by status), and
+        postings are loaded for that page only.
+        """
+        stmt = self._filtered(
+            select(JobApplication),
+            status=status,
+            applied_from=applied_from,
+            applied_to=applied_to,
+        )
+
+        if cursor:
+            applied_on, job_application_id = decode_cursor(
+                cursor, date.fromisoformat, int
+            )
+            stmt = stmt.where(
+                tuple_(JobApplication.job_application_date, JobApplication.id)
+                < tuple_(applied_on, job_application_id)
+            )
+
+        stmt = (
+            stmt.options(selectinload(JobApplication.job_posting))
+            .order_by(
+                JobApplication.job_application_date.desc(), JobApplication.id.desc()
+            )
+            .limit(limit + 1)
+        )
+
+        result = await self.session.execute(stmt)
+        return split_page(
+            result.scalars().all(),
+            limit,
+            key=lambda job_application: (
+                job_application.job_application_date,
+                job_application.id,
+            ),
+        )
+
+    @staticmethod
+    def _filtered(
+        stmt: Select,
+        *,
+        status: JobApplicationStatus | None,
+        applied_from: date | None,
+        applied_to: date | None,
+    ) -> Select:
+        if status is not None:
+            stmt = stmt.where(JobApplication.status == status)
+
+        if applied_from is not None:
+            stmt = stmt.where(JobApplication.job_application_date >= applied_from)
+
+        if applied_to is not None:
+            stmt = stmt.where(JobApplication.job_application_date <= applied_to)
+
+        return stmt
@@ -4,10 +4,11 @@
 from collections.abc import Sequence
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.job_opportunity import JobOpportunity
+from app.models.job_opportunity import JobOpportunity, JobOpportunityPriority
+from app.repositories.pagination import Page, decode_cursor, split_page
 
 
 class JobOpportunityRepository:
@@ -34,11 +35,49 @@ class JobOpportunityRepository:
         *,
         offset: int,
         limit: int,
+        is_active: bool | None = None,
+        priority: JobOpportunityPriority | None = None,
     ) -> Sequence[JobOpportunity]:
+        # UUIDv7 ids are time-ordered: newest first without a created_at sort
         stmt = (
-            select(JobOpportunity)
+            self._filtered(select(JobOpportunity), is_active, priority)
+            .order_by(JobOpportunity.id.desc())
             .offset(offset)
             .limit(limit)
-            .order_by(JobOpportunity.created_at.desc())
         )
         return (await self.session.scalars(stmt)).all()
+
+    async def list_keyset(
+        self,
+        *,
+        limit: int,
+        cursor: str | None = None,
+        is_active: bool | None = None,
+        priority: JobOpportunityPriority | None = None,
+    ) -> Page[JobOpportunity]:
+        """
+        Newest first, paginated by keyset on the primary key.
+
+        Active listings are served by the partial indexes on `is_active`.
+        """
+        stmt = self._filtered(select(JobOpportunity), is_active, priority)
+
+        if cursor:
+            (last_id,) = decode_cursor(cursor, UUID)
+            stmt = stmt.where(JobOpportunity.id < last_id)
+
+        stmt = stmt.order_by(JobOpportunity.id.desc()).limit(limit + 1)
+        rows = (await self.session.scalars(stmt)).all()
+        return split_page(rows, limit, key=lambda row: (str(row.id),))
+
+    @staticmethod
+    def _filtered(
+        stmt: Select,
+        is_active: bool | None,
+        priority: JobOpportunityPriority | None,
+    ) -> Select:
+        if is_active is not None:
+            stmt = stmt.where(JobOpportunity.is_active == is_active)
+        if priority is not None:
+            stmt = stmt.where(JobOpportunity.priority == priority)
+        return stmt
@@ -1,11 +1,70 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # File: backend/app/repositories/job_posting.py
 
-from sqlalchemy import select
+from collections.abc import Sequence
+from datetime import datetime
+from decimal import Decimal
+from typing import Literal
+
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    Select,
+    func,
+    literal_column,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import TSQUERY, Range
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models.job_posting import JobPosting
+from app.repositories.pagination import Page, decode_cursor, split_page
+
+# Same configurations as the search vector of JobPosting
+SEARCH_CONFIGS = ("english", "french", "simple")
+HEADLINE_OPTIONS = (
+    "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=20, MinWords=8"
+)
+
+
+SuggestField = Literal["company", "location"]
+
+
+def escape_like(value: str) -> str:
+    """Escape LIKE wildcards so that `value` matches literally."""
+    return value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+
+class SearchHit:
+    """A job posting matching a search, its rank and highlighted excerpt."""
+
+    __slots__ = ("job_posting", "rank", "highlight")
+
+    def __init__(
+        self, job_posting: JobPosting, rank: float, highlight: str | None
+    ) -> None:
+        self.job_posting = job_posting
+        self.rank = rank
+        self.highlight = highlight
+
+
+def _regconfig(name: str) -> ColumnElement:
+    return literal_column(f"'{name}'::regconfig")
+
+
+def search_query(text: str) -> ColumnElement:
+    """
+    Parse user input (web search syntax: quotes, `or`, `-`) into a tsquery
+    matching any of the search configurations.
+    """
+    query = None
+    for config in SEARCH_CONFIGS:
+        part = func.websearch_to_tsquery(_regconfig(config), text, type_=TSQUERY)
+        query = part if query is None else query.op("||", return_type=TSQUERY)(part)
+    return query
 
 
 class JobPostingRepository:
@@ -49,7 +108,12 @@ class JobPostingRepository:
         *,
         platform: str | None = None,
         company: str | None = None,
+        company_search: str | None = None,
+        location_search: str | None = None,
         has_application: bool | None = None,
+        min_salary: Decimal | None = None,
+        max_salary: Decimal | None = None,
+        salary_currency: str | None = None,
         limit: int = 50,
         offset: int = 0,
     ) -> list[JobPosting]:
@@ -57,24 +121,253 @@ class JobPostingRepository:
         List job offers with optional filters.
         Intended for dashboards and browsing.
         """
-        stmt = select(JobPosting)
+        stmt = self._filtered(
+            select(JobPosting),
+            platform=platform,
+            company=company,
+            company_search=company_search,
+            location_search=location_search,
+            has_application=has_application,
+            min_salary=min_salary,
+            max_salary=max_salary,
+            salary_currency=salary_currency,
+        )
+
+        stmt = stmt.order_by(JobPosting.date_scraped.desc()).limit(limit).offset(offset)
+
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def list_keyset(
+        self,
+        *,
+        platform: str | None = None,
+        company: str | None = None,
+        company_search: str | None = None,
+        location_search: str | None = None,
+        has_application: bool | None = None,
+        min_salary: Decimal | None = None,
+        max_salary: Decimal | None = None,
+        salary_currency: str | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> Page[JobPosting]:
+        """
+        Same listing as `list`, paginated by keyset on (date_scraped, id).
+
+        The cursor points after the last row of the previous page, so every
+        page is an index range scan on `ix_jobposting_date_scraped_id`,
+        whatever its depth.
+        """
+        stmt = self._filtered(
+            select(JobPosting),
+            platform=platform,
+            company=company,
+            company_search=company_search,
+            location_search=location_search,
+            has_application=has_application,
+            min_salary=min_salary,
+            max_salary=max_salary,
+            salary_currency=salary_currency,
+        )
+
+        if cursor:
+            date_scraped, job_posting_id = decode_cursor(
+                cursor, datetime.fromisoformat, int
+            )
+            stmt = stmt.where(
+                tuple_(JobPosting.date_scraped, JobPosting.id)
+                < tuple_(date_scraped, job_posting_id)
+            )
+
+        stmt = stmt.order_by(
+            JobPosting.date_scraped.desc(), JobPosting.id.desc()
+        ).limit(limit + 1)
+
+        result = await self.session.execute(stmt)
+        return split_page(
+            result.scalars().all(),
+            limit,
+            key=lambda job_posting: (job_posting.date_scraped, job_posting.id),
+        )
+
+    async def search(
+        self,
+        text: str,
+        *,
+        platform: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> Sequence[SearchHit]:
+        """
+        Full-text search, best matches first.
+
+        Matches come from the GIN index on `search_vector`, only the
+        returned page is highlighted (`ts_headline` reads the documents).
+        """
+        query = search_query(text)
+        rank = func.ts_rank_cd(JobPosting.search_vector, query).label("rank")
+
+        stmt = select(JobPosting.id, rank).where(
+            JobPosting.search_vector.bool_op("@@")(query)
+        )
+        if platform is not None:
+            stmt = stmt.where(JobPosting.platform == platform)
+
+        page = (
+            stmt.order_by(
+                rank.desc(), JobPosting.date_scraped.desc(), JobPosting.id.desc()
+            )
+            .limit(limit)
+            .offset(offset)
+            .subquery()
+        )
+
+        # Without stemming, the words typed by the user are highlighted
+        highlight = func.ts_headline(
+            _regconfig("simple"),
+            func.coalesce(JobPosting.summary, JobPosting.description, JobPosting.title),
+            query,
+            HEADLINE_OPTIONS,
+        )
+
+        result = await self.session.execute(
+            select(JobPosting, page.c.rank, highlight)
+            .join(page, JobPosting.id == page.c.id)
+            .order_by(
+                page.c.rank.desc(), JobPosting.date_scraped.desc(), JobPosting.id.desc()
+            )
+        )
+        return [SearchHit(*row) for row in result.all()]
+
+    async def suggest(
+        self,
+        field: SuggestField,
+        prefix: str,
+        *,
+        limit: int = 10,
+    ) -> Sequence[str]:
+        """
+        Distinct values of `field` starting with `prefix` (case-insensitive),
+        most frequent first.
+        """
+        column = {"company": JobPosting.company, "location": JobPosting.location}[field]
+        stmt = (
+            select(column)
+            .where(column.ilike(f"{escape_like(prefix)}%", escape="/"))
+            .group_by(column)
+            .order_by(func.count().desc(), column)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
 
+    async def list_clustered_by_buckets(
+        self,
+        buckets: Sequence[int],
+    ) -> Sequence[Row]:
+        """
+        Postings already linked to an opportunity that share at least one
+        LSH bucket with `buckets` (GIN index on `lsh_buckets`).
+
+        Only the columns needed to compare them are loaded.
+        """
+        stmt = select(
+            JobPosting.id,
+            JobPosting.title,
+            JobPosting.company,
+            JobPosting.location,
+            JobPosting.job_opportunity_id,
+            JobPosting.lsh_buckets,
+        ).where(
+            JobPosting.lsh_buckets.overlap(list(buckets)),
+            JobPosting.job_opportunity_id.is_not(None),
+        )
+        result = await self.session.execute(stmt)
+        return result.all()
+
+    async def list_unclustered(
+        self,
+        *,
+        limit: int = 500,
+    ) -> Sequence[JobPosting]:
+        """Oldest postings not linked to any opportunity yet."""
+        stmt = (
+            select(JobPosting)
+            .where(JobPosting.job_opportunity_id.is_(None))
+            .order_by(JobPosting.id)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
+    async def list_salaries_after(
+        self,
+        after_id: int = 0,
+        *,
+        limit: int = 1000,
+    ) -> Sequence[Row]:
+        """(id, salary) of postings with a salary, by id, after `after_id`."""
+        stmt = (
+            select(JobPosting.id, JobPosting.salary)
+            .where(JobPosting.salary.is_not(None), JobPosting.id > after_id)
+            .order_by(JobPosting.id)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return result.all()
+
+    async def update_many(self, values: Sequence[dict]) -> None:
+        """Bulk UPDATE by primary key, each dict holds `id` and the new values."""
+        if values:
+            await self.session.execute(update(JobPosting), values)
+
+    @staticmethod
+    def _filtered(
+        stmt: Select,
+        *,
+        platform: str | None,
+        company: str | None,
+        company_search: str | None,
+        location_search: str | None,
+        has_application: bool | None,
+        min_salary: Decimal | None,
+        max_salary: Decimal | None,
+        salary_currency: str | None,
+    ) -> Select:
         if platform is not None:
             stmt = stmt.where(JobPosting.platform == platform)
 
         if company is not None:
             stmt = stmt.where(JobPosting.company == company)
 
+        # Fuzzy: `column %> text` is `text <% column`, true when the text
+        # is similar to a run of words of the column (trigram GIN index)
+        if company_search is not None:
+            stmt = stmt.where(JobPosting.company.bool_op("%>")(company_search))
+
+        if location_search is not None:
+            stmt = stmt.where(JobPosting.location.bool_op("%>")(location_search))
+
         if has_application is not None:
             if has_application:
                 stmt = stmt.where(JobPosting.job_applications.any())
             else:
                 stmt = stmt.where(~JobPosting.job_applications.any())
 
-        stmt = stmt.order_by(JobPosting.date_scraped.desc()).limit(limit).offset(offset)
+        # Pay ranges overlapping the wanted one, on a yearly basis (GiST
+        # index): "from 40k" matches a max of 45k, "up to 60k" a min of 50k
+        if min_salary is not None or max_salary is not None:
+            stmt = stmt.where(
+                JobPosting.salary_yearly.overlaps(
+                    Range(min_salary, max_salary, bounds="[]")
+                )
+            )
 
-        result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        if salary_currency is not None:
+            stmt = stmt.where(JobPosting.salary_currency == salary_currency)
+
+        return stmt
 
     async def get_with_applications(
         self,
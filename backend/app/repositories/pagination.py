@@ -0,0 +1,61 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/app/repositories/pagination.py
+
+import base64
+import binascii
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import orjson
+
+from app.domain.errors import InvalidCursor
+
+
+class Page[T]:
+    """A page of rows and the opaque cursor of the next one (None at the end)."""
+
+    __slots__ = ("items", "next_cursor")
+
+    def __init__(self, items: list[T], next_cursor: str | None) -> None:
+        self.items = items
+        self.next_cursor = next_cursor
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the sort key of the last row of a page into an opaque token."""
+    return base64.urlsafe_b64encode(orjson.dumps(values)).rstrip(b"=").decode()
+
+
+def decode_cursor(token: str, *types: Callable[[Any], Any]) -> tuple[Any, ...]:
+    """
+    Decode a token made by `encode_cursor`, converting each value with the
+    matching callable of `types`.
+
+    Raises:
+        InvalidCursor: If the token is malformed or does not hold one value
+            per type.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        values = orjson.loads(raw)
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("unexpected cursor shape")
+        return tuple(
+            convert(value) for convert, value in zip(types, values, strict=True)
+        )
+    except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError):
+        raise InvalidCursor(token) from None
+
+
+def split_page[T](
+    rows: Sequence[T],
+    limit: int,
+    key: Callable[[T], Sequence[Any]],
+) -> Page[T]:
+    """
+    Build a page from `limit + 1` fetched rows: the extra row only tells
+    whether a next page exists.
+    """
+    items = list(rows[:limit])
+    has_more = len(rows) > limit and bool(items)
+    return Page(items, encode_cursor(*key(items[-1])) if has_more else None)
@@ -5,9 +5,13 @@
 # File: backend/app/schemas/job_offer.py
 
 from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict
 
+from app.models.job_posting import SalaryPeriod
+
 
 class JobPostingBase(BaseModel):
     title: str
@@ -54,6 +58,21 @@ class JobPostingUpdate(BaseModel):
 class JobPostingRead(JobPostingBase):
     id: int
     date_scraped: datetime
+    job_opportunity_id: UUID | None = None
+    # Parsed from `salary`
+    salary_min: Decimal | None = None
+    salary_max: Decimal | None = None
+    salary_currency: str | None = None
+    salary_period: SalaryPeriod | None = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class JobPostingSearchHit(BaseModel):
+    job_posting: JobPostingRead
+    rank: float
+    # Excerpt with matched words wrapped in <mark></mark>
+    highlight: str | None = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -0,0 +1,12 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/app/schemas/pagination.py
+
+from pydantic import BaseModel
+
+# Upper bound of the `limit` query parameter of listing endpoints
+MAX_PAGE_LIMIT = 200
+
+
+class CursorPage[T](BaseModel):
+    items: list[T]
+    next_cursor: str | None = None
@@ -1,14 +1,17 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # File: backend/app/services/job_application.py
 
+from datetime import date
+
 from fastapi import Depends, HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_session
-from app.models.job_application import JobApplication
+from app.models.job_application import JobApplication, JobApplicationStatus
 from app.models.job_posting import JobPosting
 from app.repositories.job_application import JobApplicationRepository
+from app.repositories.pagination import Page
 from app.schemas.job_application import (
     JobApplicationCreate,
     JobApplicationUpdate,
@@ -44,8 +47,37 @@ class JobApplicationService:
 
     async def list_applications(
         self,
+        *,
+        status: JobApplicationStatus | None = None,
+        applied_from: date | None = None,
+        applied_to: date | None = None,
+        limit: int = 50,
+        offset: int = 0,
     ) -> list[JobApplication]:
-        return await self.repo.list_with_job_posting()
+        return await self.repo.list_with_job_posting(
+            status=status,
+            applied_from=applied_from,
+            applied_to=applied_to,
+            limit=limit,
+            offset=offset,
+        )
+
+    async def list_applications_page(
+        self,
+        *,
+        status: JobApplicationStatus | None = None,
+        applied_from: date | None = None,
+        applied_to: date | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> Page[JobApplication]:
+        return await self.repo.list_keyset_with_job_posting(
+            status=status,
+            applied_from=applied_from,
+            applied_to=applied_to,
+            limit=limit,
+            cursor=cursor,
+        )
 
     async def update_application_by_id(
         self,
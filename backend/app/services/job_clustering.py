@@ -0,0 +1,136 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/app/services/job_clustering.py
+
+from collections import defaultdict
+from collections.abc import Sequence
+from typing import NamedTuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid6 import uuid7
+
+from app.clustering.minhash import MinHasher, Signature
+from app.clustering.normalize import company_shingles, overlap, posting_features
+from app.models.job_opportunity import JobOpportunity
+from app.models.job_posting import JobPosting
+from app.repositories.job_opportunity import JobOpportunityRepository
+from app.repositories.job_posting import JobPostingRepository
+
+# Estimated Jaccard similarity of (title, company, location) shingles above
+# which two postings are the same role...
+SIMILARITY_THRESHOLD = 0.6
+# ...provided one company name contains the other ("Licorne" and "Licorne
+# Society SAS"): the same title in the same city at another company scores
+# about 0.7 overall
+COMPANY_OVERLAP_THRESHOLD = 0.8
+
+
+class _Entry(NamedTuple):
+    signature: Signature
+    company: set[str]
+    opportunity_id: UUID
+
+
+class JobClusteringService:
+    """
+    Group cross-platform duplicates of job postings into opportunities.
+
+    Incremental: each batch of new postings is compared only with the
+    postings sharing one of their LSH buckets (one indexed query), then
+    linked to the opportunity of the most similar one, or to a new
+    opportunity.
+    """
+
+    def __init__(
+        self,
+        *,
+        session: AsyncSession,
+        posting_repo: JobPostingRepository | None = None,
+        opportunity_repo: JobOpportunityRepository | None = None,
+        hasher: MinHasher | None = None,
+    ) -> None:
+        self.session = session
+        self.posting_repo = posting_repo or JobPostingRepository(session)
+        self.opportunity_repo = opportunity_repo or JobOpportunityRepository(session)
+        self.hasher = hasher or MinHasher()
+
+    def _signature(
+        self, title: str | None, company: str | None, location: str | None
+    ) -> Signature:
+        return self.hasher.signature(posting_features(title, company, location))
+
+    async def cluster(self, postings: Sequence[JobPosting]) -> int:
+        """
+        Link postings without opportunity to one (changes are not committed).
+
+        Returns the number of opportunities created.
+        """
+        pending = [p for p in postings if p.job_opportunity_id is None]
+        signatures: list[Signature] = []
+        for posting in pending:
+            signature = self._signature(
+                posting.title, posting.company, posting.location
+            )
+            posting.lsh_buckets = self.hasher.buckets(signature)
+            signatures.append(signature)
+
+        wanted = {bucket for p in pending for bucket in p.lsh_buckets or ()}
+
+        # bucket -> the postings it holds
+        index: dict[int, list[_Entry]] = defaultdict(list)
+        if wanted:
+            for row in await self.posting_repo.list_clustered_by_buckets(
+                sorted(wanted)
+            ):
+                entry = _Entry(
+                    self._signature(row.title, row.company, row.location),
+                    company_shingles(row.company),
+                    row.job_opportunity_id,
+                )
+                for bucket in row.lsh_buckets:
+                    if bucket in wanted:
+                        index[bucket].append(entry)
+
+        created = 0
+        for posting, signature in zip(pending, signatures, strict=True):
+            company = company_shingles(posting.company)
+            opportunity_id = self._best_match(
+                signature, company, posting.lsh_buckets, index
+            )
+
+            if opportunity_id is None:
+                opportunity = JobOpportunity(
+                    id=uuid7(),
+                    title=posting.title,
+                    company=posting.company,
+                    location=posting.location,
+                )
+                await self.opportunity_repo.add(opportunity)
+                opportunity_id = opportunity.id
+                created += 1
+
+            posting.job_opportunity_id = opportunity_id
+            # Later postings of the same batch may be its duplicates
+            entry = _Entry(signature, company, opportunity_id)
+            for bucket in posting.lsh_buckets or ():
+                index[bucket].append(entry)
+
+        return created
+
+    def _best_match(
+        self,
+        signature: Signature,
+        company: set[str],
+        buckets: Sequence[int] | None,
+        index: dict[int, list[_Entry]],
+    ) -> UUID | None:
+        best, best_score = None, SIMILARITY_THRESHOLD
+        for bucket in buckets or ():
+            for entry in index.get(bucket, ()):
+                score = self.hasher.similarity(signature, entry.signature)
+                if (
+                    score >= best_score
+                    and overlap(company, entry.company) >= COMPANY_OVERLAP_THRESHOLD
+                ):
+                    best, best_score = entry.opportunity_id, score
+        return best
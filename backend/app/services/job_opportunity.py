@@ -9,8 +9,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_session
 from app.domain.errors import JobOpportunityNotFound
-from app.models.job_opportunity import JobOpportunity
+from app.models.job_opportunity import JobOpportunity, JobOpportunityPriority
 from app.repositories.job_opportunity import JobOpportunityRepository
+from app.repositories.pagination import Page
 from app.schemas.job_opportunity import JobOpportunityCreate, JobOpportunityUpdate
 
 
@@ -82,8 +83,30 @@ class JobOpportunityService:
         *,
         limit: int = 50,
         offset: int = 0,
+        is_active: bool | None = None,
+        priority: JobOpportunityPriority | None = None,
     ) -> Sequence[JobOpportunity]:
-        return await self.repo.list_page(limit=limit, offset=offset)
+        return await self.repo.list_page(
+            limit=limit,
+            offset=offset,
+            is_active=is_active,
+            priority=priority,
+        )
+
+    async def list_keyset(
+        self,
+        *,
+        limit: int = 50,
+        cursor: str | None = None,
+        is_active: bool | None = None,
+        priority: JobOpportunityPriority | None = None,
+    ) -> Page[JobOpportunity]:
+        return await self.repo.list_keyset(
+            limit=limit,
+            cursor=cursor,
+            is_active=is_active,
+            priority=priority,
+        )
 
 
 def get_job_opportunity_service(
@@ -1,13 +1,29 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # File: backend/app/services/job_posting.py
 
+from collections.abc import Sequence
+from decimal import Decimal
+
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_session
+from app.ingestion.normalization.salary.parse import salary_columns
 from app.models.job_posting import JobPosting
-from app.repositories.job_posting import JobPostingRepository
+from app.repositories.job_posting import (
+    JobPostingRepository,
+    SearchHit,
+    SuggestField,
+)
+from app.repositories.pagination import Page
 from app.schemas.job_posting import JobPostingCreate, JobPostingUpdate
+from app.utils.cache import TTLCache
+
+# Autocomplete is called on every keystroke: hot prefixes are served from
+# memory, slightly stale (new companies show up within the TTL)
+suggestion_cache: TTLCache[tuple[str, str, int], Sequence[str]] = TTLCache(
+    maxsize=2048, ttl=60.0
+)
 
 
 class JobPostingService:
@@ -27,7 +43,7 @@ class JobPostingService:
         """
         Create a Job Posting manually (user is the source of truth).
         """
-        job_posting = JobPosting(**data.model_dump())
+        job_posting = JobPosting(**data.model_dump(), **salary_columns(data.salary))
         await self.repo.add(job_posting)
         await self.session.commit()
         await self.session.refresh(job_posting)
@@ -65,6 +81,7 @@ class JobPostingService:
             location=data.get("location"),
             rating=data.get("rating"),
             salary=data.get("salary"),
+            **salary_columns(data.get("salary")),
             summary=data.get("summary"),
             job_key=job_key,
             platform=platform or "unknown",
@@ -93,18 +110,84 @@ class JobPostingService:
         *,
         platform: str | None = None,
         company: str | None = None,
+        company_search: str | None = None,
+        location_search: str | None = None,
         has_application: bool | None = None,
+        min_salary: Decimal | None = None,
+        max_salary: Decimal | None = None,
+        salary_currency: str | None = None,
         limit: int = 50,
         offset: int = 0,
     ) -> list[JobPosting]:
         return await self.repo.list(
             platform=platform,
             company=company,
+            company_search=company_search,
+            location_search=location_search,
             has_application=has_application,
+            min_salary=min_salary,
+            max_salary=max_salary,
+            salary_currency=salary_currency,
             limit=limit,
             offset=offset,
         )
 
+    async def list_job_postings_page(
+        self,
+        *,
+        platform: str | None = None,
+        company: str | None = None,
+        company_search: str | None = None,
+        location_search: str | None = None,
+        has_application: bool | None = None,
+        min_salary: Decimal | None = None,
+        max_salary: Decimal | None = None,
+        salary_currency: str | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> Page[JobPosting]:
+        return await self.repo.list_keyset(
+            platform=platform,
+            company=company,
+            company_search=company_search,
+            location_search=location_search,
+            has_application=has_application,
+            min_salary=min_salary,
+            max_salary=max_salary,
+            salary_currency=salary_currency,
+            limit=limit,
+            cursor=cursor,
+        )
+
+    async def search_job_postings(
+        self,
+        text: str,
+        *,
+        platform: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> Sequence[SearchHit]:
+        return await self.repo.search(
+            text,
+            platform=platform,
+            limit=limit,
+            offset=offset,
+        )
+
+    async def suggest(
+        self,
+        field: SuggestField,
+        prefix: str,
+        *,
+        limit: int = 10,
+    ) -> Sequence[str]:
+        key = (field, prefix.lower(), limit)
+        suggestions = suggestion_cache.get(key)
+        if suggestions is None:
+            suggestions = await self.repo.suggest(field, prefix, limit=limit)
+            suggestion_cache.set(key, suggestions)
+        return suggestions
+
     async def update_job_posting(
         self,
         job_posting_id: int,
@@ -114,7 +197,11 @@ class JobPostingService:
         if not job_posting:
             raise ValueError("Job Posting not found")
 
-        for field, value in data.model_dump(exclude_unset=True).items():
+        updates = data.model_dump(exclude_unset=True)
+        if "salary" in updates:
+            updates.update(salary_columns(updates["salary"]))
+
+        for field, value in updates.items():
             setattr(job_posting, field, value)
 
         await self.session.commit()
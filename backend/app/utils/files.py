@@ -0,0 +1,88 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/app/utils/files.py
+
+import asyncio
+import os
+import shutil
+import tempfile
+from collections.abc import Mapping
+from contextlib import suppress
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+FileContent = str | bytes
+
+
+def _json_default(obj: Any) -> Any:
+    # datetime and date are serialized natively by orjson (ISO 8601)
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dump_json(obj: Any) -> bytes:
+    """Serialize `obj` to indented UTF-8 JSON."""
+    return orjson.dumps(
+        obj,
+        default=_json_default,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+    )
+
+
+def write_atomic(path: Path, content: FileContent) -> None:
+    """
+    Write a file through a temp file in the same directory, then rename it.
+
+    Readers never see a partially written file, even if generation is
+    interrupted.
+    """
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    fd, tmp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+
+
+async def write_files(files: Mapping[Path, FileContent]) -> None:
+    """Write several files concurrently, each one atomically, in worker threads."""
+    await asyncio.gather(
+        *(
+            asyncio.to_thread(write_atomic, path, content)
+            for path, content in files.items()
+        )
+    )
+
+
+def _staging_dir(directory: Path) -> Path:
+    staging = directory.with_name(f".{directory.name}.tmp")
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+    return staging
+
+
+def _publish_dir(staging: Path, directory: Path) -> None:
+    if directory.exists():
+        shutil.rmtree(directory)
+    os.replace(staging, directory)
+
+
+async def write_directory(directory: Path, files: Mapping[str, FileContent]) -> None:
+    """
+    Write a directory of files, keyed by name, so that it appears at once.
+
+    Files are written concurrently in a hidden sibling directory, which is
+    then renamed: an interrupted run never leaves a partial directory.
+    """
+    staging = await asyncio.to_thread(_staging_dir, directory)
+    await write_files({staging / name: content for name, content in files.items()})
+    await asyncio.to_thread(_publish_dir, staging, directory)
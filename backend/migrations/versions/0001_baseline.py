@@ -0,0 +1,103 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/migrations/versions/0001_baseline.py
+
+"""baseline
+
+Schema as created by `Base.metadata.create_all` before migrations were
+introduced. Existing databases are marked with `alembic stamp 0001`.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0001"
+down_revision: str | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "jobposting",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("company", sa.String(), nullable=False),
+        sa.Column("location", sa.String(), nullable=True),
+        sa.Column("rating", sa.Float(), nullable=True),
+        sa.Column("summary", sa.String(), nullable=True),
+        sa.Column("salary", sa.String(), nullable=True),
+        sa.Column("description", sa.String(), nullable=True),
+        sa.Column("raw_url", sa.String(), nullable=False),
+        sa.Column("canonical_url", sa.String(), nullable=True),
+        sa.Column("job_key", sa.String(), nullable=True),
+        sa.Column("platform", sa.String(), nullable=False),
+        sa.Column("ingestion_source", sa.String(), nullable=False),
+        sa.Column("easy_apply", sa.Boolean(), nullable=True),
+        sa.Column("active_hiring", sa.Boolean(), nullable=True),
+        sa.Column("posted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("date_scraped", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("source_email_id", sa.String(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "platform", "job_key", name="uq_job_posting_platform_job_key"
+        ),
+        sa.UniqueConstraint("raw_url", name="uq_job_posting_raw_url"),
+    )
+
+    op.create_table(
+        "job_application",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("job_posting_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum(
+                "APPLIED",
+                "INTERVIEW",
+                "TECHNICAL_TEST",
+                "OFFER",
+                "REJECTED",
+                "WITHDRAWN",
+                name="job_application_status",
+            ),
+            nullable=False,
+        ),
+        sa.Column("job_application_date", sa.Date(), nullable=False),
+        sa.Column("notes", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["job_posting_id"], ["jobposting.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    op.create_table(
+        "job_opportunity",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("company", sa.String(), nullable=False),
+        sa.Column("location", sa.String(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column(
+            "priority",
+            sa.Enum("HIGH", "MEDIUM", "LOW", name="job_opportunity_priority"),
+            nullable=False,
+        ),
+        sa.Column("notes", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("job_opportunity")
+    op.drop_table("job_application")
+    op.drop_table("jobposting")
+    sa.Enum(name="job_opportunity_priority").drop(op.get_bind())
+    sa.Enum(name="job_application_status").drop(op.get_bind())
@@ -0,0 +1,86 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/migrations/versions/0002_hot_path_indexes.py
+
+"""hot path indexes
+
+Secondary indexes backing the repository queries: listings ordered by
+date (optionally filtered), foreign key lookups and the active board.
+`IF NOT EXISTS` keeps it safe on databases where `create_all` already
+created some of them.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0002"
+down_revision: str | None = "0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (name, table, columns, partial index predicate)
+INDEXES: list[tuple[str, str, list[str], str | None]] = [
+    # JobPostingRepository.list / list_keyset
+    ("ix_jobposting_date_scraped_id", "jobposting", ["date_scraped", "id"], None),
+    (
+        "ix_jobposting_platform_date_scraped_id",
+        "jobposting",
+        ["platform", "date_scraped", "id"],
+        None,
+    ),
+    (
+        "ix_jobposting_company_date_scraped_id",
+        "jobposting",
+        ["company", "date_scraped", "id"],
+        None,
+    ),
+    # JobPosting.job_applications (has_application filter, eager loads)
+    (
+        "ix_job_application_job_posting_id",
+        "job_application",
+        ["job_posting_id"],
+        None,
+    ),
+    # JobApplicationRepository listings
+    (
+        "ix_job_application_date_id",
+        "job_application",
+        ["job_application_date", "id"],
+        None,
+    ),
+    (
+        "ix_job_application_status_date_id",
+        "job_application",
+        ["status", "job_application_date", "id"],
+        None,
+    ),
+    # JobOpportunityRepository listings of the active board
+    ("ix_job_opportunity_active_id", "job_opportunity", ["id"], "is_active"),
+    (
+        "ix_job_opportunity_active_priority_id",
+        "job_opportunity",
+        ["priority", "id"],
+        "is_active",
+    ),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns, where in INDEXES:
+        op.create_index(
+            name,
+            table,
+            columns,
+            if_not_exists=True,
+            postgresql_where=sa.text(where) if where else None,
+        )
+
+
+def downgrade() -> None:
+    for name, table, _, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -0,0 +1,55 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/migrations/versions/0003_job_posting_search.py
+
+"""job posting search
+
+Generated tsvector over the text fields of job postings, in English and
+French, with its GIN index.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0003"
+down_revision: str | None = "0002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SEARCH_VECTOR_EXPRESSION = """
+setweight(to_tsvector('english', coalesce(title, '')), 'A')
+|| setweight(to_tsvector('french', coalesce(title, '')), 'A')
+|| setweight(to_tsvector('simple', coalesce(company, '')), 'B')
+|| setweight(to_tsvector('simple', coalesce(location, '')), 'C')
+|| setweight(to_tsvector('english', coalesce(summary, '') || ' ' || coalesce(description, '')), 'D')
+|| setweight(to_tsvector('french', coalesce(summary, '') || ' ' || coalesce(description, '')), 'D')
+"""
+
+
+def upgrade() -> None:
+    op.add_column(
+        "jobposting",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_jobposting_search_vector",
+        "jobposting",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobposting_search_vector", table_name="jobposting")
+    op.drop_column("jobposting", "search_vector")
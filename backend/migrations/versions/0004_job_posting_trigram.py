@@ -0,0 +1,39 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/migrations/versions/0004_job_posting_trigram.py
+
+"""job posting trigram
+
+Trigram indexes on company and location for fuzzy filters and prefix
+autocomplete. Creating the extension requires a role allowed to do so.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0004"
+down_revision: str | None = "0003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in ("company", "location"):
+        op.create_index(
+            f"ix_jobposting_{column}_trgm",
+            "jobposting",
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    for column in ("company", "location"):
+        op.drop_index(f"ix_jobposting_{column}_trgm", table_name="jobposting")
+    # The extension is left in place, other objects may depend on it
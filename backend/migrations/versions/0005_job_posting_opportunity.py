@@ -0,0 +1,62 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/migrations/versions/0005_job_posting_opportunity.py
+
+"""job posting opportunity
+
+Link job postings to the opportunity grouping their cross-platform
+duplicates, and store their LSH buckets. Existing postings are grouped by
+`scripts/python/cluster_postings.py`.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0005"
+down_revision: str | None = "0004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "jobposting",
+        sa.Column("job_opportunity_id", postgresql.UUID(as_uuid=True), nullable=True),
+    )
+    op.add_column(
+        "jobposting",
+        sa.Column("lsh_buckets", postgresql.ARRAY(sa.BigInteger()), nullable=True),
+    )
+    op.create_foreign_key(
+        "jobposting_job_opportunity_id_fkey",
+        "jobposting",
+        "job_opportunity",
+        ["job_opportunity_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+    op.create_index(
+        "ix_jobposting_job_opportunity_id", "jobposting", ["job_opportunity_id"]
+    )
+    op.create_index(
+        "ix_jobposting_lsh_buckets",
+        "jobposting",
+        ["lsh_buckets"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobposting_lsh_buckets", table_name="jobposting")
+    op.drop_index("ix_jobposting_job_opportunity_id", table_name="jobposting")
+    op.drop_constraint(
+        "jobposting_job_opportunity_id_fkey", "jobposting", type_="foreignkey"
+    )
+    op.drop_column("jobposting", "lsh_buckets")
+    op.drop_column("jobposting", "job_opportunity_id")
@@ -0,0 +1,69 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/migrations/versions/0006_job_posting_salary.py
+
+"""job posting salary
+
+Structured salary parsed from the free-text `salary`, with its yearly
+range indexed for pay filters. Existing postings are parsed by
+`scripts/python/backfill_salaries.py`.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0006"
+down_revision: str | None = "0005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+salary_period = sa.Enum(
+    "HOUR", "DAY", "WEEK", "MONTH", "YEAR", name="salary_period"
+)
+
+
+def upgrade() -> None:
+    salary_period.create(op.get_bind(), checkfirst=True)
+    op.add_column(
+        "jobposting", sa.Column("salary_min", sa.Numeric(12, 2), nullable=True)
+    )
+    op.add_column(
+        "jobposting", sa.Column("salary_max", sa.Numeric(12, 2), nullable=True)
+    )
+    op.add_column(
+        "jobposting", sa.Column("salary_currency", sa.String(3), nullable=True)
+    )
+    op.add_column(
+        "jobposting",
+        sa.Column(
+            "salary_period",
+            postgresql.ENUM(name="salary_period", create_type=False),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        "jobposting",
+        sa.Column("salary_yearly", postgresql.NUMRANGE(), nullable=True),
+    )
+    op.create_index(
+        "ix_jobposting_salary_yearly",
+        "jobposting",
+        ["salary_yearly"],
+        postgresql_using="gist",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobposting_salary_yearly", table_name="jobposting")
+    op.drop_column("jobposting", "salary_yearly")
+    op.drop_column("jobposting", "salary_period")
+    op.drop_column("jobposting", "salary_currency")
+    op.drop_column("jobposting", "salary_max")
+    op.drop_column("jobposting", "salary_min")
+    salary_period.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/scripts/python/backfill_salaries.py
+
+import argparse
+import asyncio
+
+from app.core.database import async_session_local, engine
+from app.ingestion.normalization.salary.parse import salary_columns
+from app.repositories.job_posting import JobPostingRepository
+
+
+async def backfill(batch_size: int):
+    parsed = seen = last_id = 0
+    try:
+        async with async_session_local() as session:
+            repo = JobPostingRepository(session)
+            while rows := await repo.list_salaries_after(last_id, limit=batch_size):
+                values = [{"id": row.id, **salary_columns(row.salary)} for row in rows]
+                await repo.update_many(values)
+                await session.commit()
+
+                last_id = rows[-1].id
+                seen += len(rows)
+                parsed += sum(
+                    value["salary_min"] is not None or value["salary_max"] is not None
+                    for value in values
+                )
+                print(f"💶 {seen} salaries parsed")
+    finally:
+        await engine.dispose()
+    print(f"✅ {parsed}/{seen} salaries structured")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Parse the salary text of existing job postings."
+    )
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    asyncio.run(backfill(args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/scripts/python/benchmark_strip_structure.py
+
+import sys
+import timeit
+from pathlib import Path
+
+from bs4 import BeautifulSoup, Comment
+
+from app.core.config import get_settings
+from app.ingestion.normalization.html.structural import strip_structure
+
+settings = get_settings()
+
+
+def strip_structure_multipass(html: str) -> BeautifulSoup:
+    """Previous implementation: one full-tree walk per removal rule."""
+    soup = BeautifulSoup(html, "html.parser")
+
+    for style in soup.find_all("style"):
+        style.decompose()
+
+    for element in soup(string=lambda t: isinstance(t, Comment)):
+        element.extract()
+
+    for div in soup.find_all("div"):
+        style = str(div.get("style", "")) or ""
+        if "display:none" in style or "max-height:0" in style:
+            div.decompose()
+
+    for img in soup.find_all("img"):
+        w = img.get("width", "")
+        h = img.get("height", "")
+        if w in ("1", "0", "1px") or h in ("1", "0", "1px"):
+            img.decompose()
+
+    for meta in soup.find_all("meta"):
+        meta.decompose()
+
+    for script in soup.find_all("script"):
+        script.decompose()
+
+    return soup
+
+
+def find_inputs(paths: list[str]) -> list[Path]:
+    if paths:
+        return [Path(p) for p in paths]
+
+    # Raw bodies are the realistic input, clean fixtures are the fallback
+    files = sorted(Path(settings.sample_dir).glob("*/*/body_raw.html"))
+    return files or sorted(Path(settings.fixture_dir).glob("*/*/clean_*.html"))
+
+
+def main(paths: list[str], repeat: int = 5) -> int:
+    files = find_inputs(paths)
+    if not files:
+        print("No HTML input found, pass file paths as arguments.")
+        return 1
+
+    documents = [f.read_text(encoding="utf-8") for f in files]
+    total_kb = sum(len(d) for d in documents) / 1024
+
+    for html in documents:
+        single = strip_structure(html).decode()
+        multi = strip_structure_multipass(html).decode()
+        if single != multi:
+            print("⚠️ Outputs differ between implementations")
+            return 1
+
+    # Parsing is shared by both implementations, report it separately
+    print(f"{len(documents)} documents, {total_kb:.0f} KB")
+    for name, func in (
+        ("parse only", lambda html: BeautifulSoup(html, "html.parser")),
+        ("multi-pass", strip_structure_multipass),
+        ("single-pass", strip_structure),
+    ):
+        best = min(
+            timeit.repeat(
+                lambda func=func: [func(html) for html in documents],
+                number=1,
+                repeat=repeat,
+            )
+        )
+        print(f"{name:>12}: {best * 1000:8.1f} ms")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/scripts/python/cluster_postings.py
+
+import argparse
+import asyncio
+
+from app.core.database import async_session_local, engine
+from app.services.job_clustering import JobClusteringService
+
+
+async def backfill(batch_size: int):
+    clustered = created = 0
+    try:
+        async with async_session_local() as session:
+            service = JobClusteringService(session=session)
+            while postings := await service.posting_repo.list_unclustered(
+                limit=batch_size
+            ):
+                created += await service.cluster(postings)
+                await session.commit()
+                clustered += len(postings)
+                print(f"🔗 {clustered} postings clustered")
+    finally:
+        await engine.dispose()
+    print(f"✅ {clustered} postings linked, {created} new opportunities")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Group job postings not linked to an opportunity yet."
+    )
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    asyncio.run(backfill(args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/scripts/python/fixture_archive.py
+
+import argparse
+from pathlib import Path
+
+from app.core.config import get_settings
+from app.ingestion.fixtures.archive import (
+    ARCHIVE_SUFFIX,
+    pack_directory,
+    unpack_archive,
+)
+
+settings = get_settings()
+
+
+def pack(root: Path, codec: str):
+    for platform_dir in sorted(p for p in root.iterdir() if p.is_dir()):
+        archive = root / f"{platform_dir.name}{ARCHIVE_SUFFIX}"
+        count = pack_directory(platform_dir, archive, codec=codec)
+        print(f"📦 {platform_dir.name}: {count} fixtures -> {archive}")
+
+
+def unpack(root: Path):
+    for archive in sorted(root.glob(f"*{ARCHIVE_SUFFIX}")):
+        platform = archive.name.removesuffix(ARCHIVE_SUFFIX)
+        count = unpack_archive(archive, root / platform)
+        print(f"📂 {platform}: {count} fixtures -> {root / platform}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert fixtures between directories and packed archives."
+    )
+    parser.add_argument("command", choices=["pack", "unpack"])
+    parser.add_argument("--root", type=Path, default=Path(settings.fixture_dir))
+    parser.add_argument("--codec", choices=["zlib", "zstd"], default="zlib")
+    args = parser.parse_args()
+
+    if args.command == "pack":
+        pack(args.root, args.codec)
+    else:
+        unpack(args.root)
+
+
+if __name__ == "__main__":
+    main()
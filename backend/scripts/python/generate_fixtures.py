@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # File: backend/scripts/python/generate_fixtures.py
 
+import argparse
 import logging
 
 from app.core.config import get_settings
@@ -17,7 +18,7 @@ settings = get_settings()
 logger = logging.getLogger(__name__)
 
 
-def generate_recent_fixtures():
+def generate_recent_fixtures(incremental: bool = False):
     parsers: dict[str, EmailParser] = {
         "indeed": IndeedParser(),
         "linkedin": LinkedInParser(),
@@ -32,8 +33,14 @@ def generate_recent_fixtures():
 
     generator = FixtureGenerator(fetcher=email_fetcher, parsers=parsers)
 
-    generator.generate()
+    generator.generate(incremental=incremental)
 
 
 if __name__ == "__main__":
-    generate_recent_fixtures()
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="keep existing entries, only write new messages and prune old ones",
+    )
+    generate_recent_fixtures(incremental=parser.parse_args().incremental)
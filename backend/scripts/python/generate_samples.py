@@ -2,6 +2,8 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # File: backend/scripts/python/generate_samples.py
 
+import argparse
+
 from app.core.config import get_settings
 from app.ingestion.extraction.email.email_alert_fetcher import EmailAlertFetcher
 from app.ingestion.extraction.email.parser_base import EmailParser
@@ -11,7 +13,7 @@ from app.ingestion.generators.samples import SampleGenerator
 settings = get_settings()
 
 
-def generate_recent_samples():
+def generate_recent_samples(incremental: bool = False):
     parsers: dict[str, EmailParser] = {
         "indeed": indeed.IndeedParser(),
         "linkedin": linkedin.LinkedInParser(),
@@ -26,8 +28,14 @@ def generate_recent_samples():
 
     generator = SampleGenerator(fetcher=email_fetcher, parsers=parsers)
 
-    generator.generate()
+    generator.generate(incremental=incremental)
 
 
 if __name__ == "__main__":
-    generate_recent_samples()
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="keep existing entries, only write new messages and prune old ones",
+    )
+    generate_recent_samples(incremental=parser.parse_args().incremental)
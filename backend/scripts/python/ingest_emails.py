@@ -7,17 +7,37 @@ import asyncio
 from app.core.config import get_settings
 from app.core.database import async_session_local
 from app.ingestion.email_ingestion import JobIngestionService
+from app.ingestion.normalization.url.resolver import RedirectCache, UrlResolver
 
 settings = get_settings()
 
 
+def build_resolver() -> UrlResolver | None:
+    if not settings.url_resolver_enabled:
+        return None
+    cache = RedirectCache(
+        settings.url_resolver_cache_path,
+        ttl=settings.url_resolver_ttl_days * 24 * 3600,
+    )
+    return UrlResolver(cache=cache)
+
+
 async def main():
-    async with async_session_local() as session:
-        service = JobIngestionService(session)
-        await service.ingest_from_email(
-            email_address=settings.email_address,
-            password=settings.email_password,
-        )
+    resolver = build_resolver()
+    try:
+        async with async_session_local() as session:
+            service = JobIngestionService(session)
+            await service.ingest_from_email(
+                email_address=settings.email_address,
+                password=settings.email_password,
+                archive_folder=settings.email_archive_folder,
+                resolver=resolver,
+            )
+    finally:
+        if resolver is not None:
+            await resolver.aclose()
+            if resolver.cache is not None:
+                resolver.cache.close()
 
 
 if __name__ == "__main__":
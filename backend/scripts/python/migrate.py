@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/scripts/python/migrate.py
+
+import argparse
+import asyncio
+
+from app.core.database import engine
+from app.db.migrations import migrate
+
+
+async def run(revision: str):
+    try:
+        current = await migrate(engine, revision)
+    finally:
+        await engine.dispose()
+    print(f"🗄️ Database schema at revision {current}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Apply database migrations. Safe to run from several workers at "
+            "once: runs are serialized by an advisory lock."
+        )
+    )
+    parser.add_argument("revision", nargs="?", default="head")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.revision))
+
+
+if __name__ == "__main__":
+    main()
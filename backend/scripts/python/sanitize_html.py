@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/scripts/python/sanitize_html.py
+
+import sys
+from pathlib import Path
+
+from app.ingestion.normalization.html.streaming import sanitize_file
+from app.ingestion.normalization.pii.patterns import get_redaction_engine
+
+
+def main(args: list[str]) -> int:
+    if len(args) not in (2, 3):
+        print("Usage: sanitize_html.py SRC DST [PLATFORM]")
+        return 1
+
+    src, dst = Path(args[0]), Path(args[1])
+    platform = args[2] if len(args) == 3 else None
+
+    # Streams the file: no tree is built, even for very large emails
+    sanitize_file(src, dst, get_redaction_engine(), platform)
+    print(f"Sanitized copy written to {dst}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
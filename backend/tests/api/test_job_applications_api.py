@@ -158,3 +158,81 @@ async def test_update_job_application_not_found(
 
     assert response.status_code == 404
     assert response.json()["detail"] == "Application not found"
+
+
+@pytest.mark.asyncio
+async def test_list_job_applications_with_filters_and_cursor(
+    async_client: AsyncClient,
+    test_session: AsyncSession,
+):
+    # Arrange
+    job_posting = JobPosting(
+        title="Platform Engineer",
+        company="CloudCo",
+        platform="indeed",
+        raw_url="https://indeed.com/viewjob?jk=cursor",
+    )
+    test_session.add(job_posting)
+    await test_session.commit()
+    await test_session.refresh(job_posting)
+
+    for day, application_status in [
+        (1, "applied"),
+        (2, "interview"),
+        (3, "interview"),
+        (4, "interview"),
+    ]:
+        test_session.add(
+            JobApplication(
+                job_posting_id=job_posting.id,
+                job_application_date=date(2025, 2, day),
+                status=application_status,
+            )
+        )
+    await test_session.commit()
+
+    # Act
+    seen: list[str] = []
+    cursor = ""
+    while cursor is not None:
+        response = await async_client.get(
+            "/job-applications",
+            params={
+                "status": "interview",
+                "applied_to": "2025-02-03",
+                "limit": 1,
+                "cursor": cursor,
+            },
+        )
+        assert response.status_code == 200
+        page = response.json()
+        seen += [item["job_application_date"] for item in page["items"]]
+        cursor = page["next_cursor"]
+
+    # Assert
+    assert seen == ["2025-02-03", "2025-02-02"]
+
+
+@pytest.mark.asyncio
+async def test_list_job_applications_invalid_cursor(
+    async_client: AsyncClient,
+):
+    response = await async_client.get(
+        "/job-applications", params={"cursor": "not-a-cursor"}
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "params", [{"limit": 0}, {"limit": -1}, {"limit": 10_000}, {"offset": -1}]
+)
+async def test_list_job_applications_rejects_invalid_page(
+    async_client: AsyncClient,
+    params: dict,
+):
+    response = await async_client.get("/job-applications", params=params)
+
+    assert response.status_code == 422
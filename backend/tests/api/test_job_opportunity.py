@@ -74,6 +74,38 @@ async def test_list_job_opportunities(async_client: AsyncClient):
     assert len(data) >= 2
 
 
+async def test_list_job_opportunities_with_cursor(async_client: AsyncClient):
+    created = [(await create_job_opportunity(async_client))["id"] for _ in range(3)]
+    deactivated = created[1]
+    res = await async_client.patch(f"/job-opportunities/{deactivated}/deactivate")
+    assert res.status_code == 200
+
+    seen: list[str] = []
+    cursor = ""
+    while cursor is not None:
+        res = await async_client.get(
+            "/job-opportunities",
+            params={"limit": 1, "cursor": cursor, "is_active": True},
+        )
+        assert res.status_code == 200
+        page = res.json()
+        seen += [o["id"] for o in page["items"]]
+        cursor = page["next_cursor"]
+
+    # Newest first, inactive ones filtered out
+    assert seen == [created[2], created[0]]
+
+
+@pytest.mark.parametrize(
+    "params", [{"limit": 0}, {"limit": -1}, {"limit": 10_000}, {"offset": -1}]
+)
+async def test_list_job_opportunities_rejects_invalid_page(
+    async_client: AsyncClient, params: dict
+):
+    res = await async_client.get("/job-opportunities", params=params)
+    assert res.status_code == 422
+
+
 async def test_job_opportunity_not_found(async_client: AsyncClient):
     fake_id = "00000000-0000-0000-0000-000000000000"
 
@@ -192,3 +192,167 @@ async def test_update_nonexistent_job_posting(async_client):
     resp = await async_client.patch("/job-postings/99999", json=update_payload)
     assert resp.status_code == 404
     assert resp.json() == {"detail": "Job Posting not found"}
+
+
+# --- LIST Job Offers (cursor) ---
+@pytest.mark.asyncio
+async def test_list_job_postings_with_cursor(async_client):
+    for i in range(5):
+        payload = {
+            "title": f"Job {i}",
+            "company": "PageCorp",
+            "raw_url": f"https://example.com/job/page-{i}",
+            "platform": "test",
+        }
+        r = await async_client.post("/job-postings", json=payload)
+        assert r.status_code == 201
+
+    seen: list[str] = []
+    cursor = ""
+    while cursor is not None:
+        resp = await async_client.get(
+            "/job-postings", params={"limit": 2, "cursor": cursor}
+        )
+        assert resp.status_code == 200
+        page = resp.json()
+        assert len(page["items"]) <= 2
+        seen += [j["title"] for j in page["items"]]
+        cursor = page["next_cursor"]
+
+    # Newest first, every posting exactly once
+    assert seen == [f"Job {i}" for i in reversed(range(5))]
+
+
+@pytest.mark.asyncio
+async def test_list_job_postings_invalid_cursor(async_client):
+    resp = await async_client.get("/job-postings", params={"cursor": "garbage"})
+    assert resp.status_code == 400
+    assert resp.json() == {"detail": "Invalid cursor"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "params", [{"limit": 0}, {"limit": -1}, {"limit": 10_000}, {"offset": -1}]
+)
+async def test_list_job_postings_rejects_invalid_page(async_client, params):
+    resp = await async_client.get("/job-postings", params=params)
+    assert resp.status_code == 422
+
+
+# --- SEARCH Job Offers ---
+@pytest.mark.asyncio
+async def test_search_job_postings(async_client):
+    postings = [
+        ("Développeur Python", "Licorne", "Nous recherchons des développeurs"),
+        ("Data Engineer", "Acme", "Build Python data pipelines"),
+        ("Comptable", "Chiffres SA", "Tenue de la comptabilité"),
+    ]
+    for i, (title, company, summary) in enumerate(postings):
+        payload = {
+            "title": title,
+            "company": company,
+            "summary": summary,
+            "raw_url": f"https://example.com/job/search-{i}",
+            "platform": "test",
+        }
+        r = await async_client.post("/job-postings", json=payload)
+        assert r.status_code == 201
+
+    resp = await async_client.get("/job-postings/search", params={"q": "python"})
+    assert resp.status_code == 200
+    hits = resp.json()
+
+    # Title matches rank above summary matches
+    assert [h["job_posting"]["title"] for h in hits] == [
+        "Développeur Python",
+        "Data Engineer",
+    ]
+    assert hits[0]["rank"] >= hits[1]["rank"]
+    assert "<mark>Python</mark>" in hits[1]["highlight"]
+
+    # Stemmed: the plural matches the title, "-" excludes
+    resp = await async_client.get(
+        "/job-postings/search", params={"q": "développeurs -comptable"}
+    )
+    assert [h["job_posting"]["company"] for h in resp.json()] == ["Licorne"]
+
+
+@pytest.mark.asyncio
+async def test_search_job_postings_requires_query(async_client):
+    resp = await async_client.get("/job-postings/search")
+    assert resp.status_code == 422
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("params", [{"limit": 0}, {"limit": 10_000}, {"offset": -1}])
+async def test_search_job_postings_rejects_invalid_page(async_client, params):
+    resp = await async_client.get("/job-postings/search", params={"q": "x", **params})
+    assert resp.status_code == 422
+
+
+# --- Fuzzy filters and autocomplete ---
+@pytest.mark.asyncio
+async def test_fuzzy_company_filter_and_suggest(async_client):
+    companies = ["Licorne Society", "LICORNE SOCIETY SAS", "Licorne Society", "Acme"]
+    for i, company in enumerate(companies):
+        payload = {
+            "title": "Backend Developer",
+            "company": company,
+            "location": "Paris",
+            "raw_url": f"https://example.com/job/fuzzy-{i}",
+            "platform": "test",
+        }
+        r = await async_client.post("/job-postings", json=payload)
+        assert r.status_code == 201
+
+    resp = await async_client.get(
+        "/job-postings", params={"company_search": "licorne societe"}
+    )
+    assert resp.status_code == 200
+    assert sorted(j["company"] for j in resp.json()) == sorted(companies[:3])
+
+    resp = await async_client.get(
+        "/job-postings/suggest", params={"field": "company", "prefix": "lic"}
+    )
+    assert resp.status_code == 200
+    # Most frequent first
+    assert resp.json() == ["Licorne Society", "LICORNE SOCIETY SAS"]
+
+    resp = await async_client.get(
+        "/job-postings/suggest", params={"field": "salary", "prefix": "lic"}
+    )
+    assert resp.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_salary_filters(async_client):
+    salaries = [
+        "45 000 € - 55 000 € par an",
+        "De 2 000 € à 2 500 € par mois",
+        "À partir de 70 000 € par an",
+        "Salaire selon profil",
+    ]
+    for i, salary in enumerate(salaries):
+        payload = {
+            "title": "Data Engineer",
+            "company": "Acme",
+            "salary": salary,
+            "raw_url": f"https://example.com/job/salary-{i}",
+            "platform": "test",
+        }
+        r = await async_client.post("/job-postings", json=payload)
+        assert r.status_code == 201
+
+    assert r.json()["salary_min"] is None
+    resp = await async_client.get(
+        "/job-postings", params={"min_salary": 50000, "salary_currency": "eur"}
+    )
+    assert resp.status_code == 200
+    assert sorted(j["salary"] for j in resp.json()) == sorted(
+        [salaries[0], salaries[2]]
+    )
+
+    # 2 000 - 2 500 € a month is 24 000 - 30 000 € a year
+    resp = await async_client.get("/job-postings", params={"max_salary": 30000})
+    assert [j["salary"] for j in resp.json()] == [salaries[1]]
+    assert resp.json()[0]["salary_period"] == "month"
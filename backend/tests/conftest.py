@@ -11,8 +11,8 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 from testcontainers.postgres import PostgresContainer
 
 from app.core.database import get_session
+from app.db.migrations import migrate
 from app.main import app
-from app.models.job_posting import Base
 
 
 @pytest.fixture()
@@ -47,9 +47,8 @@ async def test_engine(postgres_container):
 
     engine = create_async_engine(async_url, echo=False)
 
-    # Create tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    # Same schema as production: built by the migrations, not the models
+    await migrate(engine)
 
     return engine
 
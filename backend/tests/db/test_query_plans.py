@@ -0,0 +1,238 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/tests/db/test_query_plans.py
+
+import json
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event, insert, text
+from sqlalchemy.dialects.postgresql import Range
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from uuid6 import uuid7
+
+from app.db.migrations import migrate
+from app.models.job_application import JobApplication, JobApplicationStatus
+from app.models.job_opportunity import JobOpportunity, JobOpportunityPriority
+from app.models.job_posting import JobPosting
+from app.repositories.job_application import JobApplicationRepository
+from app.repositories.job_opportunity import JobOpportunityRepository
+from app.repositories.job_posting import JobPostingRepository
+from app.repositories.pagination import encode_cursor
+
+# Sequential scans are only tolerated on tables smaller than this
+SEQ_SCAN_MAX_ROWS = 1_000
+
+POSTINGS = 20_000
+APPLICATIONS = 10_000
+OPPORTUNITIES = 10_000
+
+NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
+# Every repository query the API runs, with representative arguments
+QUERIES = {
+    "job_posting.get_by_id": lambda s: JobPostingRepository(s).get_by_id(42),
+    "job_posting.get_by_raw_url": lambda s: JobPostingRepository(s).get_by_raw_url(
+        "https://example.com/jobs/42"
+    ),
+    "job_posting.get_by_job_key": lambda s: JobPostingRepository(s).get_by_job_key(
+        platform="indeed", job_key="key-42"
+    ),
+    "job_posting.get_with_applications": lambda s: JobPostingRepository(
+        s
+    ).get_with_applications(42),
+    "job_posting.list": lambda s: JobPostingRepository(s).list(),
+    "job_posting.list[platform]": lambda s: JobPostingRepository(s).list(
+        platform="linkedin"
+    ),
+    "job_posting.list[company]": lambda s: JobPostingRepository(s).list(
+        company="Company 7"
+    ),
+    "job_posting.list[has_application]": lambda s: JobPostingRepository(s).list(
+        has_application=True
+    ),
+    "job_posting.list[no_application]": lambda s: JobPostingRepository(s).list(
+        has_application=False
+    ),
+    "job_posting.list_keyset": lambda s: JobPostingRepository(s).list_keyset(
+        cursor=encode_cursor(NOW - timedelta(minutes=POSTINGS // 2), POSTINGS // 2)
+    ),
+    "job_posting.list[company_search]": lambda s: JobPostingRepository(s).list(
+        company_search="licorne"
+    ),
+    "job_posting.list[min_salary]": lambda s: JobPostingRepository(s).list(
+        min_salary=Decimal(120_000)
+    ),
+    "job_posting.list_salaries_after": lambda s: JobPostingRepository(
+        s
+    ).list_salaries_after(POSTINGS // 2),
+    "job_posting.suggest": lambda s: JobPostingRepository(s).suggest(
+        "company", "Company 49"
+    ),
+    "job_posting.list_clustered_by_buckets": lambda s: JobPostingRepository(
+        s
+    ).list_clustered_by_buckets([1, 2, 3]),
+    "job_posting.list_unclustered": lambda s: JobPostingRepository(
+        s
+    ).list_unclustered(),
+    "job_posting.search": lambda s: JobPostingRepository(s).search("kubernetes"),
+    "job_application.get_by_id_with_job_posting": lambda s: JobApplicationRepository(
+        s
+    ).get_by_id_with_job_posting(42),
+    "job_application.list_with_job_posting": lambda s: JobApplicationRepository(
+        s
+    ).list_with_job_posting(),
+    "job_application.list_with_job_posting[status]": lambda s: (
+        JobApplicationRepository(s).list_with_job_posting(
+            status=JobApplicationStatus.INTERVIEW
+        )
+    ),
+    "job_application.list_keyset_with_job_posting": lambda s: (
+        JobApplicationRepository(s).list_keyset_with_job_posting(
+            applied_from=date(2025, 1, 1),
+            applied_to=date(2025, 6, 30),
+            cursor=encode_cursor(date(2025, 3, 1), APPLICATIONS // 2),
+        )
+    ),
+    "job_opportunity.get_by_id": lambda s: JobOpportunityRepository(s).get_by_id(
+        uuid7()
+    ),
+    "job_opportunity.list_page": lambda s: JobOpportunityRepository(s).list_page(
+        offset=0, limit=50
+    ),
+    "job_opportunity.list_keyset[active]": lambda s: JobOpportunityRepository(
+        s
+    ).list_keyset(limit=50, is_active=True),
+    "job_opportunity.list_keyset[active, priority]": lambda s: (
+        JobOpportunityRepository(s).list_keyset(
+            limit=50, is_active=True, priority=JobOpportunityPriority.HIGH
+        )
+    ),
+}
+
+
+async def seed(connection) -> None:
+    await connection.execute(
+        insert(JobPosting),
+        [
+            {
+                "title": f"Engineer {i}",
+                "company": (
+                    "Licorne Society SAS" if i % 1000 == 0 else f"Company {i % 500}"
+                ),
+                "platform": ("indeed", "linkedin", "wttj")[i % 3],
+                "raw_url": f"https://example.com/jobs/{i}",
+                "job_key": f"key-{i}",
+                "summary": "Kubernetes platform team" if i % 1000 == 0 else None,
+                "salary_yearly": (
+                    Range(Decimal(150_000), Decimal(180_000), bounds="[]")
+                    if i % 1000 == 0
+                    else Range(
+                        Decimal(30_000 + i % 50 * 1000),
+                        Decimal(35_000 + i % 50 * 1000),
+                        bounds="[]",
+                    )
+                ),
+                "ingestion_source": "email",
+                "date_scraped": NOW - timedelta(minutes=i),
+            }
+            for i in range(1, POSTINGS + 1)
+        ],
+    )
+    statuses = list(JobApplicationStatus)
+    await connection.execute(
+        insert(JobApplication),
+        [
+            {
+                "job_posting_id": i * 7 % POSTINGS + 1,
+                "status": statuses[i % len(statuses)],
+                "job_application_date": date(2024, 1, 1) + timedelta(days=i % 730),
+                "created_at": NOW,
+                "updated_at": NOW,
+            }
+            for i in range(APPLICATIONS)
+        ],
+    )
+    priorities = list(JobOpportunityPriority)
+    await connection.execute(
+        insert(JobOpportunity),
+        [
+            {
+                "id": uuid7(),
+                "title": f"Opportunity {i}",
+                "company": f"Company {i % 500}",
+                "is_active": i % 5 != 0,
+                "priority": priorities[i % len(priorities)],
+                "created_at": NOW,
+                "updated_at": NOW,
+            }
+            for i in range(OPPORTUNITIES)
+        ],
+    )
+    await connection.execute(text("ANALYZE"))
+
+
+def seq_scans(plan: dict) -> list[str]:
+    found = []
+    if plan["Node Type"] == "Seq Scan":
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found += seq_scans(child)
+    return found
+
+
+@pytest.fixture
+async def seeded_engine(postgres_container):
+    url = make_url(postgres_container.get_connection_url())
+    engine = create_async_engine(url.set(drivername="postgresql+asyncpg"))
+
+    await migrate(engine)
+    async with engine.begin() as conn:
+        await seed(conn)
+
+    yield engine
+    await engine.dispose()
+
+
+async def test_repository_queries_avoid_sequential_scans(seeded_engine):
+    async with seeded_engine.connect() as conn:
+        result = await conn.execute(
+            text(
+                "SELECT relname, reltuples FROM pg_class "
+                "WHERE relkind = 'r' AND relnamespace = 'public'::regnamespace"
+            )
+        )
+        table_rows = dict(result.all())
+
+    # Collect the SQL actually sent by each repository call
+    captured: list[tuple[str, str, object]] = []
+    current = ""
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append((current, statement, parameters))
+
+    event.listen(seeded_engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        for name, query in QUERIES.items():
+            current = name
+            async with AsyncSession(seeded_engine) as session:
+                await query(session)
+    finally:
+        event.remove(seeded_engine.sync_engine, "before_cursor_execute", capture)
+
+    violations = []
+    async with seeded_engine.connect() as conn:
+        for name, statement, parameters in captured:
+            result = await conn.exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {statement}", parameters
+            )
+            plan = result.scalar_one()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            for table in seq_scans(plan[0]["Plan"]):
+                if table_rows.get(table, 0) > SEQ_SCAN_MAX_ROWS:
+                    violations.append(f"{name}: Seq Scan on {table}\n{statement}")
+
+    assert {name for name, _, _ in captured} == set(QUERIES)
+    assert not violations, "\n\n".join(violations)
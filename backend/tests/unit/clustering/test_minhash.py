@@ -0,0 +1,53 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/tests/unit/clustering/test_minhash.py
+
+import pytest
+
+from app.clustering.minhash import MinHasher
+from app.clustering.normalize import posting_features
+
+
+def jaccard(a: set, b: set) -> float:
+    return len(a & b) / len(a | b)
+
+
+def test_signature_is_deterministic_across_instances():
+    features = posting_features("Data Engineer", "Acme", "Paris")
+
+    assert MinHasher().signature(features) == MinHasher().signature(features)
+    assert len(MinHasher().signature(features)) == 64
+
+
+def test_similarity_estimates_jaccard():
+    hasher = MinHasher(num_perm=256, bands=32)
+    a = posting_features("Data Engineer (H/F)", "Licorne Society", "Paris (75)")
+    b = posting_features("Data Engineer", "LICORNE SOCIETY SAS", "Paris")
+    c = posting_features("Comptable", "Chiffres SA", "Lille")
+
+    estimate = hasher.similarity(hasher.signature(a), hasher.signature(b))
+    assert estimate == pytest.approx(jaccard(a, b), abs=0.1)
+    assert hasher.similarity(hasher.signature(a), hasher.signature(c)) < 0.2
+
+
+def test_duplicates_share_a_bucket():
+    hasher = MinHasher()
+    a = hasher.signature(posting_features("Data Engineer H/F", "Licorne", "Paris"))
+    b = hasher.signature(posting_features("Data Engineer", "Licorne SAS", "Paris"))
+
+    buckets = hasher.buckets(a)
+    assert len(buckets) == 16
+    assert all(-(2**63) <= bucket < 2**63 for bucket in buckets)
+    assert set(buckets) & set(hasher.buckets(b))
+
+
+def test_empty_features_have_no_buckets():
+    hasher = MinHasher()
+
+    assert hasher.signature([]) == ()
+    assert hasher.buckets(()) == []
+    assert hasher.similarity((), ()) == 0.0
+
+
+def test_bands_must_divide_permutations():
+    with pytest.raises(ValueError):
+        MinHasher(num_perm=64, bands=10)
@@ -0,0 +1,49 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/tests/unit/clustering/test_normalize.py
+
+from app.clustering.normalize import (
+    company_shingles,
+    normalize_company,
+    normalize_location,
+    normalize_title,
+    overlap,
+    posting_features,
+    shingles,
+)
+
+
+def test_title_drops_gender_markers_and_accents():
+    assert normalize_title("Développeur Python (H/F)") == "developpeur python"
+    assert normalize_title("Data Engineer F/H - CDI") == "data engineer cdi"
+    assert normalize_title("Ingénieur DevOps M/W/D") == "ingenieur devops"
+
+
+def test_company_drops_legal_suffixes():
+    assert normalize_company("LICORNE SOCIETY SAS") == "licorne society"
+    assert normalize_company("Acme, Inc.") == "acme"
+
+
+def test_location_keeps_the_city():
+    assert normalize_location("Paris (75)") == "paris"
+    assert normalize_location("Paris, Île-de-France") == "paris"
+    assert normalize_location("Lyon 3e - Auvergne-Rhône-Alpes") == "lyon 3e"
+    assert normalize_location(None) == ""
+
+
+def test_shingles():
+    assert shingles("ab") == {" ab", "ab "}
+    assert shingles("") == set()
+
+
+def test_features_are_prefixed_by_field():
+    features = posting_features("Paris", "Paris", "Paris")
+
+    assert {f[:2] for f in features} == {"t:", "c:", "l:"}
+
+
+def test_company_overlap_accepts_contained_names():
+    licorne = company_shingles("Licorne")
+
+    assert overlap(licorne, company_shingles("LICORNE SOCIETY SAS")) >= 0.8
+    assert overlap(licorne, company_shingles("Acme")) == 0.0
+    assert overlap(set(), licorne) == 0.0
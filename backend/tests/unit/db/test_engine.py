@@ -0,0 +1,65 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/tests/unit/db/test_engine.py
+
+from app.core.config import get_settings
+from app.core.database import build_engine_kwargs
+
+
+def settings_with(**overrides):
+    return get_settings().model_copy(update=overrides)
+
+
+def test_echo_follows_debug():
+    assert build_engine_kwargs(settings_with(debug=True))["echo"] is True
+    assert build_engine_kwargs(settings_with(debug=False))["echo"] is False
+
+
+def test_pool_options_come_from_settings():
+    kwargs = build_engine_kwargs(
+        settings_with(
+            db_pool_size=20,
+            db_max_overflow=5,
+            db_pool_timeout=2.5,
+            db_pool_recycle=600,
+            db_pool_pre_ping=False,
+        )
+    )
+
+    assert kwargs["pool_size"] == 20
+    assert kwargs["max_overflow"] == 5
+    assert kwargs["pool_timeout"] == 2.5
+    assert kwargs["pool_recycle"] == 600
+    assert kwargs["pool_pre_ping"] is False
+
+
+def test_asyncpg_statement_cache_and_timeout():
+    connect_args = build_engine_kwargs(
+        settings_with(
+            database_url="postgresql+asyncpg://u:p@db:5432/jobai",
+            db_statement_cache_size=0,
+            db_statement_timeout_ms=5000,
+        )
+    )["connect_args"]
+
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    assert connect_args["server_settings"]["statement_timeout"] == "5000"
+
+
+def test_statement_timeout_can_be_disabled():
+    connect_args = build_engine_kwargs(
+        settings_with(
+            database_url="postgresql+asyncpg://u:p@db:5432/jobai",
+            db_statement_timeout_ms=0,
+        )
+    )["connect_args"]
+
+    assert "statement_timeout" not in connect_args["server_settings"]
+
+
+def test_no_asyncpg_options_for_other_drivers():
+    kwargs = build_engine_kwargs(
+        settings_with(database_url="postgresql+psycopg://u:p@db:5432/jobai")
+    )
+
+    assert "connect_args" not in kwargs
@@ -0,0 +1,57 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/tests/unit/db/test_migrations.py
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from alembic.script import ScriptDirectory
+from sqlalchemy.exc import DBAPIError
+
+from app.db.migrations import (
+    SchemaRevisionMismatch,
+    alembic_config,
+    check_schema_revision,
+    head_revision,
+)
+
+
+def connection_at(revision: str | None):
+    conn = AsyncMock()
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = revision
+    conn.execute.return_value = result
+    return conn
+
+
+def test_migrations_have_a_single_head():
+    script = ScriptDirectory.from_config(alembic_config())
+
+    assert script.get_heads() == [head_revision()]
+
+
+async def test_check_passes_at_head():
+    conn = connection_at(head_revision())
+
+    await check_schema_revision(conn)
+
+    conn.execute.assert_awaited_once()
+
+
+async def test_check_fails_when_behind():
+    with pytest.raises(SchemaRevisionMismatch) as exc:
+        await check_schema_revision(connection_at("0001"))
+
+    assert exc.value.current == "0001"
+    assert exc.value.expected == head_revision()
+    assert "make migrate" in str(exc.value)
+
+
+async def test_check_fails_on_unmigrated_database():
+    conn = AsyncMock()
+    conn.execute.side_effect = DBAPIError("SELECT", {}, Exception("no table"))
+
+    with pytest.raises(SchemaRevisionMismatch) as exc:
+        await check_schema_revision(conn)
+
+    assert exc.value.current is None
+    conn.rollback.assert_awaited_once()
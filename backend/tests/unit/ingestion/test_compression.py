@@ -0,0 +1,136 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/tests/unit/ingestion/test_compression.py
+
+import zlib
+
+from app.ingestion.extraction.email.compression import DeflateIMAP4_SSL
+
+HTML = b"<table><tr><td style='color:red'>job</td></tr></table>" * 200
+
+
+def deflate(data: bytes) -> bytes:
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+
+class FakeServer:
+    """
+    Scripted IMAP server standing in for both the socket and its file.
+
+    Replies to each command line the client sends, and switches both
+    directions to raw deflate once COMPRESS DEFLATE is accepted.
+    """
+
+    def __init__(self, accept_compress: bool = True):
+        self.accept_compress = accept_compress
+        self.commands: list[bytes] = []
+        self.wire_sent = 0
+        self._out = bytearray()
+        self._deflate = None
+        self._inflate = None
+        self._push(b"* PREAUTH ready\r\n")
+
+    def _push(self, data: bytes) -> None:
+        if self._deflate is not None:
+            data = self._deflate.compress(data) + self._deflate.flush(zlib.Z_SYNC_FLUSH)
+        self.wire_sent += len(data)
+        self._out += data
+
+    # --- socket ---
+    def sendall(self, data: bytes) -> None:
+        if self._inflate is not None:
+            data = self._inflate.decompress(data)
+        for line in data.splitlines():
+            self._reply(line)
+
+    def _reply(self, line: bytes) -> None:
+        self.commands.append(line)
+        tag, command = line.split(b" ", 1)
+        if command == b"CAPABILITY":
+            self._push(b"* CAPABILITY IMAP4rev1 COMPRESS=DEFLATE\r\n")
+        elif command == b"COMPRESS DEFLATE":
+            if not self.accept_compress:
+                self._push(tag + b" NO not supported\r\n")
+                return
+            self._push(tag + b" OK DEFLATE active\r\n")
+            self._deflate = zlib.compressobj(
+                zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15
+            )
+            self._inflate = zlib.decompressobj(-15)
+            return
+        elif command.startswith(b"SELECT"):
+            self._push(b"* 1 EXISTS\r\n")
+        elif command.startswith(b"UID FETCH"):
+            self._push(b"* 1 FETCH (UID 1 RFC822 {%d}\r\n" % len(HTML) + HTML)
+            self._push(b")\r\n")
+        self._push(tag + b" OK done\r\n")
+
+    # --- file ---
+    def readline(self, limit: int = -1) -> bytes:
+        end = self._out.find(b"\n") + 1 or len(self._out)
+        return self.read(end)
+
+    def read(self, size: int) -> bytes:
+        data = bytes(self._out[:size])
+        del self._out[:size]
+        return data
+
+    read1 = read
+
+
+class ScriptedIMAP(DeflateIMAP4_SSL):
+    def __init__(self, server: FakeServer):
+        self.server = server
+        super().__init__("imap.test")
+
+    def open(self, host="", port=993, timeout=None):
+        self.host, self.port = host, port
+        self.sock = self.file = self.server
+
+
+def test_uncompressed_reads_are_counted():
+    server = FakeServer()
+    conn = ScriptedIMAP(server)
+
+    assert "COMPRESS=DEFLATE" in conn.capabilities
+    assert conn.compressed is False
+    assert conn.stats.wire_received == conn.stats.data_received == server.wire_sent
+
+
+def test_enable_compression_through_imaplib():
+    server = FakeServer()
+    conn = ScriptedIMAP(server)
+
+    assert conn.enable_compression() is True
+    assert conn.compressed is True
+    assert server.commands[-1].endswith(b" COMPRESS DEFLATE")
+
+    # Commands are deflated on the way out, responses inflated on the way in
+    assert conn.noop()[0] == "OK"
+    assert server.commands[-1].endswith(b" NOOP")
+    assert conn.stats.wire_sent != conn.stats.data_sent
+
+
+def test_compressed_literal():
+    server = FakeServer()
+    conn = ScriptedIMAP(server)
+    conn.enable_compression()
+    conn.select("INBOX")
+    before = conn.stats.data_received, conn.stats.wire_received
+
+    status, data = conn.uid("FETCH", "1", "(RFC822)")
+
+    assert status == "OK"
+    assert data[0][1] == HTML
+    received = conn.stats.data_received - before[0]
+    wire = conn.stats.wire_received - before[1]
+    assert received > len(HTML)
+    assert received / wire > 5
+
+
+def test_enable_compression_refused():
+    conn = ScriptedIMAP(FakeServer(accept_compress=False))
+
+    assert conn.enable_compression() is False
+    assert conn.compressed is False
+    assert conn.noop()[0] == "OK"
@@ -0,0 +1,112 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/tests/unit/ingestion/test_fixture_archive.py
+
+import pytest
+
+from app.ingestion.fixtures import archive as archive_module
+from app.ingestion.fixtures.archive import (
+    FixtureArchive,
+    FixtureDirectory,
+    open_fixtures,
+    pack_directory,
+    unpack_archive,
+)
+
+FIXTURES = {
+    "2025-01-02_11": {
+        "clean_11.html": "<p>Data Engineer</p>" * 50,
+        "net_headers_11.json": '{"subject": "Data"}',
+    },
+    "2025-01-03_12": {
+        "clean_12.html": "<p>Développeur Python €</p>",
+        "response_12.json": '{"count": 0, "jobs": []}',
+    },
+}
+
+
+@pytest.fixture
+def fixtures_root(tmp_path):
+    for fixture_id, files in FIXTURES.items():
+        fixture_dir = tmp_path / "indeed" / fixture_id
+        fixture_dir.mkdir(parents=True)
+        for name, content in files.items():
+            (fixture_dir / name).write_text(content, encoding="utf-8")
+    return tmp_path
+
+
+def test_pack_and_read(fixtures_root):
+    path = fixtures_root / "indeed.fxpack"
+
+    assert pack_directory(fixtures_root / "indeed", path) == 2
+
+    with FixtureArchive(path) as packed:
+        assert packed.ids() == sorted(FIXTURES)
+        for fixture_id, files in FIXTURES.items():
+            assert packed.names(fixture_id) == sorted(files)
+            for name, content in files.items():
+                assert packed.read(fixture_id, name).decode() == content
+
+        with pytest.raises(FileNotFoundError):
+            packed.read("2025-01-02_11", "missing.json")
+
+
+def test_only_requested_files_are_decompressed(fixtures_root):
+    path = fixtures_root / "indeed.fxpack"
+    pack_directory(fixtures_root / "indeed", path)
+
+    calls = []
+    packed = FixtureArchive(path)
+    decompress = packed._decompress
+    packed._decompress = lambda blob: calls.append(blob) or decompress(blob)
+
+    packed.read("2025-01-03_12", "clean_12.html")
+
+    assert len(calls) == 1
+    packed.close()
+
+
+def test_unpack_restores_layout(fixtures_root, tmp_path_factory):
+    path = fixtures_root / "indeed.fxpack"
+    pack_directory(fixtures_root / "indeed", path)
+    destination = tmp_path_factory.mktemp("unpacked")
+
+    assert unpack_archive(path, destination) == 2
+
+    restored = FixtureDirectory(destination)
+    original = FixtureDirectory(fixtures_root / "indeed")
+    assert restored.ids() == original.ids()
+    for fixture_id in original.ids():
+        for name in original.names(fixture_id):
+            assert restored.read(fixture_id, name) == original.read(fixture_id, name)
+
+
+def test_directory_ignores_staging_directories(fixtures_root):
+    (fixtures_root / "indeed" / ".2025-01-04_13.tmp").mkdir()
+
+    assert FixtureDirectory(fixtures_root / "indeed").ids() == sorted(FIXTURES)
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "indeed.fxpack"
+    path.write_bytes(b"not an archive, but long enough to have a footer")
+
+    with pytest.raises(ValueError):
+        FixtureArchive(path)
+
+
+def test_zstd_requires_optional_package(fixtures_root, monkeypatch):
+    monkeypatch.setattr(archive_module, "zstandard", None)
+
+    with pytest.raises(ValueError):
+        pack_directory(fixtures_root / "indeed", fixtures_root / "x.fxpack", "zstd")
+
+
+def test_open_fixtures_prefers_archive(fixtures_root):
+    assert isinstance(open_fixtures(fixtures_root, "indeed"), FixtureDirectory)
+
+    pack_directory(fixtures_root / "indeed", fixtures_root / "indeed.fxpack")
+    store = open_fixtures(fixtures_root, "indeed")
+
+    assert isinstance(store, FixtureArchive)
+    assert store.read("2025-01-02_11", "net_headers_11.json") == b'{"subject": "Data"}'
+    store.close()
@@ -0,0 +1,63 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/tests/unit/ingestion/test_headers.py
+
+import email
+
+from app.ingestion.extraction.email.headers import (
+    LazyHeaders,
+    codec_for,
+    decode_header_value,
+)
+from app.ingestion.normalization.headers.whitelist import whitelist_headers
+
+RAW = (
+    b"From: =?UTF-8?Q?Alertes_LinkedIn?= <jobalerts-noreply@linkedin.com>\r\n"
+    b"Subject: =?UTF-8?B?RMOpdmVsb3BwZXVy?= =?UTF-8?B?IFB5dGhvbg==?=\r\n"
+    b"X-Tracking: =?utf-8?q?secret?=\r\n"
+    b"X-Tracking: last\r\n"
+    b"Date: Sun, 14 Dec 2025 10:00:00 +0000\r\n"
+    b"\r\n"
+    b"body"
+)
+
+
+def test_decode_joins_all_encoded_words():
+    value = "=?UTF-8?B?RMOpdmVsb3BwZXVy?= =?UTF-8?B?IFB5dGhvbg==?="
+
+    assert decode_header_value(value) == "Développeur Python"
+
+
+def test_decode_plain_value_untouched():
+    assert decode_header_value("Backend Engineer") == "Backend Engineer"
+    assert decode_header_value(None) == ""
+
+
+def test_decode_unknown_charset_falls_back_to_utf8():
+    assert decode_header_value("=?unknown-8bit?Q?caf=C3=A9?=") == "café"
+    assert codec_for("x-does-not-exist") == "utf-8"
+    assert codec_for("ISO-8859-1") == "iso8859-1"
+
+
+def test_lazy_headers_decode_on_access_only():
+    headers = LazyHeaders(email.message_from_bytes(RAW))
+
+    assert len(headers) == 4
+    assert headers._decoded == {}
+
+    assert headers["Subject"] == "Développeur Python"
+    assert list(headers._decoded) == ["subject"]
+
+
+def test_lazy_headers_last_duplicate_wins():
+    headers = LazyHeaders(email.message_from_bytes(RAW))
+
+    assert headers["x-tracking"] == "last"
+
+
+def test_whitelist_only_decodes_kept_keys():
+    headers = LazyHeaders(email.message_from_bytes(RAW))
+
+    kept = whitelist_headers(headers)
+
+    assert set(kept) == {"from", "subject", "date"}
+    assert "x-tracking" not in headers._decoded
@@ -0,0 +1,64 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/tests/unit/ingestion/test_imap_client.py
+
+from unittest.mock import MagicMock, call
+
+import pytest
+
+from app.ingestion.extraction.email.imap_client import IMAPClient
+
+
+@pytest.fixture
+def client():
+    client = IMAPClient(host="imap.example.com", username="u", password="p")
+    client.conn = MagicMock()
+    client.conn.uid.return_value = ("OK", [None])
+    return client
+
+
+def test_move_emails_uses_uid_move_in_chunks(client):
+    client.capabilities = frozenset({"MOVE", "UIDPLUS"})
+
+    moved = client.move_emails(["1", "2", "3"], "Archive", batch_size=2)
+
+    assert moved == 3
+    client.conn.create.assert_called_once_with("Archive")
+    assert client.conn.uid.call_args_list == [
+        call("MOVE", "1,2", "Archive"),
+        call("MOVE", "3", "Archive"),
+    ]
+    client.conn.expunge.assert_not_called()
+
+
+def test_move_emails_falls_back_to_copy_and_scoped_expunge(client):
+    client.capabilities = frozenset({"UIDPLUS"})
+
+    client.move_emails(["7", "8"], "Archive")
+
+    assert client.conn.uid.call_args_list == [
+        call("COPY", "7,8", "Archive"),
+        call("STORE", "7,8", "+FLAGS.SILENT", r"(\Deleted)"),
+        call("EXPUNGE", "7,8"),
+    ]
+    client.conn.expunge.assert_not_called()
+
+
+def test_move_emails_skips_failed_copy(client):
+    client.capabilities = frozenset()
+    client.conn.uid.return_value = ("NO", [b"no such mailbox"])
+
+    assert client.move_emails(["7"], "Archive") == 0
+    client.conn.expunge.assert_not_called()
+
+
+def test_delete_batch_without_uidplus_expunges_once_per_chunk(client):
+    client.capabilities = frozenset()
+
+    client.delete_emails_batch(["1", "2", "3"], batch_size=2)
+
+    assert client.conn.expunge.call_count == 2
+
+
+def test_move_emails_empty(client):
+    assert client.move_emails([], "Archive") == 0
+    client.conn.uid.assert_not_called()
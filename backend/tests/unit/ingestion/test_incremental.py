@@ -0,0 +1,126 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/tests/unit/ingestion/test_incremental.py
+
+from datetime import UTC, datetime
+from email.utils import format_datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.ingestion.extraction.email.email_alert_fetcher import (
+    EmailAlertFetcher,
+    FetchedEmail,
+)
+from app.ingestion.extraction.email.parsers.indeed import IndeedParser
+from app.ingestion.extraction.email.parsers.linkedin import LinkedInParser
+from app.ingestion.fixtures import writer
+from app.ingestion.generators.fixtures import FixtureGenerator
+from app.ingestion.generators.incremental import existing_entries, prune_entries
+
+
+def make_email(uid: int, day: int) -> FetchedEmail:
+    return FetchedEmail(
+        uid=uid,
+        sender="alert@indeed.com",
+        subject="Data Engineer",
+        msg_dt=datetime(2025, 1, day, tzinfo=UTC),
+        html="<p>No jobs</p>",
+        headers={"subject": "Data Engineer"},
+    )
+
+
+class FakeFetcher:
+    """Mailbox with ascending uids, honouring limit and skip_uids."""
+
+    def __init__(self, emails: list[FetchedEmail]):
+        self.emails = emails
+        self.downloaded: list[int] = []
+
+    def fetch_recent(self, days_back=1, sender_filter=None, limit=None, skip_uids=()):
+        # IMAP FROM is a substring match: platforms are sender domains
+        if sender_filter is None or sender_filter not in "alert@indeed.com":
+            return []
+        emails = self.emails[-limit:] if limit else self.emails
+        emails = [e for e in emails if e.uid not in skip_uids]
+        self.downloaded += [e.uid for e in emails]
+        return emails
+
+
+@pytest.fixture
+def fixture_root(monkeypatch, tmp_path):
+    monkeypatch.setattr(writer.settings, "fixture_dir", str(tmp_path))
+    monkeypatch.setattr(writer.settings, "debug", True)
+    return tmp_path
+
+
+def make_generator(fetcher: FakeFetcher) -> FixtureGenerator:
+    parsers = {"indeed": IndeedParser(), "linkedin": LinkedInParser()}
+    return FixtureGenerator(fetcher=fetcher, parsers=parsers, max_per_platform=2)
+
+
+def entry_names(root) -> list[str]:
+    return sorted(p.name for p in (root / "indeed").iterdir())
+
+
+def test_prune_keeps_newest_entries(tmp_path):
+    for name in ["2025-01-01_9", "2025-01-02_3", "2025-01-02_4", "notes"]:
+        (tmp_path / name).mkdir()
+
+    removed = prune_entries(tmp_path, keep=2)
+
+    assert [p.name for p in removed] == ["2025-01-01_9"]
+    assert sorted(existing_entries(tmp_path)) == [3, 4]
+    assert (tmp_path / "notes").exists()
+
+
+async def test_incremental_only_writes_new_messages(fixture_root):
+    fetcher = FakeFetcher([make_email(1, 1), make_email(2, 2)])
+    await make_generator(fetcher).agenerate(incremental=True)
+    assert entry_names(fixture_root) == ["2025-01-01_1", "2025-01-02_2"]
+
+    fetcher.emails.append(make_email(3, 3))
+    fetcher.downloaded.clear()
+    await make_generator(fetcher).agenerate(incremental=True)
+
+    assert fetcher.downloaded == [3]
+    assert entry_names(fixture_root) == ["2025-01-02_2", "2025-01-03_3"]
+    assert (fixture_root / "indeed" / "2025-01-03_3" / "clean_3.html").exists()
+
+
+async def test_full_mode_rewrites_everything(fixture_root):
+    stale = fixture_root / "indeed" / "2024-12-31_0"
+    stale.mkdir(parents=True)
+    fetcher = FakeFetcher([make_email(1, 1), make_email(2, 2)])
+
+    await make_generator(fetcher).agenerate()
+
+    assert not stale.exists()
+    assert fetcher.downloaded == [1, 2]
+    assert entry_names(fixture_root) == ["2025-01-01_1", "2025-01-02_2"]
+
+
+def raw_email(content_type: str) -> bytes:
+    return (
+        "From: Indeed <alert@indeed.com>\r\n"
+        "Subject: Data Engineer\r\n"
+        f"Date: {format_datetime(datetime.now(UTC))}\r\n"
+        f"Content-Type: {content_type}; charset=utf-8\r\n"
+        "\r\n"
+        "<p>Data Engineer</p>\r\n"
+    ).encode()
+
+
+def test_limit_counts_emails_passing_filters():
+    fetcher = EmailAlertFetcher("me@gmail.com", "secret")
+    fetcher.client = MagicMock(conn=None)
+    fetcher.client.has_capability.return_value = False
+    fetcher.client.search.return_value = ["1", "2", "3", "4", "5"]
+    # The newest message has no HTML body, uid 3 is already written
+    raws = {"5": raw_email("text/plain")}
+    fetcher.client.fetch_raw.side_effect = lambda uid: raws.get(
+        uid, raw_email("text/html")
+    )
+
+    emails = fetcher.fetch_recent(days_back=1, limit=3, skip_uids={3})
+
+    assert [email.uid for email in emails] == [2, 4]
@@ -0,0 +1,67 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/tests/unit/ingestion/test_mime.py
+
+import email
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+import pytest
+
+from app.ingestion.extraction.email.imap_client import IMAPClient
+from app.ingestion.extraction.email.mime import extract_html_bytes, header_block_end
+
+HTML = "<html><body><h2>Développeur Python - Paris</h2>" + "<td>x</td>" * 50
+
+
+def build_message(charset: str, nested: bool = True) -> bytes:
+    root = MIMEMultipart("mixed")
+    root["Subject"] = "Alerte"
+    alternative = MIMEMultipart("alternative")
+    alternative.attach(MIMEText("plain body", "plain", "utf-8"))
+    alternative.attach(MIMEText(HTML, "html", charset))
+    if nested:
+        root.attach(alternative)
+    else:
+        root = alternative
+    return root.as_bytes().replace(b"\n", b"\r\n")
+
+
+@pytest.mark.parametrize("charset", ["utf-8", "iso-8859-1"])
+def test_fast_path_matches_stdlib(charset):
+    raw = build_message(charset)
+
+    assert extract_html_bytes(raw) == HTML
+    assert extract_html_bytes(raw) == IMAPClient.extract_html(
+        email.message_from_bytes(raw)
+    )
+
+
+def test_quoted_printable_soft_breaks():
+    raw = (
+        b"Content-Type: text/html; charset=utf-8\r\n"
+        b"Content-Transfer-Encoding: quoted-printable\r\n"
+        b"\r\n"
+        b"<p>D=C3=A9veloppeur =\r\nPython</p>\r\n"
+    )
+
+    assert extract_html_bytes(raw) == "<p>Développeur Python</p>\r\n"
+
+
+def test_single_part_8bit_with_declared_charset():
+    raw = b'Content-Type: text/html;\r\n charset="windows-1252"\r\n\r\n<p>caf\xe9</p>'
+
+    assert extract_html_bytes(raw) == "<p>café</p>"
+
+
+def test_plain_text_only_falls_back():
+    raw = MIMEText("hello", "plain", "utf-8").as_bytes()
+
+    assert extract_html_bytes(raw) is None
+    assert IMAPClient.extract_html_raw(raw) == ""
+
+
+def test_header_block_end():
+    raw = b"Subject: x\r\nFrom: y\r\n\r\nbody"
+
+    assert raw[: header_block_end(raw)] == b"Subject: x\r\nFrom: y"
+    assert IMAPClient.parse_headers(raw)["subject"] == "x"
@@ -0,0 +1,89 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/tests/unit/ingestion/test_sample_writer.py
+
+import re
+from datetime import UTC, datetime
+
+import pytest
+from bs4 import BeautifulSoup
+
+from app.ingestion.fixtures.writer import build_fixture
+from app.ingestion.normalization.html import structural
+from app.ingestion.normalization.html.pii import redact_pii
+from app.ingestion.normalization.html.structural import register_rule, strip_structure
+from app.ingestion.normalization.pii.engine import RedactionEngine
+from app.ingestion.samples import writer
+
+HTML = """
+<html><head><style>p {}</style></head><body>
+<div style="display:none">Preview</div>
+<p>Bonjour Jane,</p>
+<a href="https://fr.indeed.com/rc/clk/?jk=abc&tk=secret">Data Engineer</a>
+</body></html>
+"""
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    # Independent of the USER_* settings of the environment
+    engine = RedactionEngine(
+        re.compile(r"\bJane\b", flags=re.IGNORECASE),
+        re.compile(r"jane\.doe@gmail\.com", flags=re.IGNORECASE),
+    )
+    monkeypatch.setattr(writer, "get_redaction_engine", lambda: engine)
+    return engine
+
+
+def test_shared_document_gives_same_outputs(monkeypatch, tmp_path, engine):
+    monkeypatch.setattr(writer.settings, "sample_dir", str(tmp_path))
+    monkeypatch.setattr(writer.settings, "debug", True)
+    msg_date = datetime(2025, 1, 2, tzinfo=UTC)
+
+    document = BeautifulSoup(HTML, "html.parser")
+    writer.create_sample("indeed", HTML, {}, [], 42, msg_date, document=document)
+
+    (sample_dir,) = (tmp_path / "indeed").iterdir()
+    struct = strip_structure(HTML)
+    assert (sample_dir / "body_struct_.html").read_text() == struct.prettify()
+
+    redact_pii(struct, engine)
+    sanitized = (sample_dir / "body_sanitized_.html").read_text()
+    assert sanitized == struct.prettify()
+    assert "Jane" not in sanitized
+
+
+async def test_async_writer_matches_sync_writer(monkeypatch, tmp_path, engine):
+    monkeypatch.setattr(writer.settings, "debug", True)
+    msg_date = datetime(2025, 1, 2, tzinfo=UTC)
+    jobs = [{"raw_url": "https://fr.indeed.com/rc/clk/?jk=abc&tk=secret"}]
+
+    monkeypatch.setattr(writer.settings, "sample_dir", str(tmp_path / "sync"))
+    writer.create_sample("indeed", HTML, {"subject": "Hi"}, jobs, 1, msg_date)
+    monkeypatch.setattr(writer.settings, "sample_dir", str(tmp_path / "async"))
+    await writer.acreate_sample("indeed", HTML, {"subject": "Hi"}, jobs, 1, msg_date)
+
+    (sync_dir,) = (tmp_path / "sync" / "indeed").iterdir()
+    (async_dir,) = (tmp_path / "async" / "indeed").iterdir()
+    names = sorted(p.name for p in sync_dir.iterdir())
+    assert names == sorted(p.name for p in async_dir.iterdir())
+    for name in names:
+        assert (sync_dir / name).read_bytes() == (async_dir / name).read_bytes()
+
+    # Sanitized copies do not leak into the caller's jobs
+    assert "tk=secret" in jobs[0]["raw_url"]
+    assert b"tk=REDACTED" in (async_dir / "jobs_sanitized.json").read_bytes()
+
+
+def test_writers_apply_platform_rules(monkeypatch):
+    monkeypatch.setattr(structural, "PLATFORM_RULES", {})
+    register_rule("a", lambda attrs: True, platform="indeed")
+
+    sample = writer.build_sample("indeed", HTML, {}, [])
+    fixture = build_fixture("indeed", HTML, {}, [], 1)
+
+    assert "Data Engineer" not in sample["body_struct_.html"]
+    assert "Data Engineer" not in fixture["clean_1.html"]
+    assert (
+        "Data Engineer"
+        in writer.build_sample("linkedin", HTML, {}, [])["body_struct_.html"]
+    )
@@ -0,0 +1,127 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/tests/unit/ingestion/test_search.py
+
+from datetime import datetime
+
+import pytest
+
+from app.ingestion.extraction.email.job_extraction_service import JobExtractionService
+from app.ingestion.extraction.email.parser_base import EmailParser
+from app.ingestion.extraction.email.search import (
+    build_from_criteria,
+    build_gmail_raw_query,
+    build_search_criteria,
+    since_date,
+)
+
+
+def test_since_date_format():
+    assert since_date(2, now=datetime(2025, 12, 14)) == "12-Dec-2025"
+
+
+def test_from_criteria_single_sender():
+    assert build_from_criteria(["alert@indeed.com"]) == ["FROM", '"alert@indeed.com"']
+
+
+def test_from_criteria_ors_all_senders():
+    criteria = build_from_criteria(["a@x.com", "b@x.com", "c@x.com"])
+
+    assert criteria == [
+        "OR",
+        "OR",
+        "FROM",
+        '"a@x.com"',
+        "FROM",
+        '"b@x.com"',
+        "FROM",
+        '"c@x.com"',
+    ]
+
+
+def test_from_criteria_empty():
+    assert build_from_criteria([]) == []
+
+
+def test_gmail_raw_query():
+    query = build_gmail_raw_query(2, ["alert@indeed.com", "jobs@linkedin.com"])
+
+    assert query == "from:(alert@indeed.com OR jobs@linkedin.com) newer_than:2d"
+
+
+def test_search_criteria_standard():
+    criteria = build_search_criteria(1, ["alert@indeed.com"])
+
+    assert criteria[0] == "SINCE"
+    assert criteria[2:] == ["FROM", '"alert@indeed.com"']
+
+
+def test_search_criteria_gmail():
+    criteria = build_search_criteria(3, ["alert@indeed.com"], gmail=True)
+
+    assert criteria == ["X-GM-RAW", '"from:(alert@indeed.com) newer_than:3d"']
+
+
+def test_search_criteria_sender_filter_narrows():
+    criteria = build_search_criteria(
+        1, ["indeed.com", "linkedin.com"], sender_filter="indeed.com"
+    )
+
+    assert criteria[2:] == [
+        "OR",
+        "FROM",
+        '"indeed.com"',
+        "FROM",
+        '"linkedin.com"',
+        "FROM",
+        '"indeed.com"',
+    ]
+
+
+def test_search_criteria_gmail_sender_filter_narrows():
+    criteria = build_search_criteria(
+        1, ["indeed.com", "linkedin.com"], gmail=True, sender_filter="indeed.com"
+    )
+
+    assert criteria == [
+        "X-GM-RAW",
+        '"from:(indeed.com OR linkedin.com) from:(indeed.com) newer_than:1d"',
+    ]
+
+
+def test_extraction_service_exposes_parser_senders():
+    senders = JobExtractionService().senders
+
+    assert senders == ["linkedin.com", "indeed.com"]
+
+
+@pytest.mark.parametrize(
+    ("sender", "subject"),
+    [
+        ("Indeed <alert@indeed.com>", "Data Engineer jobs"),
+        ("Indeed <donotreply@jobalert.indeed.com>", "Python developer"),
+        ("LinkedIn <jobs-listings@linkedin.com>", "Backend engineer"),
+    ],
+)
+def test_server_side_filter_keeps_every_matched_sender(sender, subject):
+    service = JobExtractionService()
+
+    parser = service._match_parser(sender, subject)
+
+    assert parser is not None
+    # IMAP FROM is a substring match on the From header
+    assert any(domain in sender.lower() for domain in service.senders)
+
+
+def test_parser_without_senders_disables_server_side_filter():
+    class AnySenderParser(EmailParser):
+        def matches(self, sender: str, subject: str) -> bool:
+            return True
+
+        def parse_soup(self, soup, msg_dt=None) -> list[dict]:
+            return []
+
+    service = JobExtractionService()
+    service.parsers.append(AnySenderParser())
+
+    assert service.senders == []
+    assert build_search_criteria(1, service.senders)[2:] == []
@@ -0,0 +1,84 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/tests/unit/normalization/test_pii_engine.py
+
+import re
+
+import pytest
+from bs4 import BeautifulSoup
+
+from app.ingestion.normalization.pii.engine import REDACTED, RedactionEngine
+
+NAME_RE = re.compile(r"\b(Jane|Doe)\b", flags=re.IGNORECASE)
+EMAIL_RE = re.compile(
+    r"""
+    (?:
+        <jane\.doe@gmail\.com> |
+        jane\.doe@gmail\.com |
+        jane\.doe%40gmail\.com
+    )
+    """,
+    flags=re.IGNORECASE | re.VERBOSE,
+)
+
+HTML = """
+<p>Bonjour Jane,</p>
+<p>Sent to jane.doe@gmail.com</p>
+<img src="https://cdn.example.com/avatar.png" alt="Photo of Jane Doe">
+<img src="https://cdn.example.com/logo.png" alt="Indeed">
+<a href="https://fr.indeed.com/rc/clk/?jk=abc&tk=secret&from=jane">Data Engineer</a>
+<a href="https://www.linkedin.com/jobs/view/123/?trackingId=xyz">ML Engineer</a>
+<a href="https://indeed.com/unsubscribe?email=jane.doe%40gmail.com">Unsubscribe</a>
+"""
+
+
+@pytest.fixture
+def engine():
+    return RedactionEngine(NAME_RE, EMAIL_RE)
+
+
+def test_redact_text_prefers_full_email(engine):
+    assert engine.redact_text("jane.doe@gmail.com") == REDACTED
+    assert engine.redact_text("Hello JANE doe") == f"Hello {REDACTED} {REDACTED}"
+
+
+def test_redact_soup_single_pass(engine):
+    soup = BeautifulSoup(HTML, "html.parser")
+
+    engine.redact_soup(soup)
+
+    text = soup.get_text()
+    assert "Jane" not in text
+    assert "jane.doe@gmail.com" not in text
+
+    avatar, logo = soup.find_all("img")
+    assert avatar["alt"] == f"Photo of {REDACTED} {REDACTED}"
+    assert avatar["src"] == REDACTED
+    assert logo["src"] == "https://cdn.example.com/logo.png"
+
+    indeed, linkedin, unsubscribe = (a["href"] for a in soup.find_all("a"))
+    assert "jk=abc" in indeed
+    assert "tk=REDACTED" in indeed
+    assert "jane" not in indeed
+    assert "trackingId=REDACTED" in linkedin
+    assert unsubscribe == REDACTED
+
+
+def test_redact_headers_shares_matcher(engine):
+    headers = {
+        "from": "Jane Doe <jane.doe@gmail.com>",
+        "subject": "Nouveaux emplois",
+        "message-id": "<123@mail.indeed.com>",
+    }
+
+    assert engine.redact_headers(headers) == {
+        "from": f"{REDACTED} {REDACTED} {REDACTED}",
+        "subject": "Nouveaux emplois",
+        "message-id": REDACTED,
+    }
+
+
+def test_engine_without_patterns_keeps_text():
+    engine = RedactionEngine(None, None)
+
+    assert engine.redact_text("Jane") == "Jane"
+    assert engine.redact_href("https://example.com") == REDACTED
@@ -0,0 +1,62 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/tests/unit/normalization/test_pii_patterns.py
+
+from app.core.config import Settings
+from app.ingestion.normalization.pii.engine import REDACTED
+from app.ingestion.normalization.pii.patterns import (
+    build_email_pattern,
+    build_name_pattern,
+    get_redaction_engine,
+)
+
+
+def make_settings(**overrides) -> Settings:
+    values = {
+        "database_url": "postgresql+asyncpg://u:p@localhost/db",
+        "fixture_dir": "/tmp/fixtures",
+        "sample_dir": "/tmp/samples",
+        "user_first_name": "Jane",
+        "user_last_name": "Doe",
+        "email_address": "jane.doe@gmail.com",
+        "email_password": "secret",
+    }
+    return Settings(**{**values, **overrides})
+
+
+def test_patterns_are_memoized_on_values():
+    first = make_settings()
+    second = make_settings()
+
+    assert build_name_pattern(first) is build_name_pattern(second)
+    assert build_email_pattern(first) is build_email_pattern(second)
+    assert get_redaction_engine(first) is get_redaction_engine(second)
+
+
+def test_changed_settings_get_a_new_engine():
+    engine = get_redaction_engine(make_settings())
+    renamed = get_redaction_engine(make_settings(user_first_name="John"))
+
+    assert renamed is not engine
+    assert renamed.redact_text("John") == REDACTED
+    assert engine.redact_text("John") == "John"
+
+
+def test_multiple_identities_in_one_matcher():
+    settings = make_settings(
+        pii_extra_names=["Jean-Pierre", "Martin"],
+        pii_extra_emails=["jp.martin@outlook.fr"],
+    )
+    engine = get_redaction_engine(settings)
+
+    text = "Jane, Jean-Pierre Martin <jp.martin@outlook.fr>, jane.doe%40gmail.com"
+
+    assert engine.redact_text(text) == (
+        f"{REDACTED}, {REDACTED} {REDACTED} {REDACTED}, {REDACTED}"
+    )
+
+
+def test_longest_name_wins():
+    pattern = build_name_pattern(make_settings(pii_extra_names=["Jane Ann"]))
+
+    assert pattern is not None
+    assert pattern.sub(REDACTED, "Jane Ann") == REDACTED
@@ -0,0 +1,121 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/tests/unit/normalization/test_salary.py
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.dialects.postgresql import Range
+
+from app.ingestion.normalization.salary.parse import (
+    ParsedSalary,
+    parse_salary,
+    salary_columns,
+)
+from app.models.job_posting import SalaryPeriod
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        (
+            "45 000 € - 55 000 € par an",
+            ParsedSalary(Decimal(45000), Decimal(55000), "EUR", SalaryPeriod.YEAR),
+        ),
+        (
+            "De 12,50 € à 14 € de l'heure",
+            ParsedSalary(Decimal("12.5"), Decimal(14), "EUR", SalaryPeriod.HOUR),
+        ),
+        (
+            "À partir de 2 000 € par mois",
+            ParsedSalary(Decimal(2000), None, "EUR", SalaryPeriod.MONTH),
+        ),
+        (
+            "Jusqu'à 400 € par jour",
+            ParsedSalary(None, Decimal(400), "EUR", SalaryPeriod.DAY),
+        ),
+        (
+            "$50,000 - $70,000 a year",
+            ParsedSalary(Decimal(50000), Decimal(70000), "USD", SalaryPeriod.YEAR),
+        ),
+        (
+            "Up to £90K per annum",
+            ParsedSalary(None, Decimal(90000), "GBP", SalaryPeriod.YEAR),
+        ),
+        (
+            "Jusqu’à 14 € de l’heure",
+            ParsedSalary(None, Decimal(14), "EUR", SalaryPeriod.HOUR),
+        ),
+        (
+            "60k–70k",
+            ParsedSalary(Decimal(60000), Decimal(70000), None, SalaryPeriod.YEAR),
+        ),
+        (
+            "45 000 €",
+            ParsedSalary(Decimal(45000), Decimal(45000), "EUR", SalaryPeriod.YEAR),
+        ),
+        ("2 500 €", ParsedSalary(Decimal(2500), Decimal(2500), "EUR", None)),
+        (
+            "$60-70K a year",
+            ParsedSalary(Decimal(60000), Decimal(70000), "USD", SalaryPeriod.YEAR),
+        ),
+        (
+            "40-45k€",
+            ParsedSalary(Decimal(40000), Decimal(45000), "EUR", SalaryPeriod.YEAR),
+        ),
+        (
+            "de 40 à 45 k€ par an",
+            ParsedSalary(Decimal(40000), Decimal(45000), "EUR", SalaryPeriod.YEAR),
+        ),
+        (
+            "CDI 35h 2 000 € par mois",
+            ParsedSalary(Decimal(2000), Decimal(2000), "EUR", SalaryPeriod.MONTH),
+        ),
+        (
+            "Bac+5 45 000 €",
+            ParsedSalary(Decimal(45000), Decimal(45000), "EUR", SalaryPeriod.YEAR),
+        ),
+    ],
+)
+def test_parse_salary(text, expected):
+    assert parse_salary(text) == expected
+
+
+def test_parse_salary_non_breaking_thousands_separator():
+    parsed = parse_salary("45 000 € par an")
+
+    assert parsed.min_amount == parsed.max_amount == Decimal(45000)
+
+
+@pytest.mark.parametrize(
+    "text", [None, "", "Salaire selon profil", "CDI 35h", "Bac+5, 3 ans d'expérience"]
+)
+def test_parse_salary_without_amount(text):
+    assert parse_salary(text) is None
+
+
+def test_yearly_bounds():
+    hourly = ParsedSalary(Decimal(20), None, "EUR", SalaryPeriod.HOUR)
+
+    assert hourly.yearly_bounds() == (Decimal(36400), None)
+    assert ParsedSalary(Decimal(1), None, None, None).yearly_bounds() is None
+
+
+def test_salary_columns():
+    columns = salary_columns("3 000 € - 3 500 € par mois")
+
+    assert columns["salary_period"] is SalaryPeriod.MONTH
+    assert columns["salary_yearly"] == Range(
+        Decimal(36000), Decimal(42000), bounds="[]"
+    )
+
+
+def test_small_amounts_without_period_have_no_yearly_range():
+    # Excluded from the min_salary / max_salary filters
+    assert salary_columns("2 500 €")["salary_yearly"] is None
+    assert salary_columns("60k-70k")["salary_yearly"] == Range(
+        Decimal(60000), Decimal(70000), bounds="[]"
+    )
+
+
+def test_salary_columns_clear_unparsed_salary():
+    assert set(salary_columns(None).values()) == {None}
@@ -0,0 +1,112 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/tests/unit/normalization/test_streaming.py
+
+import io
+import re
+
+import pytest
+from bs4 import BeautifulSoup
+
+from app.ingestion.normalization.html import structural
+from app.ingestion.normalization.html.pii import redact_pii
+from app.ingestion.normalization.html.streaming import sanitize_file, sanitize_stream
+from app.ingestion.normalization.html.structural import register_rule, strip_structure
+from app.ingestion.normalization.pii.engine import REDACTED, RedactionEngine
+
+HTML = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><style>p { color: red; }</style></head>
+<body>
+<!--[if mso]><table><tr><td><![endif]-->
+<div style="display:none">Preview for Jane <div>nested</div> still hidden</div>
+<p>Bonjour Jane &amp; co,</p>
+<p>Sent to jane.doe@gmail.com</p>
+<img src="https://cdn.example.com/avatar.png" alt="Photo of Jane Doe">
+<img src="https://track.example.com/p.gif" width="1" height="1">
+<a href="https://fr.indeed.com/rc/clk/?jk=abc&amp;tk=secret">Data Engineer</a>
+<a href="https://indeed.com/unsubscribe?email=jane.doe%40gmail.com">Unsubscribe</a>
+<script>alert("Jane")</script>
+<br/>
+</body></html>
+"""
+
+# Unclosed hidden div, stray end tag, multi-valued class, unclosed <p>
+MALFORMED = """<div><p>Keep <div style="display:none">hidden <b>bold</div> after</p>
+<span class="a footer-link">link</span><span class="x  footer">bye</span></i>
+</div><p>Tail for Jane"""
+
+
+@pytest.fixture
+def engine():
+    return RedactionEngine(
+        re.compile(r"\b(Jane|Doe)\b", flags=re.IGNORECASE),
+        re.compile(r"jane\.doe(?:@|%40)gmail\.com", flags=re.IGNORECASE),
+    )
+
+
+def _stream(
+    html: str, engine: RedactionEngine, chunk_size: int, platform: str | None = None
+) -> str:
+    out = io.StringIO()
+    chunks = (html[i : i + chunk_size] for i in range(0, len(html), chunk_size))
+    sanitize_stream(chunks, out, engine, platform)
+    return out.getvalue()
+
+
+def _summary(soup: BeautifulSoup) -> tuple:
+    text = " ".join(soup.get_text().split())
+    links = [a["href"] for a in soup.find_all("a")]
+    images = [(img.get("src"), img.get("alt")) for img in soup.find_all("img")]
+    return text, links, images
+
+
+def test_streaming_matches_tree_pipeline(engine):
+    soup = strip_structure(HTML)
+    redact_pii(soup, engine)
+
+    streamed = BeautifulSoup(_stream(HTML, engine, len(HTML)), "html.parser")
+
+    assert _summary(streamed) == _summary(soup)
+
+
+def test_streaming_matches_tree_pipeline_on_malformed_html(engine, monkeypatch):
+    monkeypatch.setattr(structural, "PLATFORM_RULES", {})
+    register_rule(
+        "span", lambda attrs: "footer" in attrs.get("class", []), platform="indeed"
+    )
+    soup = strip_structure(MALFORMED, platform="indeed")
+    redact_pii(soup, engine)
+
+    streamed = _stream(MALFORMED, engine, 5, platform="indeed")
+
+    assert streamed == soup.decode()
+    assert "after" in streamed and "link" in streamed
+    assert "bye" not in streamed
+
+
+def test_structure_and_pii_removed(engine):
+    output = _stream(HTML, engine, len(HTML))
+
+    assert "Jane" not in output
+    assert "gmail.com" not in output
+    assert "Preview" not in output and "nested" not in output
+    assert "<style" not in output and "<script" not in output
+    assert "<meta" not in output and "p.gif" not in output
+    assert "<!--" not in output
+    assert f"Bonjour {REDACTED} &amp; co," in output
+    assert "<!DOCTYPE html>" in output
+    assert "<br />" in output
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64])
+def test_output_independent_of_chunking(engine, chunk_size):
+    assert _stream(HTML, engine, chunk_size) == _stream(HTML, engine, len(HTML))
+
+
+def test_sanitize_file(engine, tmp_path):
+    src = tmp_path / "body_raw.html"
+    dst = tmp_path / "body_sanitized.html"
+    src.write_text(HTML, encoding="utf-8")
+
+    sanitize_file(src, dst, engine, chunk_size=16)
+
+    assert dst.read_text(encoding="utf-8") == _stream(HTML, engine, len(HTML))
@@ -0,0 +1,93 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/tests/unit/normalization/test_structural.py
+
+import pytest
+from bs4 import BeautifulSoup, Comment
+
+from app.ingestion.normalization.html import structural
+from app.ingestion.normalization.html.structural import register_rule, strip_structure
+
+HTML = """
+<html><head><meta charset="utf-8"><style>td {color: red}</style></head>
+<body>
+<!--[if mso]><table><![endif]-->
+<div style="display:none;max-height:0">Preview text</div>
+<table><tr><td>
+  <h2><a href="https://indeed.com/rc/clk/?jk=abc">Data Engineer</a></h2>
+  <img src="logo.png" width="120" alt="logo">
+  <img src="pixel.gif" width="1" height="1">
+  <div style="color:blue">Visible <script>track()</script></div>
+  <!-- a comment -->
+  <span class="footer">Unsubscribe</span>
+</td></tr></table>
+</body></html>
+"""
+
+
+def strip_structure_multipass(html: str) -> BeautifulSoup:
+    """Reference implementation: one full-tree walk per removal rule."""
+    soup = BeautifulSoup(html, "html.parser")
+
+    for style in soup.find_all("style"):
+        style.decompose()
+
+    for element in soup(string=lambda t: isinstance(t, Comment)):
+        element.extract()
+
+    for div in soup.find_all("div"):
+        style = str(div.get("style", "")) or ""
+        if "display:none" in style or "max-height:0" in style:
+            div.decompose()
+
+    for img in soup.find_all("img"):
+        w = img.get("width", "")
+        h = img.get("height", "")
+        if w in ("1", "0", "1px") or h in ("1", "0", "1px"):
+            img.decompose()
+
+    for meta in soup.find_all("meta"):
+        meta.decompose()
+
+    for script in soup.find_all("script"):
+        script.decompose()
+
+    return soup
+
+
+@pytest.fixture
+def clean_platform_rules(monkeypatch):
+    monkeypatch.setattr(structural, "PLATFORM_RULES", {})
+
+
+def test_removes_noise():
+    soup = strip_structure(HTML)
+
+    for tag in ("style", "meta", "script"):
+        assert soup.find(tag) is None
+    assert "Preview text" not in soup.get_text()
+    assert "<!--" not in str(soup)
+    assert [img["src"] for img in soup.find_all("img")] == ["logo.png"]
+    assert "Visible" in soup.get_text()
+
+
+def test_matches_multipass_output():
+    assert strip_structure(HTML).decode() == strip_structure_multipass(HTML).decode()
+
+
+def test_platform_rule_only_applies_to_platform(clean_platform_rules):
+    register_rule(
+        "span",
+        lambda attrs: "footer" in attrs.get("class", []),
+        platform="indeed",
+    )
+
+    assert "Unsubscribe" not in strip_structure(HTML, platform="indeed").get_text()
+    assert "Unsubscribe" in strip_structure(HTML, platform="linkedin").get_text()
+    assert "Unsubscribe" in strip_structure(HTML).get_text()
+
+
+def test_cleans_parsed_document_in_place():
+    soup = BeautifulSoup(HTML, "html.parser")
+
+    assert strip_structure(soup) is soup
+    assert soup.decode() == strip_structure(HTML).decode()
@@ -0,0 +1,94 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/tests/unit/normalization/test_url.py
+
+import re
+
+import pytest
+
+from app.ingestion.normalization.url import policy
+from app.ingestion.normalization.url.policy import (
+    INDEED_PAGEAD_REDACT_KEYS,
+    INDEED_RK_REDACT_KEYS,
+    UrlHandler,
+    get_job_url_policy,
+)
+from app.ingestion.normalization.url.sanitize import (
+    normalize_job_url,
+    register_url_handler,
+    sanitize_job_url,
+)
+
+
+@pytest.fixture
+def restore_handlers(monkeypatch):
+    monkeypatch.setattr(policy, "URL_HANDLERS", dict(policy.URL_HANDLERS))
+    yield
+    policy.handler_for_host.cache_clear()
+    normalize_job_url.cache_clear()
+    sanitize_job_url.cache_clear()
+
+
+def test_normalize_indeed_subdomain():
+    assert normalize_job_url("https://fr.indeed.com/rc/clk/?jk=abc123&tk=x") == (
+        "abc123",
+        "https://indeed.com/viewjob?jk=abc123",
+    )
+
+
+def test_normalize_linkedin():
+    assert normalize_job_url(
+        "https://www.linkedin.com/comm/jobs/view/4242/?trackingId=x"
+    ) == ("4242", "https://www.linkedin.com/jobs/view/4242")
+
+
+def test_normalize_dispatches_on_host_only():
+    # A platform name in the query string does not select its handler
+    assert normalize_job_url("https://example.com/?next=indeed.com&jk=1") is None
+    assert normalize_job_url("https://notindeed.com/viewjob?jk=1") is None
+
+
+@pytest.mark.parametrize("url", ["http://[", "https://[indeed.com/rc/clk/?jk=1"])
+def test_malformed_urls_are_left_alone(url):
+    assert normalize_job_url(url) is None
+    assert sanitize_job_url(url) == url
+    assert get_job_url_policy(url) is None
+
+
+def test_policy_by_path():
+    assert get_job_url_policy("https://fr.indeed.com/rc/clk/?jk=1") is (
+        INDEED_RK_REDACT_KEYS
+    )
+    assert get_job_url_policy("https://indeed.com/pagead/clk/?x=1") is (
+        INDEED_PAGEAD_REDACT_KEYS
+    )
+    assert get_job_url_policy("https://indeed.com/about") is None
+    assert get_job_url_policy("https://example.com/rc/clk/") is None
+
+
+def test_sanitize_redacts_tracking_params():
+    url = "https://fr.indeed.com/rc/clk/?jk=abc&tk=secret&from=mail"
+
+    assert sanitize_job_url(url) == (
+        "https://fr.indeed.com/rc/clk/?jk=abc&tk=REDACTED&from=mail"
+    )
+    assert sanitize_job_url("https://example.com/?tk=1") == "https://example.com/?tk=1"
+
+
+def test_register_new_platform(restore_handlers):
+    url = "https://jobs.welcometothejungle.com/fr/jobs/data-eng_paris?utm_source=x"
+    assert normalize_job_url(url) is None
+
+    register_url_handler(
+        "welcometothejungle.com",
+        UrlHandler(
+            key_pattern=re.compile(r"/jobs/([\w-]+)"),
+            canonical_template="https://www.welcometothejungle.com/jobs/{job_key}",
+            policies=(("/jobs/", frozenset({"utm_source"})),),
+        ),
+    )
+
+    assert normalize_job_url(url) == (
+        "data-eng_paris",
+        "https://www.welcometothejungle.com/jobs/data-eng_paris",
+    )
+    assert sanitize_job_url(url).endswith("utm_source=REDACTED")
@@ -0,0 +1,119 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/tests/unit/normalization/test_url_resolver.py
+
+import httpx
+import pytest
+
+from app.ingestion.normalization.url.resolver import (
+    RedirectCache,
+    UrlResolver,
+    resolve_missing_job_keys,
+)
+
+PAGEAD = "https://fr.indeed.com/pagead/clk/?mo=r&ad=abc"
+FOOTER = "https://fr.indeed.com/preferences"
+
+
+class StandIn:
+    """Local stand-in for the tracking servers, counting requests."""
+
+    def __init__(self):
+        self.requests: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(str(request.url))
+        if request.url.path == "/pagead/clk/":
+            return httpx.Response(302, headers={"location": "/rc/clk/?from=ad"})
+        if request.url.path == "/rc/clk/":
+            return httpx.Response(
+                301, headers={"location": "https://fr.indeed.com/viewjob?jk=f00d"}
+            )
+        if request.url.path == "/boom":
+            raise httpx.ConnectError("down", request=request)
+        if request.url.path == "/bad-location":
+            return httpx.Response(302, headers={"location": "https://example.com:abc/"})
+        return httpx.Response(200, text="<html></html>")
+
+
+@pytest.fixture
+def server():
+    return StandIn()
+
+
+@pytest.fixture
+def cache():
+    cache = RedirectCache(":memory:")
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+async def resolver(server, cache):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(server))
+    async with UrlResolver(cache=cache, client=client) as resolver:
+        yield resolver
+    await client.aclose()
+
+
+async def test_follows_redirects_to_job_key(resolver, server):
+    assert await resolver.resolve(PAGEAD) == (
+        "f00d",
+        "https://indeed.com/viewjob?jk=f00d",
+    )
+    # Stops at the hop exposing the key, the job page itself is not fetched
+    assert len(server.requests) == 2
+
+
+async def test_direct_links_need_no_request(resolver, server):
+    url = "https://www.linkedin.com/jobs/view/42/"
+    assert await resolver.resolve(url) == (
+        "42",
+        "https://www.linkedin.com/jobs/view/42",
+    )
+    assert server.requests == []
+
+
+async def test_results_are_cached(resolver, server, cache):
+    await resolver.resolve_many([PAGEAD, FOOTER, PAGEAD])
+    count = len(server.requests)
+
+    assert await resolver.resolve(PAGEAD) is not None
+    assert await resolver.resolve(FOOTER) is None
+    assert len(server.requests) == count
+    assert cache.get(FOOTER) == (True, None)
+
+
+async def test_errors_are_not_cached(resolver, cache):
+    url = "https://fr.indeed.com/boom"
+
+    assert await resolver.resolve(url) is None
+    assert cache.get(url) == (False, None)
+
+
+@pytest.mark.parametrize(
+    "url", ["https://fr.indeed.com/bad-location", "https://fr.indeed.com:abc/x"]
+)
+async def test_invalid_urls_are_left_unresolved(resolver, cache, url):
+    assert await resolver.resolve(url) is None
+    assert cache.get(url) == (False, None)
+
+
+def test_cache_entries_expire(tmp_path):
+    cache = RedirectCache(tmp_path / "cache.sqlite", ttl=-1)
+    cache.set(PAGEAD, ("f00d", "https://indeed.com/viewjob?jk=f00d"))
+
+    assert cache.get(PAGEAD) == (False, None)
+    cache.close()
+
+
+async def test_resolve_missing_job_keys(resolver):
+    jobs = [
+        {"raw_url": PAGEAD, "job_key": None, "canonical_url": None},
+        {"raw_url": FOOTER, "job_key": None, "canonical_url": None},
+        {"raw_url": "https://x.test/", "job_key": "known", "canonical_url": "c"},
+    ]
+
+    assert await resolve_missing_job_keys(jobs, resolver) == 1
+    assert jobs[0]["job_key"] == "f00d"
+    assert jobs[1]["job_key"] is None
+    assert jobs[2]["job_key"] == "known"
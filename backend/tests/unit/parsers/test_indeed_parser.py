@@ -6,24 +6,38 @@ from datetime import datetime
 from email.utils import parsedate_to_datetime
 from pathlib import Path
 
+import pytest
+
 from app.ingestion.extraction.email.parsers.indeed import IndeedParser
+from app.ingestion.fixtures.archive import FixtureStore, open_fixtures
 
 # --- Fixtures paths ---
 ROOT_DIR = Path(__file__).resolve().parents[2]
-FIXTURES_DIR = ROOT_DIR / "email_fixtures" / "indeed"
+FIXTURES_ROOT = ROOT_DIR / "email_fixtures"
 FIXTURE_ID = "2025-12-14_7128"
-FIXTURE_DIR = FIXTURES_DIR / FIXTURE_ID
 
-HTML_FILE = FIXTURE_DIR / "clean_7128.html"
-HEADERS_FILE = FIXTURE_DIR / "net_headers_7128.json"
-RESPONSE_FILE = FIXTURE_DIR / "response_7128.json"
+HTML_FILE = "clean_7128.html"
+HEADERS_FILE = "net_headers_7128.json"
+RESPONSE_FILE = "response_7128.json"
 
 print(f"✅ ROOT_DIR = {ROOT_DIR}")
 
 
+@pytest.fixture(scope="module")
+def store():
+    # Packed indeed.fxpack archive if present, directory layout otherwise
+    store = open_fixtures(FIXTURES_ROOT, "indeed")
+    yield store
+    store.close()
+
+
+def read_fixture(store: FixtureStore, name: str) -> str:
+    return store.read(FIXTURE_ID, name).decode()
+
+
 # --- Tests ---
-def test_indeed_matches_headers():
-    headers = json.loads(HEADERS_FILE.read_text())
+def test_indeed_matches_headers(store):
+    headers = json.loads(read_fixture(store, HEADERS_FILE))
 
     parser = IndeedParser()
 
@@ -36,8 +50,8 @@ def test_indeed_matches_headers():
     )
 
 
-def test_indeed_parse_count():
-    html = HTML_FILE.read_text()
+def test_indeed_parse_count(store):
+    html = read_fixture(store, HTML_FILE)
 
     parser = IndeedParser()
     jobs = parser.parse(html, msg_dt=datetime.now())
@@ -45,8 +59,8 @@ def test_indeed_parse_count():
     assert len(jobs) == 30
 
 
-def test_indeed_job_fields():
-    html = HTML_FILE.read_text()
+def test_indeed_job_fields(store):
+    html = read_fixture(store, HTML_FILE)
 
     jobs = IndeedParser().parse(html, msg_dt=datetime.now())
 
@@ -65,10 +79,10 @@ def normalize(job: dict) -> dict:
     return job
 
 
-def test_indeed_parse_against_expected():
-    html = HTML_FILE.read_text()
-    expected = json.loads(RESPONSE_FILE.read_text())
-    headers = json.loads(HEADERS_FILE.read_text())
+def test_indeed_parse_against_expected(store):
+    html = read_fixture(store, HTML_FILE)
+    expected = json.loads(read_fixture(store, RESPONSE_FILE))
+    headers = json.loads(read_fixture(store, HEADERS_FILE))
 
     msg_dt: datetime = parsedate_to_datetime(headers["date"])
     jobs = IndeedParser().parse(html, msg_dt=msg_dt)
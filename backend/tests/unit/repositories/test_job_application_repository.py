@@ -0,0 +1,79 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/tests/unit/repositories/test_job_application_repository.py
+
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.job_application import JobApplication, JobApplicationStatus
+from app.repositories.job_application import JobApplicationRepository
+from app.repositories.pagination import decode_cursor, encode_cursor
+
+ROWS = [
+    JobApplication(id=3, job_posting_id=1, job_application_date=date(2025, 3, 1)),
+    JobApplication(id=2, job_posting_id=1, job_application_date=date(2025, 2, 1)),
+    JobApplication(id=1, job_posting_id=1, job_application_date=date(2025, 1, 1)),
+]
+
+
+@pytest.fixture
+def session():
+    session = AsyncMock()
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = ROWS
+    session.execute.return_value = result
+    return session
+
+
+def executed_sql(session) -> str:
+    stmt = session.execute.await_args.args[0]
+    return str(
+        stmt.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+async def test_first_page_is_bounded_and_ordered(session):
+    page = await JobApplicationRepository(session).list_keyset_with_job_posting(limit=2)
+
+    assert page.items == ROWS[:2]
+    assert decode_cursor(page.next_cursor, date.fromisoformat, int) == (
+        date(2025, 2, 1),
+        2,
+    )
+
+    sql = executed_sql(session)
+    assert (
+        "ORDER BY job_application.job_application_date DESC, job_application.id DESC"
+        in sql
+    )
+    assert "LIMIT 3" in sql
+
+
+async def test_filters_and_cursor(session):
+    await JobApplicationRepository(session).list_keyset_with_job_posting(
+        status=JobApplicationStatus.INTERVIEW,
+        applied_from=date(2025, 1, 1),
+        applied_to=date(2025, 6, 30),
+        limit=2,
+        cursor=encode_cursor(date(2025, 2, 1), 2),
+    )
+
+    sql = executed_sql(session)
+    assert "job_application.status = 'INTERVIEW'" in sql
+    assert "job_application.job_application_date >= '2025-01-01'" in sql
+    assert "job_application.job_application_date <= '2025-06-30'" in sql
+    assert (
+        "(job_application.job_application_date, job_application.id) "
+        "< ('2025-02-01', 2)" in sql
+    )
+
+
+async def test_offset_listing_is_bounded(session):
+    await JobApplicationRepository(session).list_with_job_posting(limit=10, offset=20)
+
+    sql = executed_sql(session)
+    assert "LIMIT 10 OFFSET 20" in sql
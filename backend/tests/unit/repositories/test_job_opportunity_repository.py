@@ -0,0 +1,70 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/tests/unit/repositories/test_job_opportunity_repository.py
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from uuid6 import uuid7
+
+from app.models.job_opportunity import JobOpportunity, JobOpportunityPriority
+from app.repositories.job_opportunity import JobOpportunityRepository
+from app.repositories.pagination import decode_cursor, encode_cursor
+
+IDS = sorted((uuid7() for _ in range(3)), reverse=True)
+
+
+@pytest.fixture
+def session():
+    session = AsyncMock()
+    scalars = MagicMock()
+    scalars.all.return_value = [
+        JobOpportunity(id=id, title="Data Engineer", company="Acme") for id in IDS
+    ]
+    session.scalars.return_value = scalars
+    return session
+
+
+def executed_sql(session) -> str:
+    stmt = session.scalars.await_args.args[0]
+    return str(
+        stmt.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+async def test_first_page_orders_by_primary_key(session):
+    page = await JobOpportunityRepository(session).list_keyset(limit=2)
+
+    assert [o.id for o in page.items] == IDS[:2]
+    assert decode_cursor(page.next_cursor, str) == (str(IDS[1]),)
+
+    sql = executed_sql(session)
+    assert "ORDER BY job_opportunity.id DESC" in sql
+    assert "LIMIT 3" in sql
+
+
+async def test_filters_and_cursor(session):
+    cursor = encode_cursor(str(IDS[1]))
+
+    await JobOpportunityRepository(session).list_keyset(
+        limit=2,
+        cursor=cursor,
+        is_active=True,
+        priority=JobOpportunityPriority.HIGH,
+    )
+
+    sql = executed_sql(session)
+    assert f"job_opportunity.id < '{IDS[1]}'" in sql
+    # Same predicate as the partial indexes
+    assert "job_opportunity.is_active = true" in sql
+    assert "job_opportunity.priority = 'HIGH'" in sql
+
+
+async def test_offset_mode_uses_primary_key_order(session):
+    await JobOpportunityRepository(session).list_page(offset=10, limit=5)
+
+    sql = executed_sql(session)
+    assert "ORDER BY job_opportunity.id DESC" in sql
+    assert "created_at" not in sql.split("ORDER BY")[1]
@@ -0,0 +1,134 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/tests/unit/repositories/test_job_posting_repository.py
+
+from datetime import UTC, datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import Range
+
+from app.models.job_posting import JobPosting
+from app.repositories.job_posting import JobPostingRepository
+from app.repositories.pagination import decode_cursor, encode_cursor
+
+
+def make_posting(id: int, day: int) -> JobPosting:
+    return JobPosting(
+        id=id,
+        title="Data Engineer",
+        company="Acme",
+        platform="indeed",
+        raw_url=f"https://example.com/{id}",
+        date_scraped=datetime(2025, 1, day, tzinfo=UTC),
+    )
+
+
+@pytest.fixture
+def session():
+    session = AsyncMock()
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = [
+        make_posting(3, 3),
+        make_posting(2, 2),
+        make_posting(1, 1),
+    ]
+    session.execute.return_value = result
+    return session
+
+
+def executed_sql(session) -> str:
+    stmt = session.execute.await_args.args[0]
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+async def test_first_page(session):
+    page = await JobPostingRepository(session).list_keyset(limit=2)
+
+    assert [p.id for p in page.items] == [3, 2]
+    assert decode_cursor(page.next_cursor, datetime.fromisoformat, int) == (
+        datetime(2025, 1, 2, tzinfo=UTC),
+        2,
+    )
+
+    sql = executed_sql(session)
+    assert "ORDER BY jobposting.date_scraped DESC, jobposting.id DESC" in sql
+    assert "OFFSET" not in sql
+    assert "<" not in sql
+
+
+async def test_next_page_seeks_past_cursor(session):
+    cursor = encode_cursor(datetime(2025, 1, 2, tzinfo=UTC), 2)
+
+    await JobPostingRepository(session).list_keyset(
+        platform="indeed", limit=2, cursor=cursor
+    )
+
+    sql = executed_sql(session)
+    assert "(jobposting.date_scraped, jobposting.id) < (" in sql
+    assert "jobposting.platform = " in sql
+    assert "OFFSET" not in sql
+
+
+async def test_search_ranks_then_highlights_the_page(session):
+    posting = make_posting(1, 1)
+    session.execute.return_value.all.return_value = [(posting, 0.5, "<mark>x</mark>")]
+
+    hits = await JobPostingRepository(session).search(
+        "data engineer", platform="indeed", limit=5
+    )
+
+    assert [(h.job_posting, h.rank, h.highlight) for h in hits] == [
+        (posting, 0.5, "<mark>x</mark>")
+    ]
+
+    sql = executed_sql(session)
+    for config in ("english", "french", "simple"):
+        assert f"websearch_to_tsquery('{config}'::regconfig" in sql
+    assert "jobposting.search_vector @@ " in sql
+    assert "ts_rank_cd(jobposting.search_vector" in sql
+    assert "jobposting.platform = " in sql
+    # Headlines are computed outside the limited subquery
+    inner = sql[sql.index("JOIN (") : sql.index(") AS anon_1")]
+    assert "LIMIT" in inner
+    assert "ts_headline" not in inner
+    assert "ts_headline('simple'::regconfig" in sql
+
+
+async def test_fuzzy_filters_use_word_similarity(session):
+    await JobPostingRepository(session).list_keyset(
+        company_search="licorne", location_search="paris", limit=2
+    )
+
+    sql = executed_sql(session)
+    # Rendered with the psycopg2 paramstyle, where % is doubled
+    assert "jobposting.company %%> " in sql
+    assert "jobposting.location %%> " in sql
+
+
+async def test_salary_filters_overlap_yearly_range(session):
+    await JobPostingRepository(session).list(
+        min_salary=Decimal(40000), salary_currency="EUR"
+    )
+
+    stmt = session.execute.await_args.args[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "jobposting.salary_yearly && " in sql
+    assert "jobposting.salary_currency = " in sql
+    assert Range(Decimal(40000), None, bounds="[]") in stmt.compile().params.values()
+
+
+async def test_suggest_matches_escaped_prefix(session):
+    session.execute.return_value.scalars.return_value.all.return_value = ["100% Remote"]
+
+    values = await JobPostingRepository(session).suggest("company", "100%", limit=5)
+
+    assert values == ["100% Remote"]
+    stmt = session.execute.await_args.args[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "jobposting.company ILIKE " in sql
+    assert "ESCAPE '/'" in sql
+    assert "GROUP BY jobposting.company" in sql
+    assert "ORDER BY count(*) DESC, jobposting.company" in sql
+    assert stmt.compile().params["company_1"] == "100/%%"
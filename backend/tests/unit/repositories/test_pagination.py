@@ -0,0 +1,41 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/tests/unit/repositories/test_pagination.py
+
+from datetime import UTC, datetime
+
+import pytest
+
+from app.domain.errors import InvalidCursor
+from app.repositories.pagination import decode_cursor, encode_cursor, split_page
+
+
+def test_cursor_round_trip():
+    scraped = datetime(2025, 1, 2, 3, 4, 5, 678, tzinfo=UTC)
+
+    token = encode_cursor(scraped, 42)
+
+    assert "=" not in token
+    assert decode_cursor(token, datetime.fromisoformat, int) == (scraped, 42)
+
+
+@pytest.mark.parametrize(
+    "token",
+    ["not-base64!", encode_cursor(1), encode_cursor("yesterday", 1), "e30"],
+)
+def test_invalid_cursor(token):
+    with pytest.raises(InvalidCursor):
+        decode_cursor(token, datetime.fromisoformat, int)
+
+
+def test_split_page_detects_next_page():
+    page = split_page([1, 2, 3], 2, key=lambda n: (n,))
+
+    assert page.items == [1, 2]
+    assert decode_cursor(page.next_cursor, int) == (2,)
+
+
+def test_split_page_last_page():
+    page = split_page([1, 2], 2, key=lambda n: (n,))
+
+    assert page.items == [1, 2]
+    assert page.next_cursor is None
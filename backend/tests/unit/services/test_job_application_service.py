@@ -7,7 +7,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 from fastapi import HTTPException
 
-from app.models.job_application import JobApplication
+from app.models.job_application import JobApplication, JobApplicationStatus
 from app.schemas.job_application import (
     JobApplicationCreate,
     JobApplicationUpdate,
@@ -111,6 +111,30 @@ async def test_list_applications_calls_repo(
     repo.list_with_job_posting.assert_awaited_once()
 
 
+@pytest.mark.asyncio
+async def test_list_applications_page_calls_repo_keyset(
+    service: JobApplicationService,
+    repo,
+):
+    repo.list_keyset_with_job_posting = AsyncMock(return_value="page")
+
+    result = await service.list_applications_page(
+        status=JobApplicationStatus.OFFER,
+        applied_from=date(2025, 1, 1),
+        limit=10,
+        cursor="abc",
+    )
+
+    assert result == "page"
+    repo.list_keyset_with_job_posting.assert_awaited_once_with(
+        status=JobApplicationStatus.OFFER,
+        applied_from=date(2025, 1, 1),
+        applied_to=None,
+        limit=10,
+        cursor="abc",
+    )
+
+
 # --- update_application_by_id ---
 @pytest.mark.asyncio
 async def test_update_application_raises_if_not_found(
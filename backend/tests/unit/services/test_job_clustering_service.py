@@ -0,0 +1,105 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/tests/unit/services/test_job_clustering_service.py
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from uuid6 import uuid7
+
+from app.models.job_posting import JobPosting
+from app.services.job_clustering import JobClusteringService
+
+
+def posting(title: str, company: str, location: str | None = "Paris") -> JobPosting:
+    return JobPosting(title=title, company=company, location=location)
+
+
+@pytest.fixture
+def posting_repo():
+    repo = MagicMock()
+    repo.list_clustered_by_buckets = AsyncMock(return_value=[])
+    return repo
+
+
+@pytest.fixture
+def opportunity_repo():
+    repo = MagicMock()
+    repo.add = AsyncMock()
+    return repo
+
+
+@pytest.fixture
+def service(posting_repo, opportunity_repo):
+    return JobClusteringService(
+        session=AsyncMock(),
+        posting_repo=posting_repo,
+        opportunity_repo=opportunity_repo,
+    )
+
+
+@pytest.mark.asyncio
+async def test_links_to_existing_opportunity(service, posting_repo, opportunity_repo):
+    opportunity_id = uuid7()
+    existing = posting("Data Engineer (H/F)", "Licorne Society")
+    existing_buckets = service.hasher.buckets(
+        service._signature(existing.title, existing.company, existing.location)
+    )
+    posting_repo.list_clustered_by_buckets.return_value = [
+        SimpleNamespace(
+            title=existing.title,
+            company=existing.company,
+            location=existing.location,
+            job_opportunity_id=opportunity_id,
+            lsh_buckets=existing_buckets,
+        )
+    ]
+
+    new = posting("Data Engineer", "LICORNE SOCIETY SAS")
+    created = await service.cluster([new])
+
+    assert created == 0
+    assert new.job_opportunity_id == opportunity_id
+    assert new.lsh_buckets
+    opportunity_repo.add.assert_not_awaited()
+    # Candidates are looked up once, by bucket
+    (buckets,) = posting_repo.list_clustered_by_buckets.await_args.args
+    assert set(buckets) == set(new.lsh_buckets)
+
+
+@pytest.mark.asyncio
+async def test_duplicates_within_a_batch_share_a_new_opportunity(
+    service, opportunity_repo
+):
+    linkedin = posting("Développeur Python F/H", "Licorne")
+    indeed = posting("Développeur Python", "Licorne SAS", "Paris (75)")
+    other = posting("Comptable", "Chiffres SA", "Lille")
+
+    created = await service.cluster([linkedin, indeed, other])
+
+    assert created == 2
+    assert linkedin.job_opportunity_id == indeed.job_opportunity_id
+    assert other.job_opportunity_id != linkedin.job_opportunity_id
+
+    opportunity = opportunity_repo.add.await_args_list[0].args[0]
+    assert opportunity.id == linkedin.job_opportunity_id
+    assert opportunity.title == "Développeur Python F/H"
+    assert opportunity.company == "Licorne"
+
+
+@pytest.mark.asyncio
+async def test_already_linked_postings_are_skipped(service, posting_repo):
+    linked = posting("Data Engineer", "Acme")
+    linked.job_opportunity_id = uuid7()
+
+    assert await service.cluster([linked]) == 0
+    posting_repo.list_clustered_by_buckets.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_same_title_at_another_company_is_not_merged(service):
+    acme = posting("Data Engineer", "Acme")
+    globex = posting("Data Engineer", "Globex")
+
+    assert await service.cluster([acme, globex]) == 2
+    assert acme.job_opportunity_id != globex.job_opportunity_id
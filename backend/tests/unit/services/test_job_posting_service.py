@@ -1,13 +1,15 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # File: backend/tests/unit/services/test_job_posting_service.py
 
+from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from sqlalchemy.dialects.postgresql import Range
 
-from app.models.job_posting import JobPosting
+from app.models.job_posting import JobPosting, SalaryPeriod
 from app.schemas.job_posting import JobPostingCreate, JobPostingUpdate
-from app.services.job_posting import JobPostingService
+from app.services.job_posting import JobPostingService, suggestion_cache
 
 
 # --- Setup ---
@@ -223,6 +225,9 @@ async def test_list_postings_calls_repo_with_filters(
         platform="indeed",
         company="Acme",
         has_application=True,
+        min_salary=None,
+        max_salary=None,
+        salary_currency=None,
         limit=10,
         offset=5,
     )
@@ -231,7 +236,12 @@ async def test_list_postings_calls_repo_with_filters(
     repo.list.assert_awaited_once_with(
         platform="indeed",
         company="Acme",
+        company_search=None,
+        location_search=None,
         has_application=True,
+        min_salary=None,
+        max_salary=None,
+        salary_currency=None,
         limit=10,
         offset=5,
     )
@@ -265,6 +275,27 @@ async def test_update_posting_fields(
     session.refresh.assert_awaited_once_with(job_posting)
 
 
+@pytest.mark.asyncio
+async def test_update_posting_reparses_salary(
+    service: JobPostingService,
+    repo,
+):
+    job_posting = JobPosting(title="Backend", company="Acme", salary=None)
+    repo.get_by_id.return_value = job_posting
+
+    await service.update_job_posting(
+        1, JobPostingUpdate(salary="3 000 € - 3 500 € par mois")
+    )
+
+    assert job_posting.salary_min == Decimal(3000)
+    assert job_posting.salary_max == Decimal(3500)
+    assert job_posting.salary_currency == "EUR"
+    assert job_posting.salary_period is SalaryPeriod.MONTH
+    assert job_posting.salary_yearly == Range(
+        Decimal(36000), Decimal(42000), bounds="[]"
+    )
+
+
 @pytest.mark.asyncio
 async def test_update_posting_raises_if_not_found(
     service: JobPostingService,
@@ -276,3 +307,70 @@ async def test_update_posting_raises_if_not_found(
 
     with pytest.raises(ValueError, match="Job Posting not found"):
         await service.update_job_posting(1, data)
+
+
+@pytest.mark.asyncio
+async def test_list_postings_page_calls_repo_keyset(
+    service: JobPostingService,
+    repo,
+):
+    repo.list_keyset = AsyncMock(return_value="page")
+
+    result = await service.list_job_postings_page(
+        platform="indeed",
+        limit=10,
+        cursor="abc",
+    )
+
+    assert result == "page"
+    repo.list_keyset.assert_awaited_once_with(
+        platform="indeed",
+        company=None,
+        company_search=None,
+        location_search=None,
+        has_application=None,
+        min_salary=None,
+        max_salary=None,
+        salary_currency=None,
+        limit=10,
+        cursor="abc",
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_postings_calls_repo(
+    service: JobPostingService,
+    repo,
+):
+    repo.search = AsyncMock(return_value=["hit"])
+
+    result = await service.search_job_postings("python", limit=5)
+
+    assert result == ["hit"]
+    repo.search.assert_awaited_once_with(
+        "python",
+        platform=None,
+        limit=5,
+        offset=0,
+    )
+
+
+# --- suggest ---
+@pytest.mark.asyncio
+async def test_suggest_caches_hot_prefixes(
+    service: JobPostingService,
+    repo,
+):
+    suggestion_cache.clear()
+    repo.suggest = AsyncMock(return_value=["Licorne Society"])
+
+    first = await service.suggest("company", "Lic", limit=5)
+    # Same prefix, other case: served from the cache
+    second = await service.suggest("company", "lic", limit=5)
+
+    assert first == second == ["Licorne Society"]
+    repo.suggest.assert_awaited_once_with("company", "Lic", limit=5)
+
+    await service.suggest("location", "lic", limit=5)
+    assert repo.suggest.await_count == 2
+    suggestion_cache.clear()
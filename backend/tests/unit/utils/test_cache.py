@@ -0,0 +1,47 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/tests/unit/utils/test_cache.py
+
+from app.utils.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_returns_cached_value_until_expiry():
+    clock = FakeClock()
+    cache = TTLCache(ttl=10, clock=clock)
+    cache.set("lic", ["Licorne"])
+
+    clock.now = 9.9
+    assert cache.get("lic") == ["Licorne"]
+
+    clock.now = 10
+    assert cache.get("lic") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    # Reading "a" makes "b" the least recently used
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_get_default_and_clear():
+    cache = TTLCache()
+    cache.set("a", 1)
+    cache.clear()
+
+    assert cache.get("a", 0) == 0
@@ -0,0 +1,56 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# File: backend/tests/unit/utils/test_files.py
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+import orjson
+import pytest
+
+from app.utils import files
+from app.utils.files import dump_json, write_atomic, write_files
+
+
+def test_dump_json_handles_dates_paths_and_unicode():
+    data = {"at": datetime(2025, 1, 2, tzinfo=UTC), "p": Path("/x"), "s": "€"}
+
+    dumped = dump_json(data)
+
+    assert orjson.loads(dumped) == {
+        "at": "2025-01-02T00:00:00+00:00",
+        "p": "/x",
+        "s": "€",
+    }
+    assert "€".encode() in dumped
+
+
+def test_write_atomic_replaces_file(tmp_path):
+    target = tmp_path / "out.json"
+    target.write_text("old")
+
+    write_atomic(target, "new")
+
+    assert target.read_text() == "new"
+    assert [p.name for p in tmp_path.iterdir()] == ["out.json"]
+
+
+def test_write_atomic_keeps_old_file_on_failure(tmp_path, monkeypatch):
+    target = tmp_path / "out.json"
+    target.write_text("old")
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(files.os, "replace", fail)
+
+    with pytest.raises(OSError):
+        write_atomic(target, b"new")
+
+    assert target.read_text() == "old"
+    assert [p.name for p in tmp_path.iterdir()] == ["out.json"]
+
+
+async def test_write_files(tmp_path):
+    await write_files({tmp_path / f"{i}.txt": str(i) for i in range(5)})
+
+    assert sorted(p.read_text() for p in tmp_path.iterdir()) == list("01234")